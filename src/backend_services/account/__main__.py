@@ -0,0 +1,20 @@
+'''
+Starts the gRPC account server, ran with python -m src.backend_services.account
+
+The password hashing processes are spawned, and a spawned process
+imports the __main__ module of its parent unless it is a package __main__.
+Starting the server from here means a hashing process only imports
+password_hashing rather than the whole service.
+'''
+
+import asyncio
+
+from src.backend_services.account.server import SERVER_MODE, serve, serve_async
+
+
+if __name__ == '__main__':
+    if SERVER_MODE == 'async':
+        asyncio.run(serve_async())
+
+    else:
+        serve()
@@ -0,0 +1,213 @@
+'''
+This file holds the asyncio authentication for a user on the gRPC account-service.
+It is used when the account-service is started with ACCOUNT_SERVER_MODE=async.
+
+Only the requests ported to the event loop are overridden here,
+the remaining requests are inherited from UserAuthentication_Service
+and are ran by the servers migration thread pool.
+'''
+
+import asyncio
+import grpc
+
+from datetime import datetime, timezone
+from sqlalchemy import select
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Self
+
+from src.backend_services.account.authentication.login import UserAuthentication_Service, AUTH_SCHEMA, LOGOUT_SCHEMA
+from src.backend_services.account.authentication.login_funcs import send_and_store_otp_code, \
+    unlock_account, iter_failed_attempt, refuse_login
+from src.backend_services.account.authentication.password_hashing import async_hash_password, \
+    async_verify_password, needs_rehash
+from src.backend_services.account.database.activity_buffer import async_record_activity
+from src.backend_services.account.database.database import get_async_db_conn
+from src.backend_services.account.database.models import User
+from src.backend_services.account.database.replica_routing import async_pin_to_primary
+
+from src.backend_services.common.proto import user_login_pb2
+from src.backend_services.common.proto.input_output_messages_pb2 import HTTP_Response
+from src.backend_services.common.redis.async_profile_cache import async_cache_profile, async_invalidate_profile
+from src.backend_services.common.redis.async_user_sessions import async_create_session, async_delete_session
+from src.backend_services.common.utils.utils import user_proto_format
+
+
+class AsyncUserAuthentication_Service(UserAuthentication_Service):
+    '''
+    This class holds the gRPC requests on the server side
+    in regards to user login and authentication that
+    await the database and redis instead of blocking a thread.
+    '''
+
+
+    async def UserLogin(cls: Self, request: user_login_pb2.UserLoginRequest, context: grpc.aio.ServicerContext) -> user_login_pb2.UserLoginResponse:
+        '''
+        This gRPC function recieves login details from the request.
+        The data recieved is validated and inserted into the database.
+        If any errors arise then relevant error messages are returned.
+
+        cls (Self): the AsyncUserAuthentication_Service class
+        request (UserLoginRequest): the specified proto defined request message for the rpc call
+
+        return (UserLoginResponse): the proto Message response including user data and request status
+        '''
+
+        print("UserLogin Request Made:")
+        print(request)
+
+        return_status = HTTP_Response(
+            success=True,
+            http_status=200,
+            message='Request Successful'
+        )
+
+        data = {
+            'email': request.email,
+            'password': request.password,
+        }
+
+        # The email domain is looked up without blocking the event loop
+        success, errors = await AUTH_SCHEMA.async_validate(data)
+
+        if not success:
+            return_status.success = False
+            return_status.http_status = 400
+            return_status.message = 'Invalid Data Recieved'
+            return_status.error.extend(errors)
+
+            return user_login_pb2.UserLoginResponse(status=return_status, otp_required=False)
+
+        async with get_async_db_conn() as session:
+            user_result = (await session.execute(select(User).filter(User.email == request.email))).scalars().first()
+
+            if refuse_login(None if user_result is None else user_result.user_status, return_status):
+                return user_login_pb2.UserLoginResponse(status=return_status, otp_required=False)
+
+            if not user_result.is_accessible():
+                return_status.success = False
+                return_status.http_status = 403
+
+                pass_through = False
+
+                if user_result.user_status == 'Locked':
+                    pass_through = await session.run_sync(unlock_account, user_result)
+
+                    if pass_through:
+                        await async_pin_to_primary(user_result.uuid)
+                        await async_invalidate_profile(user_result.uuid)
+
+                    else:
+                        return_status.message = 'This Account Is Temporarily Locked. Please Try Again Later'
+
+                if not pass_through:
+                    return user_login_pb2.UserLoginResponse(status=return_status, otp_required=False)
+
+            success, message, password_valid = await async_verify_password(user_result.password, request.password)
+
+            if not success:
+                return_status.success = False
+                return_status.http_status = 503
+                return_status.message = message
+
+                return user_login_pb2.UserLoginResponse(status=return_status, otp_required=False)
+
+            if not password_valid:
+                return_status.success = False
+                return_status.http_status = 403
+                return_status.message = 'Email Or Password Incorrect'
+
+                await session.run_sync(iter_failed_attempt, user_result)
+                await async_pin_to_primary(user_result.uuid)
+                await async_invalidate_profile(user_result.uuid)
+
+                return user_login_pb2.UserLoginResponse(status=return_status, otp_required=False)
+
+            # Outdated hashes are upgraded while the plain text password is known
+            if needs_rehash(user_result.password):
+                success, _, password_hash = await async_hash_password(request.password)
+
+                if success:
+                    user_result.password = password_hash
+                    await session.commit()
+
+            # The login is written by the activity flusher, the response and cached profile show it straight away
+            login_time = int(datetime.now(timezone.utc).timestamp())
+            await async_record_activity(user_result.uuid, login_time, login=True)
+            set_committed_value(user_result, 'last_login', login_time)
+
+            user = user_proto_format(user_result)
+            await async_cache_profile(user)
+
+            session_uuid, expiry = await async_create_session(user_result.uuid, user_result)
+
+            user_session = user_login_pb2.UserSession(
+                session_uuid=session_uuid,
+                expiry_time=expiry
+            )
+
+            otp_required = False
+
+            if not user_result.is_verified():
+                return_status.success = False
+                return_status.http_status = 403
+                return_status.message = 'Account Not Verified'
+
+                otp_required = True
+
+                # The email provider client is blocking
+                success, return_message = await asyncio.to_thread(send_and_store_otp_code, request.email, return_status)
+
+                if not success:
+                    return user_login_pb2.UserLoginResponse(status=return_message)
+
+            return user_login_pb2.UserLoginResponse(
+                status=return_status,
+                user=user,
+                session=user_session,
+                otp_required=otp_required
+            )
+
+
+    async def UserLogout(cls: Self, request: user_login_pb2.UserLogoutRequest, context: grpc.aio.ServicerContext) -> HTTP_Response:
+        '''
+        This gRPC function recieves the session details from the request.
+        The data recieved is validated and the session is removed from redis.
+        If any errors arise then relevant error messages are returned.
+
+        cls (Self): the AsyncUserAuthentication_Service class
+        request (UserLogoutRequest): the specified proto defined request message for the rpc call
+
+        return (HTTP_Response): the basic proto Message response indicating a successful or failed request
+        '''
+
+        print("UserLogout Request Made:")
+        print(request)
+
+        return_status = HTTP_Response(
+            success=True,
+            http_status=200,
+            message='Request Successful'
+        )
+
+        data = {
+            'session_uuid': request.session_uuid,
+            'user_uuid': request.user_uuid
+        }
+        success, errors = LOGOUT_SCHEMA.validate(data)
+
+        if not success:
+            return_status.success = False
+            return_status.http_status = 400
+            return_status.message = 'Invalid Data Recieved'
+            return_status.error.extend(errors)
+
+            return return_status
+
+        success, message = await async_delete_session(request.session_uuid, request.user_uuid)
+
+        if not success:
+            return_status.success = False
+            return_status.http_status = 500
+            return_status.message = message
+
+        return return_status
@@ -0,0 +1,92 @@
+'''
+This file holds the asyncio actions that account users
+can perform on the gRPC account-service.
+It is used when the account-service is started with ACCOUNT_SERVER_MODE=async.
+
+Only the requests ported to the event loop are overridden here,
+the remaining requests are inherited from UserAction_Service
+and are ran by the servers migration thread pool.
+'''
+
+import grpc
+
+from datetime import datetime, timezone
+from typing import Self
+
+from src.backend_services.account.authentication.settings import UserAction_Service, BASIC_SCHEMA
+from src.backend_services.account.database.activity_buffer import async_record_activity
+from src.backend_services.account.database.database import get_async_db_conn
+from src.backend_services.account.database.models import User
+from src.backend_services.account.database.queries import async_get_user_profile
+from src.backend_services.account.database.replica_routing import async_can_read_replica
+
+from src.backend_services.common.proto import user_actions_pb2
+from src.backend_services.common.proto.user_actions_pb2 import BasicAccountDetailsResponse
+from src.backend_services.common.proto.input_output_messages_pb2 import HTTP_Response
+from src.backend_services.common.redis.async_profile_cache import async_cache_profile, async_count_profile_miss, async_get_cached_profile
+from src.backend_services.common.utils.utils import user_proto_format
+
+
+class AsyncUserAction_Service(UserAction_Service):
+    '''
+    This class holds the gRPC requests on the server side
+    in regards to user actions and events that await
+    the database instead of blocking a thread.
+    '''
+
+
+    async def GetBasicAccountData(cls: Self, request: user_actions_pb2.GetBasicAccountDetailsRequest, context: grpc.aio.ServicerContext) -> BasicAccountDetailsResponse:
+        '''
+        This gRPC function recieves a user uuid from the request.
+        The data recieved is validated and data related to the user and return the users' data.
+        If any errors arise then relevant error messages are returned.
+
+        cls (Self): the AsyncUserAction_Service class
+        request (GetBasicAccountDetailsRequest): the specified proto defined request message for the rpc call
+
+        return (BasicAccountDetailsResponse): the proto Message response including user data and request status
+        '''
+
+        print("GetBasicAccountData Request Made:")
+        print(request)
+
+        return_status = HTTP_Response(
+            success=True,
+            http_status=200,
+            message='Request Successful'
+        )
+
+        data = { 'uuid': request.user_uuid }
+
+        success, errors = BASIC_SCHEMA.validate(data)
+
+        if not success:
+            return_status.success = False
+            return_status.http_status = 400
+            return_status.message = 'Invalid Data Recieved'
+            return_status.error.extend(errors)
+
+            return BasicAccountDetailsResponse(status=return_status)
+
+        user = await async_get_cached_profile(request.user_uuid)
+
+        if user is None:
+            async with get_async_db_conn(readonly=await async_can_read_replica(request.user_uuid)) as session:
+                user_result = await async_get_user_profile(session, User.uuid == request.user_uuid)
+
+                if user_result is None:
+                    await async_count_profile_miss()
+
+                    return_status.success = False
+                    return_status.http_status = 401
+                    return_status.message = 'Unable To Fetch Account Data'
+
+                    return BasicAccountDetailsResponse(status=return_status)
+
+                user = user_proto_format(user_result)
+
+            await async_cache_profile(user, miss=True)
+
+        await async_record_activity(request.user_uuid, int(datetime.now(timezone.utc).timestamp()))
+
+        return BasicAccountDetailsResponse(status=return_status, user=user)
@@ -4,23 +4,26 @@ This file holds the generic authentication for a user on the gRPC account-servic
 
 import grpc
 import os
-import uuid
 
 from datetime import datetime, timezone
+from sqlalchemy.orm.attributes import set_committed_value
 from typing import Self
-from werkzeug.security import check_password_hash, generate_password_hash
 
 from src.backend_services.account.authentication.login_funcs import check_email_session_data, \
-    send_and_store_otp_code, unlock_account, iter_failed_attempt
+    insert_new_user, send_and_store_otp_code, unlock_account, iter_failed_attempt, refuse_login
+from src.backend_services.account.authentication.password_hashing import hash_password, needs_rehash, verify_password
+from src.backend_services.account.database.activity_buffer import record_activity
 from src.backend_services.account.database.database import get_db_conn
 from src.backend_services.account.database.models import User
+from src.backend_services.account.database.replica_routing import pin_to_primary
 
 from src.backend_services.common.email.otp_functions import verify_otp_code
 from src.backend_services.common.proto import user_login_pb2, user_login_pb2_grpc
 from src.backend_services.common.proto.input_output_messages_pb2 import HTTP_Response
+from src.backend_services.common.redis.profile_cache import cache_profile, invalidate_profile
 from src.backend_services.common.redis.user_sessions import create_session, update_session, delete_session
-from src.backend_services.common.utils.data_verification import DataVerification
-from src.backend_services.common.utils.schema import load_yaml_file_as_dict, get_verification_schema
+from src.backend_services.common.utils.schema import load_yaml_file_as_dict
+from src.backend_services.common.utils.schema_compiler import compile_schema
 from src.backend_services.common.utils.utils import user_proto_format
 
 
@@ -29,27 +32,10 @@ AUTH_VERIFY_CONFIG = None
 OTP_VERIFY_CONFIG = None
 LOGOUT_VERIFY_CONFIG = None
 
-
-def reconfigure_adaptive_restrictions() -> None: # TEMPORARY
-    '''
-    Temporary function until future implementation of
-    more advanced datetime checking.
-
-    Changes the config file for authentication to use
-    up to date time limits.
-
-    return (None):
-    '''
-
-    global AUTH_VERIFY_CONFIG
-
-    today = datetime.today()
-
-    min_date = today.replace(year=today.year - 110).strftime("%Y-%m-%d")
-    max_date = today.replace(year=today.year - 9).strftime("%Y-%m-%d")
-
-    AUTH_VERIFY_CONFIG['date_of_birth']['restrictions']['date']['min'] = min_date
-    AUTH_VERIFY_CONFIG['date_of_birth']['restrictions']['date']['max'] = max_date
+# Compiled schemas
+AUTH_SCHEMA = None
+OTP_SCHEMA = None
+LOGOUT_SCHEMA = None
 
 
 def initialise_file() -> None:
@@ -71,6 +57,15 @@ def initialise_file() -> None:
     global LOGOUT_VERIFY_CONFIG
     LOGOUT_VERIFY_CONFIG = schemas['logout']
 
+    global AUTH_SCHEMA
+    AUTH_SCHEMA = compile_schema(AUTH_VERIFY_CONFIG)
+
+    global OTP_SCHEMA
+    OTP_SCHEMA = compile_schema(OTP_VERIFY_CONFIG)
+
+    global LOGOUT_SCHEMA
+    LOGOUT_SCHEMA = compile_schema(LOGOUT_VERIFY_CONFIG)
+
 
 initialise_file()
 
@@ -113,60 +108,45 @@ class UserAuthentication_Service(user_login_pb2_grpc.UserAuthService):
             'date_of_birth': request.date_of_birth,
         }
 
-        reconfigure_adaptive_restrictions() # TODO: remove when verification for said dates are restricted adaptively
-
-        success, message, schema = get_verification_schema(AUTH_VERIFY_CONFIG, data)
+        success, errors = AUTH_SCHEMA.validate(data)
 
         if not success:
             return_status.success = False
-            return_status.http_status = 500
-            return_status.message = message
+            return_status.http_status = 400
+            return_status.message = 'Invalid Data Recieved'
+            return_status.error.extend(errors)
 
             return user_login_pb2.UserRegistrationResponse(status=return_status)
 
-        success, errors = DataVerification().verify_data(schema)
+        # Hashed before the email is checked, so registering an email
+        # already in use takes as long as a successful registration
+        success, message, password_hash = hash_password(request.password)
 
         if not success:
             return_status.success = False
-            return_status.http_status = 400
-            return_status.message = 'Invalid Data Recieved'
-            return_status.error.extend(errors)
+            return_status.http_status = 503
+            return_status.message = message
 
             return user_login_pb2.UserRegistrationResponse(status=return_status)
 
         with get_db_conn() as session:
-            user_result = session.query(User).filter(User.email == request.email).first()
-
-            if user_result is not None:
-                return_status.success = False
-                return_status.http_status = 401
-                return_status.message = 'Email Already In Use'
-
-                return user_login_pb2.UserRegistrationResponse(status=return_status)
-            
-            new_uuid = str(uuid.uuid4())
-
-            while True:
-                uuid_result = session.query(User).filter(User.uuid == new_uuid).first()
-
-                if uuid_result is None:
-                    break
-
-                new_uuid = str(uuid.uuid4())
+            new_uuid = insert_new_user(session, {
+                'email': request.email,
+                'password': password_hash,
+                'first_name': request.first_name,
+                'last_name': request.last_name,
+                'gender': request.gender,
+                'date_of_birth': request.date_of_birth
+            })
+
+        if new_uuid is None:
+            return_status.success = False
+            return_status.http_status = 401
+            return_status.message = 'Email Already In Use'
 
-            register_user = User(
-                uuid = new_uuid,
-                email = request.email,
-                password = generate_password_hash(request.password),
-                first_name = request.first_name,
-                last_name = request.last_name,
-                gender = request.gender,
-                date_of_birth = request.date_of_birth
-            )
+            return user_login_pb2.UserRegistrationResponse(status=return_status)
 
-            session.add(register_user)
-            session.commit()
-            session.refresh(register_user)
+        pin_to_primary(new_uuid)
 
         success, return_message = send_and_store_otp_code(request.email, return_status)
 
@@ -201,16 +181,7 @@ class UserAuthentication_Service(user_login_pb2_grpc.UserAuthService):
             'email': request.email,
             'password': request.password,
         }
-        success, message, schema = get_verification_schema(AUTH_VERIFY_CONFIG, data)
-
-        if not success:
-            return_status.success = False
-            return_status.http_status = 500
-            return_status.message = message
-
-            return user_login_pb2.UserLoginResponse(status=return_status, otp_required=False)
-
-        success, errors = DataVerification().verify_data(schema)
+        success, errors = AUTH_SCHEMA.validate(data)
 
         if not success:
             return_status.success = False
@@ -223,11 +194,7 @@ class UserAuthentication_Service(user_login_pb2_grpc.UserAuthService):
         with get_db_conn() as session:
             user_result = session.query(User).filter(User.email == request.email).first()
 
-            if user_result is None:
-                return_status.success = False
-                return_status.http_status = 400
-                return_status.message = 'No Account Associated With Given Email'
-
+            if refuse_login(None if user_result is None else user_result.user_status, return_status):
                 return user_login_pb2.UserLoginResponse(status=return_status, otp_required=False)
 
             if not user_result.is_accessible():
@@ -236,33 +203,54 @@ class UserAuthentication_Service(user_login_pb2_grpc.UserAuthService):
 
                 pass_through = False
 
-                if user_result.user_status == 'Closed':
-                    return_status.message = 'This Account Has Been Closed'
-                    return_status.error.extend(['Account Data Will Be Wiped In The Near Future Following TOS'])
-
-                elif user_result.user_status == 'Terminated':
-                    return_status.message = 'This Account Has Been Disabled'
-
-                elif user_result.user_status == 'Locked':
+                if user_result.user_status == 'Locked':
                     pass_through = unlock_account(session, user_result)
 
-                    if not pass_through:
+                    if pass_through:
+                        pin_to_primary(user_result.uuid)
+                        invalidate_profile(user_result.uuid)
+
+                    else:
                         return_status.message = 'This Account Is Temporarily Locked. Please Try Again Later'
 
                 if not pass_through:
                     return user_login_pb2.UserLoginResponse(status=return_status, otp_required=False)
 
-            if user_result is None or not check_password_hash(user_result.password, request.password):
+            success, message, password_valid = verify_password(user_result.password, request.password)
+
+            if not success:
+                return_status.success = False
+                return_status.http_status = 503
+                return_status.message = message
+
+                return user_login_pb2.UserLoginResponse(status=return_status, otp_required=False)
+
+            if not password_valid:
                 return_status.success = False
                 return_status.http_status = 403
                 return_status.message = 'Email Or Password Incorrect'
 
                 iter_failed_attempt(session, user_result)
+                pin_to_primary(user_result.uuid)
+                invalidate_profile(user_result.uuid)
 
                 return user_login_pb2.UserLoginResponse(status=return_status, otp_required=False)
             
-            user_result.last_login = datetime.now(timezone.utc).timestamp()
-            session.commit()
+            # Outdated hashes are upgraded while the plain text password is known
+            if needs_rehash(user_result.password):
+                success, _, password_hash = hash_password(request.password)
+
+                if success:
+                    user_result.password = password_hash
+                    session.commit()
+
+            # The login is written by the activity flusher, the response and cached profile show it straight away
+            login_time = int(datetime.now(timezone.utc).timestamp())
+            record_activity(user_result.uuid, login_time, login=True)
+            set_committed_value(user_result, 'last_login', login_time)
+
+            user = user_proto_format(user_result)
+            cache_profile(user)
 
             session_uuid, expiry = create_session(user_result.uuid, user_result)
 
@@ -285,8 +273,6 @@ class UserAuthentication_Service(user_login_pb2_grpc.UserAuthService):
                 if not success:
                     return user_login_pb2.UserLoginResponse(status=return_message)
 
-            user = user_proto_format(user_result)
-
             return user_login_pb2.UserLoginResponse(
                 status=return_status,
                 user=user,
@@ -322,16 +308,7 @@ class UserAuthentication_Service(user_login_pb2_grpc.UserAuthService):
             'session_uuid': request.session_uuid,
             'return_action': request.return_action
         }
-        success, message, schema = get_verification_schema(OTP_VERIFY_CONFIG, data)
-
-        if not success:
-            return_status.success = False
-            return_status.http_status = 500
-            return_status.message = message
-
-            return user_login_pb2.UserLoginResponse(status=return_status, otp_required=False)
-
-        success, errors = DataVerification().verify_data(schema)
+        success, errors = OTP_SCHEMA.validate(data)
 
         if not success:
             return_status.success = False
@@ -387,6 +364,9 @@ class UserAuthentication_Service(user_login_pb2_grpc.UserAuthService):
             user = user_proto_format(user_result)
             user_session = None
 
+            pin_to_primary(user_result.uuid)
+            cache_profile(user)
+
             if request.return_action == 'LOGIN':
                 session_uuid, expiry = update_session(request.session_uuid, user_result.uuid, user_result)
 
@@ -432,16 +412,7 @@ class UserAuthentication_Service(user_login_pb2_grpc.UserAuthService):
             'session_uuid': request.session_uuid,
             'user_uuid': request.user_uuid
         }
-        success, message, schema = get_verification_schema(LOGOUT_VERIFY_CONFIG, data)
-
-        if not success:
-            return_status.success = False
-            return_status.http_status = 500
-            return_status.message = message
-
-            return return_status
-        
-        success, errors = DataVerification().verify_data(schema)
+        success, errors = LOGOUT_SCHEMA.validate(data)
 
         if not success:
             return_status.success = False
@@ -3,23 +3,33 @@ Contains all the supporting functions that are used to
 manage and control the users actions for authentication.
 '''
 
-import json
 import os
+import uuid
 
 from datetime import datetime, timezone
+from sqlalchemy import Select, Update, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import Tuple
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Tuple, Union
 
 from src.backend_services.account.database.models import User, UserLoginAttempts
 from src.backend_services.common.email.email_client import email_client
 from src.backend_services.common.proto import user_login_pb2
 from src.backend_services.common.proto.input_output_messages_pb2 import HTTP_Response
 from src.backend_services.common.redis.redis import get_redis_conn
+from src.backend_services.common.redis.user_sessions import read_session, session_index_key
 
 
 # environment variables
 ATTEMPTS_BEFORE_LOCK = int(os.environ.get('ACCOUNT_MAX_LOGIN_ATTEMPTS'))
 
+# How many generated uuids are tried before registration gives up
+REGISTRATION_UUID_ATTEMPTS = 3
+# The unique constraint postgres names for the user uuid column
+USER_UUID_CONSTRAINT = 'user_uuid_key'
+
 
 def send_and_store_otp_code(email: str, return_status: HTTP_Response, replace_message: bool=True):
     '''
@@ -95,33 +105,24 @@ def check_email_session_data(email: str, session_uuid: str, return_status: HTTP_
 
         return False, user_login_pb2.UserRegistrationResponse(status=return_status)
 
-    data = redis_client.scan_iter(match=f'sid:{session_uuid}:*:user_data', count=1, _type='string')
-
-    received_data = None
-    passed = False
-
-    if data is not None:
-        received_data = list(data)
-        passed = True
+    session_owner = redis_client.get(session_index_key(session_uuid))
 
-    if not passed or len(received_data) == 0:
+    if session_owner is None:
         return_status.success = False
         return_status.http_status = 400
         return_status.message = 'Session Either Expired Or Never Existed'
 
         return False, user_login_pb2.UserRegistrationResponse(status=return_status)
 
-    user_data = redis_client.get(received_data[0])
+    user_session_data, _ = read_session(redis_client, session_uuid, session_owner.decode('utf-8'))
 
-    if user_data is None:
+    if user_session_data is None:
         return_status.success = False
         return_status.http_status = 400
         return_status.message = 'Session Has No User Data'
 
         return False, user_login_pb2.UserRegistrationResponse(status=return_status)
 
-    user_session_data = json.loads(user_data)
-
     print(user_session_data)
 
     if user_session_data['email'] != email:
@@ -134,6 +135,42 @@ def check_email_session_data(email: str, session_uuid: str, return_status: HTTP_
     return True, None
 
 
+def refuse_login(user_status: Union[str, None], return_status: HTTP_Response) -> bool:
+    '''
+    Checks whether a login is refused by the account status alone.
+    Logins to missing, closed and disabled accounts are refused.
+
+    user_status ([str, None]): the status of the account, None when no account uses the email
+    return_status (HTTP_Response): the response to send back to the client
+
+    return (bool): refused flag, the return_status is updated when refused
+    '''
+
+    if user_status is None:
+        return_status.success = False
+        return_status.http_status = 400
+        return_status.message = 'No Account Associated With Given Email'
+
+        return True
+
+    if user_status == 'Closed':
+        return_status.success = False
+        return_status.http_status = 403
+        return_status.message = 'This Account Has Been Closed'
+        return_status.error.extend(['Account Data Will Be Wiped In The Near Future Following TOS'])
+
+        return True
+
+    if user_status == 'Terminated':
+        return_status.success = False
+        return_status.http_status = 403
+        return_status.message = 'This Account Has Been Disabled'
+
+        return True
+
+    return False
+
+
 def iter_failed_attempt(session: Session, user: User) -> None:
     '''
     Calculates how long the account should be locked
@@ -156,7 +193,7 @@ def iter_failed_attempt(session: Session, user: User) -> None:
         expires=current_time + (expires_at * 8)
     )
 
-    user.failed_login_attempts += 1
+    adjust_failed_attempts(session, user, 1)
 
     if failed_count > ATTEMPTS_BEFORE_LOCK:
         user.account_locked_until = current_time + expires_at
@@ -167,6 +204,111 @@ def iter_failed_attempt(session: Session, user: User) -> None:
     session.refresh(failed_login)
 
 
+def insert_new_user(session: Session, user_details: dict) -> Union[str, None]:
+    '''
+    Inserts a new user in a single statement, relying on the unique
+    email constraint rather than checking for the email beforehand.
+    An email already in use inserts nothing, even when registered at
+    the same time by another request. The generated uuid is only
+    replaced in the unlikely event it is already in use.
+
+    session (Session): the connection to the database
+    user_details (dict): the column values of the new user, excluding the uuid
+
+    return ([str, None]): the uuid of the new user, None when the email is already in use
+    '''
+
+    for attempt in range(REGISTRATION_UUID_ATTEMPTS):
+        new_uuid = str(uuid.uuid4())
+
+        statement = (
+            insert(User)
+            .values(uuid=new_uuid, **user_details)
+            .on_conflict_do_nothing(index_elements=[User.email])
+            .returning(User.id)
+        )
+
+        try:
+            user_id = session.execute(statement).scalar()
+            session.commit()
+
+        except IntegrityError as e:
+            session.rollback()
+
+            constraint = getattr(getattr(e.orig, 'diag', None), 'constraint_name', None)
+
+            if constraint != USER_UUID_CONSTRAINT or attempt + 1 == REGISTRATION_UUID_ATTEMPTS:
+                raise
+
+            continue
+
+        if user_id is None:
+            return None
+
+        return new_uuid
+
+
+def failed_attempts_update(user_id: int, change: int) -> Update:
+    '''
+    Builds the statement changing the failed login count of a user.
+    The count is changed within the database rather than from the loaded
+    user, so changes made at the same time by the sweeper are not lost.
+
+    user_id (int): the id of the user
+    change (int): the amount to add to the count, negative to reduce it
+
+    return (Update): the statement returning the new count
+    '''
+
+    return (
+        update(User)
+        .where(User.id == user_id)
+        .values(failed_login_attempts=User.failed_login_attempts + change)
+        .returning(User.failed_login_attempts)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def adjust_failed_attempts(session: Session, user: User, change: int) -> None:
+    '''
+    Changes the failed login count of a user, updating the loaded user to the new count.
+
+    session (Session): the connection to the database
+    user (User): single row of the specified users data
+    change (int): the amount to add to the count, negative to reduce it
+
+    return (None):
+    '''
+
+    failed_login_attempts = session.execute(failed_attempts_update(user.id, change)).scalar_one()
+    set_committed_value(user, 'failed_login_attempts', failed_login_attempts)
+
+
+def expired_attempts_statement(user_id: int, current_time: float) -> Select:
+    '''
+    Builds the statement removing the expired attempts of a user, selecting
+    the count of recorded attempts and the count of removed attempts.
+    The count of recorded attempts is taken before the removal is applied.
+
+    user_id (int): the id of the user
+    current_time (float): attempts expiring before this time are removed
+
+    return (Select): the statement selecting the recorded and removed counts
+    '''
+
+    expired_attempts = (
+        delete(UserLoginAttempts)
+        .where(UserLoginAttempts.user_id == user_id, UserLoginAttempts.expires < current_time)
+        .returning(UserLoginAttempts.id)
+        .cte('expired_attempts')
+    )
+
+    return select(
+        select(func.count()).select_from(UserLoginAttempts).where(UserLoginAttempts.user_id == user_id).scalar_subquery(),
+        select(func.count()).select_from(expired_attempts).scalar_subquery()
+    )
+
+
 def get_failed_attempts(session: Session, user: User) -> int:
     '''
     This function gets all the recorded attempts to access the account.
@@ -179,25 +321,17 @@ def get_failed_attempts(session: Session, user: User) -> int:
     return (int): total number of in-date failed attempts
     '''
 
-    recorded_attempts = session.query(UserLoginAttempts).filter(UserLoginAttempts.user_id == user.id).all()
-
-    total_attempts = len(recorded_attempts)
     current_time = datetime.now(timezone.utc).timestamp()
-    deleted = False
-
-    for attempt in recorded_attempts:
-        if attempt.expires < current_time:
-            session.delete(attempt)
 
-            total_attempts -= 1
-            user.failed_login_attempts -= 1
+    # Expired attempts are removed and both counts are fetched in a single statement
+    recorded_count, expired_count = session.execute(expired_attempts_statement(user.id, current_time)).one()
 
-            deleted = True
+    if expired_count > 0:
+        adjust_failed_attempts(session, user, -expired_count)
 
-    if deleted:
         session.commit()
 
-    return total_attempts
+    return recorded_count - expired_count
 
 
 def unlock_account(session: Session, user: User) -> bool:
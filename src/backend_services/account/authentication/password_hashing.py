@@ -0,0 +1,251 @@
+'''
+Contains the functions used to hash and check user passwords.
+
+Password hashing is deliberately CPU heavy, so it is ran on a
+dedicated process pool rather than the gRPC worker threads.
+A burst of logins therefore queues on the pool instead of starving
+every other request, and once too many hashes are waiting the
+request is turned away so the client can retry later.
+
+The pool processes are spawned, so each one imports this file to
+run the hashing functions along with the __main__ module of the server.
+The server is started from the account package __main__, which spawned
+processes do not import, so a pool process only imports this file and
+this file should only import what is needed to hash a password.
+'''
+
+import asyncio
+import multiprocessing
+import os
+import threading
+
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import cache
+from typing import Tuple, Union
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+# How many processes hash passwords, 0 hashes on the calling thread instead
+HASH_WORKERS = int(os.environ.get('ACCOUNT_HASH_WORKERS', os.cpu_count() or 1))
+# The maximum amount of hashes running or waiting on the pool at once
+HASH_MAX_QUEUE = int(os.environ.get('ACCOUNT_HASH_MAX_QUEUE', max(HASH_WORKERS, 1) * 4))
+# How long (seconds) a blocking caller waits for space in the queue before being turned away
+HASH_QUEUE_TIMEOUT = float(os.environ.get('ACCOUNT_HASH_QUEUE_TIMEOUT', 2))
+
+# Hash parameters, passwords hashed with different parameters are rehashed on login
+# e.g. scrypt:32768:8:1 or pbkdf2:sha256:1000000
+HASH_METHOD = os.environ.get('ACCOUNT_HASH_METHOD', 'scrypt:32768:8:1')
+HASH_SALT_LENGTH = int(os.environ.get('ACCOUNT_HASH_SALT_LENGTH', 16))
+
+BUSY_MESSAGE = 'Server Busy. Please Try Again Later'
+
+
+_pool = None
+_pool_lock = threading.Lock()
+_queue_slots = threading.BoundedSemaphore(HASH_MAX_QUEUE)
+
+
+def get_hash_pool() -> Union[ProcessPoolExecutor, None]:
+    '''
+    Fetches the process pool used for hashing, creating it on first use.
+    Processes are spawned rather than forked as forking a process
+    that is running gRPC is not supported.
+
+    return ([ProcessPoolExecutor, None]): the process pool or None if hashing on the calling thread
+    '''
+
+    global _pool
+
+    if HASH_WORKERS <= 0:
+        return None
+
+    if _pool is not None:
+        return _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(
+                max_workers=HASH_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+
+    return _pool
+
+
+def shutdown_hash_pool() -> None:
+    '''
+    Stops every process within the hashing pool.
+    The next hash will create a new pool.
+
+    return (None):
+    '''
+
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+
+        _pool = None
+
+
+def _hash(password: str) -> str:
+    '''
+    Hashes the password with the configured parameters.
+
+    password (str): the plain text password
+
+    return (str): the hashed password
+    '''
+
+    return generate_password_hash(password, method=HASH_METHOD, salt_length=HASH_SALT_LENGTH)
+
+
+def _submit(func, *args) -> Future:
+    '''
+    Runs the function on the hashing pool, or on the calling thread
+    when no pool is used. The queue slot taken by the caller is
+    released once the function has finished.
+
+    func (Callable): the hashing function to run
+    args (Any): the arguments given to the function
+
+    return (Future): the future holding the result of the function
+    '''
+
+    pool = get_hash_pool()
+
+    if pool is None:
+        future = Future()
+
+        try:
+            future.set_result(func(*args))
+
+        except Exception as e:
+            future.set_exception(e)
+
+    else:
+        try:
+            future = pool.submit(func, *args)
+
+        except Exception:
+            _queue_slots.release()
+            raise
+
+    future.add_done_callback(lambda _: _queue_slots.release())
+
+    return future
+
+
+async def _async_submit(func, *args):
+    '''
+    Awaits the function on the hashing pool, or on a thread
+    when no pool is used so the event loop is never blocked.
+    The queue slot taken by the caller is released once the function has finished.
+
+    func (Callable): the hashing function to run
+    args (Any): the arguments given to the function
+
+    return (Any): the result of the function
+    '''
+
+    if get_hash_pool() is not None:
+        return await asyncio.wrap_future(_submit(func, *args))
+
+    try:
+        return await asyncio.to_thread(func, *args)
+
+    finally:
+        _queue_slots.release()
+
+
+def hash_password(password: str) -> Tuple[bool, str, Union[str, None]]:
+    '''
+    Hashes the password on the hashing pool.
+
+    password (str): the plain text password
+
+    return (bool, str, [str, None]): success flag, message and the hashed password
+    '''
+
+    if not _queue_slots.acquire(timeout=HASH_QUEUE_TIMEOUT):
+        return False, BUSY_MESSAGE, None
+
+    return True, '', _submit(_hash, password).result()
+
+
+def verify_password(password_hash: str, password: str) -> Tuple[bool, str, bool]:
+    '''
+    Checks the password against the stored hash on the hashing pool.
+
+    password_hash (str): the stored hashed password
+    password (str): the plain text password
+
+    return (bool, str, bool): success flag, message and whether the password matches
+    '''
+
+    if not _queue_slots.acquire(timeout=HASH_QUEUE_TIMEOUT):
+        return False, BUSY_MESSAGE, False
+
+    return True, '', _submit(check_password_hash, password_hash, password).result()
+
+
+async def async_hash_password(password: str) -> Tuple[bool, str, Union[str, None]]:
+    '''
+    Hashes the password on the hashing pool without blocking the event loop.
+    The request is turned away straight away when the queue is full.
+
+    password (str): the plain text password
+
+    return (bool, str, [str, None]): success flag, message and the hashed password
+    '''
+
+    if not _queue_slots.acquire(blocking=False):
+        return False, BUSY_MESSAGE, None
+
+    return True, '', await _async_submit(_hash, password)
+
+
+async def async_verify_password(password_hash: str, password: str) -> Tuple[bool, str, bool]:
+    '''
+    Checks the password against the stored hash on the
+    hashing pool without blocking the event loop.
+    The request is turned away straight away when the queue is full.
+
+    password_hash (str): the stored hashed password
+    password (str): the plain text password
+
+    return (bool, str, bool): success flag, message and whether the password matches
+    '''
+
+    if not _queue_slots.acquire(blocking=False):
+        return False, BUSY_MESSAGE, False
+
+    return True, '', await _async_submit(check_password_hash, password_hash, password)
+
+
+@cache
+def get_hash_parameters() -> str:
+    '''
+    Fetches the parameters written at the start of a hash made with
+    the configured method (e.g. scrypt becomes scrypt:32768:8:1).
+
+    return (str): the hash parameters
+    '''
+
+    return _hash('').split('$', 1)[0]
+
+
+def needs_rehash(password_hash: str) -> bool:
+    '''
+    Checks whether the stored hash was made with outdated parameters.
+
+    password_hash (str): the stored hashed password
+
+    return (bool): rehash required flag
+    '''
+
+    parameters, _, remaining = password_hash.partition('$')
+    salt = remaining.partition('$')[0]
+
+    return parameters != get_hash_parameters() or len(salt) != HASH_SALT_LENGTH
@@ -9,18 +9,22 @@ import grpc
 
 from datetime import datetime, timezone, UTC
 from typing import Self
-from werkzeug.security import check_password_hash, generate_password_hash
 
 from src.backend_services.account.authentication.login_funcs import send_and_store_otp_code
+from src.backend_services.account.authentication.password_hashing import hash_password, verify_password
+from src.backend_services.account.database.activity_buffer import record_activity
 from src.backend_services.account.database.database import get_db_conn
 from src.backend_services.account.database.models import User
+from src.backend_services.account.database.queries import get_user_profile
+from src.backend_services.account.database.replica_routing import can_read_replica, pin_to_primary
 
 from src.backend_services.common.proto import user_actions_pb2, user_actions_pb2_grpc
 from src.backend_services.common.proto.user_actions_pb2 import BasicAccountDetailsResponse
 from src.backend_services.common.proto.input_output_messages_pb2 import HTTP_Response, OTP_Response
 from src.backend_services.common.redis.fetch_session_data import update_user_email_session
-from src.backend_services.common.utils.data_verification import DataVerification
-from src.backend_services.common.utils.schema import load_yaml_file_as_dict, get_verification_schema
+from src.backend_services.common.redis.profile_cache import cache_profile, count_profile_miss, get_cached_profile, invalidate_profile
+from src.backend_services.common.utils.schema import load_yaml_file_as_dict
+from src.backend_services.common.utils.schema_compiler import compile_schema
 from src.backend_services.common.utils.utils import user_proto_format
 
 
@@ -31,27 +35,12 @@ UPDATE_PASSWORD_VERIFY_CONFIG = None
 UPDATE_DATA_VERIFY_CONFIG = None
 DELETION_VERIFY_CONFIG = None
 
-
-def reconfigure_adaptive_restrictions() -> None: # TEMPORARY
-    '''
-    Temporary function until future implementation of
-    more advanced datetime checking.
-
-    Changes the config file for authentication to use
-    up to date time limits.
-
-    return (None):
-    '''
-
-    global UPDATE_DATA_VERIFY_CONFIG
-
-    today = datetime.today()
-
-    min_date = today.replace(year=today.year - 110).strftime("%Y-%m-%d")
-    max_date = today.replace(year=today.year - 9).strftime("%Y-%m-%d")
-
-    UPDATE_DATA_VERIFY_CONFIG['date_of_birth']['restrictions']['date']['min'] = min_date
-    UPDATE_DATA_VERIFY_CONFIG['date_of_birth']['restrictions']['date']['max'] = max_date
+# Compiled schemas
+BASIC_SCHEMA = None
+UPDATE_EMAIL_SCHEMA = None
+UPDATE_PASSWORD_SCHEMA = None
+UPDATE_DATA_SCHEMA = None
+DELETION_SCHEMA = None
 
 
 def initialise_file() -> None:
@@ -79,6 +68,21 @@ def initialise_file() -> None:
     global DELETION_VERIFY_CONFIG
     DELETION_VERIFY_CONFIG = schemas['delete_account']
 
+    global BASIC_SCHEMA
+    BASIC_SCHEMA = compile_schema(BASIC_VERIFY_CONFIG)
+
+    global UPDATE_EMAIL_SCHEMA
+    UPDATE_EMAIL_SCHEMA = compile_schema(UPDATE_EMAIL_VERIFY_CONFIG)
+
+    global UPDATE_PASSWORD_SCHEMA
+    UPDATE_PASSWORD_SCHEMA = compile_schema(UPDATE_PASSWORD_VERIFY_CONFIG)
+
+    global UPDATE_DATA_SCHEMA
+    UPDATE_DATA_SCHEMA = compile_schema(UPDATE_DATA_VERIFY_CONFIG)
+
+    global DELETION_SCHEMA
+    DELETION_SCHEMA = compile_schema(DELETION_VERIFY_CONFIG)
+
 
 initialise_file()
 
@@ -113,16 +117,7 @@ class UserAction_Service(user_actions_pb2_grpc.UserSettingsService):
 
         data = { 'uuid': request.user_uuid }
 
-        success, message, schema = get_verification_schema(BASIC_VERIFY_CONFIG, data)
-
-        if not success:
-            return_status.success = False
-            return_status.http_status = 500
-            return_status.message = message
-
-            return BasicAccountDetailsResponse(status=return_status)
-
-        success, errors = DataVerification().verify_data(schema)
+        success, errors = BASIC_SCHEMA.validate(data)
 
         if not success:
             return_status.success = False
@@ -132,19 +127,28 @@ class UserAction_Service(user_actions_pb2_grpc.UserSettingsService):
 
             return BasicAccountDetailsResponse(status=return_status)
 
-        with get_db_conn() as session:
-            user_result = session.query(User).filter(User.uuid == request.user_uuid).first()
+        user = get_cached_profile(request.user_uuid)
 
-            if user_result is None:
-                return_status.success = False
-                return_status.http_status = 401
-                return_status.message = 'Unable To Fetch Account Data'
+        if user is None:
+            with get_db_conn(readonly=can_read_replica(request.user_uuid)) as session:
+                user_result = get_user_profile(session, User.uuid == request.user_uuid)
 
-                return BasicAccountDetailsResponse(status=return_status)
+                if user_result is None:
+                    count_profile_miss()
 
-            user = user_proto_format(user_result)
+                    return_status.success = False
+                    return_status.http_status = 401
+                    return_status.message = 'Unable To Fetch Account Data'
 
-            return BasicAccountDetailsResponse(status=return_status, user=user)
+                    return BasicAccountDetailsResponse(status=return_status)
+
+                user = user_proto_format(user_result)
+
+            cache_profile(user, miss=True)
+
+        record_activity(request.user_uuid, int(datetime.now(timezone.utc).timestamp()))
+
+        return BasicAccountDetailsResponse(status=return_status, user=user)
 
 
     def UpdateUserEmail(cls: Self, request: user_actions_pb2.UpdateUserEmailRequest, context: grpc.ServicerContext) -> OTP_Response:
@@ -175,16 +179,7 @@ class UserAction_Service(user_actions_pb2_grpc.UserSettingsService):
             'new_email': request.new_email
         }
 
-        success, message, schema = get_verification_schema(UPDATE_EMAIL_VERIFY_CONFIG, data)
-
-        if not success:
-            return_status.success = False
-            return_status.http_status = 500
-            return_status.message = message
-
-            return OTP_Response(status=return_status, otp_required=False)
-
-        success, errors = DataVerification().verify_data(schema)
+        success, errors = UPDATE_EMAIL_SCHEMA.validate(data)
 
         if not success:
             return_status.success = False
@@ -226,7 +221,10 @@ class UserAction_Service(user_actions_pb2_grpc.UserSettingsService):
 
             session.commit()
 
-            return OTP_Response(status=return_status, otp_required=True)
+        pin_to_primary(request.user_uuid)
+        invalidate_profile(request.user_uuid)
+
+        return OTP_Response(status=return_status, otp_required=True)
 
 
     def UpdateUserPassword(cls: Self, request: user_actions_pb2.UpdateUserPasswordRequest, context: grpc.ServicerContext) -> HTTP_Response:
@@ -257,16 +255,7 @@ class UserAction_Service(user_actions_pb2_grpc.UserSettingsService):
             'new_password': request.new_password
         }
 
-        success, message, schema = get_verification_schema(UPDATE_EMAIL_VERIFY_CONFIG, data)
-
-        if not success:
-            return_status.success = False
-            return_status.http_status = 500
-            return_status.message = message
-
-            return return_status
-
-        success, errors = DataVerification().verify_data(schema)
+        success, errors = UPDATE_EMAIL_SCHEMA.validate(data)
 
         if not success:
             return_status.success = False
@@ -286,7 +275,16 @@ class UserAction_Service(user_actions_pb2_grpc.UserSettingsService):
 
                 return return_status
 
-            if not check_password_hash(user_result.password, request.current_password):
+            success, message, password_valid = verify_password(user_result.password, request.current_password)
+
+            if not success:
+                return_status.success = False
+                return_status.http_status = 503
+                return_status.message = message
+
+                return return_status
+
+            if not password_valid:
                 return_status.success = False
                 return_status.http_status = 401
                 return_status.message = 'Incorrect Password Provided'
@@ -300,12 +298,24 @@ class UserAction_Service(user_actions_pb2_grpc.UserSettingsService):
 
                 return return_status
 
-            user_result.password = generate_password_hash(request.new_password)
+            success, message, password_hash = hash_password(request.new_password)
+
+            if not success:
+                return_status.success = False
+                return_status.http_status = 503
+                return_status.message = message
+
+                return return_status
+
+            user_result.password = password_hash
             user_result.last_activity_at = datetime.now(timezone.utc).timestamp()
 
             session.commit()
 
-            return return_status
+        pin_to_primary(request.user_uuid)
+        invalidate_profile(request.user_uuid)
+
+        return return_status
 
 
     def UpdateUserDetails(cls: Self, request: user_actions_pb2.UpdateUserDetailsRequest, context: grpc.ServicerContext) -> BasicAccountDetailsResponse:
@@ -337,18 +347,7 @@ class UserAction_Service(user_actions_pb2_grpc.UserSettingsService):
             'date_of_birth': request.date_of_birth
         }
 
-        reconfigure_adaptive_restrictions() # TODO: remove when verification for said dates are restricted adaptively
-
-        success, message, schema = get_verification_schema(UPDATE_EMAIL_VERIFY_CONFIG, data)
-
-        if not success:
-            return_status.success = False
-            return_status.http_status = 500
-            return_status.message = message
-
-            return return_status
-
-        success, errors = DataVerification().verify_data(schema)
+        success, errors = UPDATE_DATA_SCHEMA.validate(data)
 
         if not success:
             return_status.success = False
@@ -386,7 +385,10 @@ class UserAction_Service(user_actions_pb2_grpc.UserSettingsService):
             session.commit()
             user = user_proto_format(user_result)
 
-            return BasicAccountDetailsResponse(status=return_status, user=user)
+        pin_to_primary(request.user_uuid)
+        cache_profile(user)
+
+        return BasicAccountDetailsResponse(status=return_status, user=user)
 
 
     def DeleteAccount(cls: Self, request: user_actions_pb2.DeleteAccountRequest, context: grpc.ServicerContext) -> HTTP_Response:
@@ -412,16 +414,7 @@ class UserAction_Service(user_actions_pb2_grpc.UserSettingsService):
 
         data = { 'uuid': request.user_uuid }
 
-        success, message, schema = get_verification_schema(DELETION_VERIFY_CONFIG, data)
-
-        if not success:
-            return_status.success = False
-            return_status.http_status = 500
-            return_status.message = message
-
-            return return_status
-
-        success, errors = DataVerification().verify_data(schema)
+        success, errors = DELETION_SCHEMA.validate(data)
 
         if not success:
             return_status.success = False
@@ -454,4 +447,7 @@ class UserAction_Service(user_actions_pb2_grpc.UserSettingsService):
 
             session.commit()
 
-            return return_status
+        pin_to_primary(request.user_uuid)
+        invalidate_profile(request.user_uuid)
+
+        return return_status
\ No newline at end of file
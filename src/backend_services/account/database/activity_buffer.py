@@ -0,0 +1,284 @@
+'''
+Buffers the activity timestamps of users and writes them to the database in bulk.
+
+Writing last_login and last_activity_at on every request would turn
+reads into writes. Instead each timestamp is recorded in a redis sorted
+set per column, keyed by the users uuid, where repeated activity of a
+user only keeps their latest timestamp. A background flusher pops the
+buffered timestamps in batches and writes each batch with a single
+UPDATE ... FROM (VALUES ...) statement, so the database sees one write
+per user per flush no matter how active they were.
+
+Timestamps only move forward, the database keeps the greater of the
+stored and buffered timestamp. A batch that fails to be written is put
+back into the buffer, a flusher stopped between popping and writing
+a batch loses at most that batch.
+
+A flush only writes as many batches as each column held when it started,
+so steady activity can not keep it on one column forever, activity
+recorded during a flush is written by the next one.
+'''
+
+import math
+import os
+import threading
+
+from redis.exceptions import RedisError
+from sqlalchemy import Integer, String, column, func, update, values
+from typing import Dict, Union
+
+from src.backend_services.account.database.database import get_db_conn
+from src.backend_services.account.database.models import User
+from src.backend_services.common.redis.async_redis import get_async_redis_conn
+from src.backend_services.common.redis.redis import get_redis_conn
+
+
+# How often (seconds) buffered timestamps are written, 0 disables the flusher on this instance
+ACTIVITY_FLUSH_INTERVAL = float(os.environ.get('ACCOUNT_ACTIVITY_FLUSH_INTERVAL', 30))
+# The maximum amount of users updated per statement
+ACTIVITY_FLUSH_BATCH = int(os.environ.get('ACCOUNT_ACTIVITY_FLUSH_BATCH', 1000))
+
+# The buffered columns of the user table and their sorted sets
+ACTIVITY_KEYS = {
+    'last_login': 'activity:last_login',
+    'last_activity_at': 'activity:last_activity_at'
+}
+
+
+_stop_event = threading.Event()
+_thread = None
+
+
+def activity_timestamps(login: bool, timestamp: int) -> Dict[str, int]:
+    '''
+    Gets the timestamps to record for a request.
+
+    login (bool): whether the request logged the user in
+    timestamp (int): the time of the request
+
+    return (Dict[str, int]): the buffered column names and their timestamp
+    '''
+
+    if login:
+        return { 'last_login': timestamp, 'last_activity_at': timestamp }
+
+    return { 'last_activity_at': timestamp }
+
+
+def record_activity(user_uuid: str, timestamp: int, login: bool=False) -> bool:
+    '''
+    Buffers the activity of a user, to be written by the flusher.
+
+    user_uuid (str): the users uuid
+    timestamp (int): the time of the activity
+    login (bool): whether the activity is a login, also recording last_login [default - False]
+
+    return (bool): whether the activity was recorded
+    '''
+
+    success, _, redis_client = get_redis_conn()
+
+    if not success:
+        return False
+
+    try:
+        with redis_client.pipeline(transaction=False) as pipe:
+            for column_name, column_timestamp in activity_timestamps(login, timestamp).items():
+                pipe.zadd(ACTIVITY_KEYS[column_name], { user_uuid: column_timestamp }, gt=True)
+
+            pipe.execute()
+
+    except RedisError:
+        return False
+
+    return True
+
+
+async def async_record_activity(user_uuid: str, timestamp: int, login: bool=False) -> bool:
+    '''
+    The asyncio counterpart of record_activity.
+
+    user_uuid (str): the users uuid
+    timestamp (int): the time of the activity
+    login (bool): whether the activity is a login, also recording last_login [default - False]
+
+    return (bool): whether the activity was recorded
+    '''
+
+    success, _, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return False
+
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            for column_name, column_timestamp in activity_timestamps(login, timestamp).items():
+                pipe.zadd(ACTIVITY_KEYS[column_name], { user_uuid: column_timestamp }, gt=True)
+
+            await pipe.execute()
+
+    except RedisError:
+        return False
+
+    return True
+
+
+def write_activity_batch(column_name: str, timestamps: Dict[str, int]) -> int:
+    '''
+    Writes the timestamps of a single column for a batch of users in one statement.
+
+    column_name (str): the buffered column of the user table
+    timestamps (Dict[str, int]): the users uuid and their latest timestamp
+
+    return (int): the amount of users updated
+    '''
+
+    activity = values(
+        column('uuid', String),
+        column('timestamp', Integer),
+        name='activity'
+    ).data(list(timestamps.items()))
+
+    user_column = getattr(User, column_name)
+
+    with get_db_conn() as session:
+        result = session.execute(
+            update(User)
+            .where(User.uuid == activity.c.uuid)
+            .values({ column_name: func.greatest(func.coalesce(user_column, 0), activity.c.timestamp) })
+        )
+
+        session.commit()
+
+    return result.rowcount
+
+
+def flush_activity_batch(column_name: str, batch_size: int=ACTIVITY_FLUSH_BATCH) -> int:
+    '''
+    Pops a batch of buffered timestamps of a column and writes them to the database.
+    The oldest timestamps are popped first, a batch that fails to
+    be written is put back without replacing newer timestamps.
+
+    column_name (str): the buffered column of the user table
+    batch_size (int): the maximum amount of users to update [default - ACTIVITY_FLUSH_BATCH]
+
+    return (int): the amount of timestamps popped from the buffer
+    '''
+
+    success, message, redis_client = get_redis_conn()
+
+    if not success:
+        raise ConnectionError(message)
+
+    key = ACTIVITY_KEYS[column_name]
+    popped = redis_client.zpopmin(key, batch_size)
+
+    if len(popped) == 0:
+        return 0
+
+    timestamps = { member.decode('utf-8'): int(score) for member, score in popped }
+
+    try:
+        write_activity_batch(column_name, timestamps)
+
+    except Exception:
+        redis_client.zadd(key, timestamps, gt=True)
+        raise
+
+    return len(popped)
+
+
+def flush_activity(batch_size: int=ACTIVITY_FLUSH_BATCH) -> int:
+    '''
+    Writes the timestamps buffered when the flush started, one batch at a time.
+    Each column is written in at most one pass of its buffer size at the start.
+
+    batch_size (int): the maximum amount of users to update per statement [default - ACTIVITY_FLUSH_BATCH]
+
+    return (int): the total amount of timestamps written
+    '''
+
+    success, message, redis_client = get_redis_conn()
+
+    if not success:
+        raise ConnectionError(message)
+
+    total_flushed = 0
+
+    for column_name, key in ACTIVITY_KEYS.items():
+        batches = math.ceil(redis_client.zcard(key) / batch_size)
+
+        for _ in range(batches):
+            flushed = flush_activity_batch(column_name, batch_size)
+            total_flushed += flushed
+
+            if flushed < batch_size:
+                break
+
+    return total_flushed
+
+
+def run_activity_flusher(interval: float, batch_size: int) -> None:
+    '''
+    Flushes the buffered timestamps on an interval until the flusher is stopped.
+    A failed flush is retried on the next interval.
+
+    interval (float): how often (seconds) buffered timestamps are written
+    batch_size (int): the maximum amount of users to update per statement
+
+    return (None):
+    '''
+
+    while not _stop_event.wait(interval):
+        try:
+            flush_activity(batch_size)
+
+        except Exception as e:
+            print(f'WARNING: User Activity Flush Failed: {e}')
+
+
+def start_activity_flusher(interval: float=ACTIVITY_FLUSH_INTERVAL, batch_size: int=ACTIVITY_FLUSH_BATCH) -> Union[threading.Thread, None]:
+    '''
+    Starts the flusher on a background thread.
+
+    interval (float): how often (seconds) buffered timestamps are written [default - ACTIVITY_FLUSH_INTERVAL]
+    batch_size (int): the maximum amount of users to update per statement [default - ACTIVITY_FLUSH_BATCH]
+
+    return ([Thread, None]): the started thread, None when the flusher is disabled
+    '''
+
+    global _thread
+
+    if interval <= 0:
+        return None
+
+    _stop_event.clear()
+
+    _thread = threading.Thread(target=run_activity_flusher, args=(interval, batch_size), name='activity-flusher', daemon=True)
+    _thread.start()
+
+    return _thread
+
+
+def stop_activity_flusher() -> None:
+    '''
+    Stops the flusher, then writes the timestamps buffered since its last flush.
+
+    return (None):
+    '''
+
+    global _thread
+
+    _stop_event.set()
+
+    if _thread is None:
+        return
+
+    _thread.join()
+    _thread = None
+
+    try:
+        flush_activity()
+
+    except Exception as e:
+        print(f'WARNING: User Activity Flush Failed: {e}')
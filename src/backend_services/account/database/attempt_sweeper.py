@@ -0,0 +1,180 @@
+'''
+Periodically removes expired failed login attempts across every user.
+
+Logins only remove the expired attempts of the user logging in, so
+attempts of users that never return would otherwise stay forever.
+The sweeper removes them in small batches, each its own transaction,
+so the table is never locked for long and rows already locked by a
+login are skipped until the next sweep.
+'''
+
+import os
+import threading
+
+from datetime import datetime, timezone
+from sqlalchemy import Select, delete, func, select, update
+from typing import Union
+
+from src.backend_services.account.database.database import get_db_conn
+from src.backend_services.account.database.models import User, UserLoginAttempts
+
+
+# How often (seconds) expired attempts are removed, 0 disables the sweeper
+ATTEMPT_SWEEP_INTERVAL = float(os.environ.get('ACCOUNT_ATTEMPT_SWEEP_INTERVAL', 300))
+# The maximum amount of attempts removed per transaction
+ATTEMPT_SWEEP_BATCH = int(os.environ.get('ACCOUNT_ATTEMPT_SWEEP_BATCH', 1000))
+
+
+_stop_event = threading.Event()
+_thread = None
+
+
+def sweep_statement(batch_size: int, current_time: float) -> Select:
+    '''
+    Builds the statement removing a batch of expired attempts and
+    reducing the failed login count of each user by their removed attempts.
+    The removed attempts are counted from the deleted rows, so attempts
+    without a user are counted too.
+
+    batch_size (int): the maximum amount of attempts to remove
+    current_time (float): attempts expiring before this time are removed
+
+    return (Select): the statement returning the amount of attempts removed
+    '''
+
+    expired_ids = (
+        select(UserLoginAttempts.id)
+        .where(UserLoginAttempts.expires < current_time)
+        .order_by(UserLoginAttempts.id)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+
+    expired_attempts = (
+        delete(UserLoginAttempts)
+        .where(UserLoginAttempts.id.in_(expired_ids))
+        .returning(UserLoginAttempts.user_id)
+        .cte('expired_attempts')
+    )
+
+    removed_attempts = (
+        select(expired_attempts.c.user_id, func.count().label('removed'))
+        .group_by(expired_attempts.c.user_id)
+        .cte('removed_attempts')
+    )
+
+    updated_users = (
+        update(User)
+        .where(User.id == removed_attempts.c.user_id)
+        .values(failed_login_attempts=User.failed_login_attempts - removed_attempts.c.removed)
+        .cte('updated_users')
+    )
+
+    return (
+        select(func.count())
+        .select_from(expired_attempts)
+        .add_cte(updated_users)
+    )
+
+
+def sweep_expired_attempts_batch(batch_size: int=ATTEMPT_SWEEP_BATCH) -> int:
+    '''
+    Removes a single batch of expired attempts, reducing the
+    failed login count of each user by their removed attempts.
+
+    batch_size (int): the maximum amount of attempts to remove [default - ATTEMPT_SWEEP_BATCH]
+
+    return (int): the amount of attempts removed
+    '''
+
+    current_time = datetime.now(timezone.utc).timestamp()
+
+    with get_db_conn() as session:
+        removed = session.execute(sweep_statement(batch_size, current_time)).scalar_one()
+
+        session.commit()
+
+    return removed
+
+
+def sweep_expired_attempts(batch_size: int=ATTEMPT_SWEEP_BATCH) -> int:
+    '''
+    Removes every expired attempt, one batch at a time.
+
+    batch_size (int): the maximum amount of attempts to remove per batch [default - ATTEMPT_SWEEP_BATCH]
+
+    return (int): the total amount of attempts removed
+    '''
+
+    total_removed = 0
+
+    while not _stop_event.is_set():
+        removed = sweep_expired_attempts_batch(batch_size)
+        total_removed += removed
+
+        if removed < batch_size:
+            break
+
+    return total_removed
+
+
+def run_attempt_sweeper(interval: float, batch_size: int) -> None:
+    '''
+    Sweeps the expired attempts on an interval until the sweeper is stopped.
+    A failed sweep is retried on the next interval.
+
+    interval (float): how often (seconds) expired attempts are removed
+    batch_size (int): the maximum amount of attempts to remove per batch
+
+    return (None):
+    '''
+
+    while not _stop_event.wait(interval):
+        try:
+            removed = sweep_expired_attempts(batch_size)
+
+            if removed > 0:
+                print(f'Expired Login Attempts Removed: {removed}')
+
+        except Exception as e:
+            print(f'WARNING: Expired Login Attempt Sweep Failed: {e}')
+
+
+def start_attempt_sweeper(interval: float=ATTEMPT_SWEEP_INTERVAL, batch_size: int=ATTEMPT_SWEEP_BATCH) -> Union[threading.Thread, None]:
+    '''
+    Starts the sweeper on a background thread.
+
+    interval (float): how often (seconds) expired attempts are removed [default - ATTEMPT_SWEEP_INTERVAL]
+    batch_size (int): the maximum amount of attempts to remove per batch [default - ATTEMPT_SWEEP_BATCH]
+
+    return ([Thread, None]): the started thread, None when the sweeper is disabled
+    '''
+
+    global _thread
+
+    if interval <= 0:
+        return None
+
+    _stop_event.clear()
+
+    _thread = threading.Thread(target=run_attempt_sweeper, args=(interval, batch_size), name='attempt-sweeper', daemon=True)
+    _thread.start()
+
+    return _thread
+
+
+def stop_attempt_sweeper() -> None:
+    '''
+    Stops the sweeper, waiting for the batch in progress to complete.
+
+    return (None):
+    '''
+
+    global _thread
+
+    _stop_event.set()
+
+    if _thread is not None:
+        _thread.join()
+
+    _thread = None
@@ -5,9 +5,10 @@ and get a connection to the database.
 
 import os
 
-from collections.abc import Generator
-from contextlib import contextmanager
+from collections.abc import AsyncGenerator, Generator
+from contextlib import asynccontextmanager, contextmanager
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
@@ -27,34 +28,77 @@ GENERAL_DATABASE_URL = f'postgresql+psycopg2://{DATABASE_USERNAME}:{DATABASE_PAS
 DATABASE_URL = GENERAL_DATABASE_URL + f'/{DATABASE_NAME}'
 POSTGRES_DATABASE_URL = GENERAL_DATABASE_URL + '/postgres'
 
+# Used by the asyncio server mode, psycopg (3) supports both blocking and asyncio connections
+ASYNC_DATABASE_URL = f'postgresql+psycopg://{DATABASE_USERNAME}:{DATABASE_PASSWORD}@{DATABASE_HOST}:{DATABASE_PORT}/{DATABASE_NAME}'
+
+# Optional read replica, read only requests use the primary database when not set
+# The urls can be given in full instead, both must point to a postgres database
+DATABASE_REPLICA_HOST = os.environ.get('DATABASE_REPLICA_HOST', '')
+DATABASE_REPLICA_PORT = os.environ.get('DATABASE_REPLICA_PORT', DATABASE_PORT)
+
+REPLICA_DATABASE_URL = os.environ.get('DATABASE_REPLICA_URL', '')
+ASYNC_REPLICA_DATABASE_URL = os.environ.get('ASYNC_DATABASE_REPLICA_URL', '')
+
+if DATABASE_REPLICA_HOST != '':
+    REPLICA_DATABASE_URL = REPLICA_DATABASE_URL or f'postgresql+psycopg2://{DATABASE_USERNAME}:{DATABASE_PASSWORD}@{DATABASE_REPLICA_HOST}:{DATABASE_REPLICA_PORT}/{DATABASE_NAME}'
+    ASYNC_REPLICA_DATABASE_URL = ASYNC_REPLICA_DATABASE_URL or f'postgresql+psycopg://{DATABASE_USERNAME}:{DATABASE_PASSWORD}@{DATABASE_REPLICA_HOST}:{DATABASE_REPLICA_PORT}/{DATABASE_NAME}'
+
+# Connection pool settings shared by every engine
+POOL_SETTINGS = {
+    'pool_pre_ping': True,
+    'pool_size': 10,
+    'max_overflow': 20,
+    'pool_timeout': 30,
+    'pool_recycle': 1800
+}
+
 # Create engine
-engine = create_engine(
-    DATABASE_URL,
-    poolclass=QueuePool,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
-    pool_timeout=30,
-    pool_recycle=1800
-)
+engine = create_engine(DATABASE_URL, poolclass=QueuePool, **POOL_SETTINGS)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create asyncio engine
+# No connections are made until the engine is first used
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **POOL_SETTINGS)
+
+# Create asyncio session factory
+# Rows stay loaded after committing as attributes cannot be lazily refreshed when awaited
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+# Create the replica engines, both fall back to the primary database when not configured
+replica_engine = engine
+ReplicaSessionLocal = SessionLocal
+
+if REPLICA_DATABASE_URL != '':
+    replica_engine = create_engine(REPLICA_DATABASE_URL, poolclass=QueuePool, **POOL_SETTINGS)
+    ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=replica_engine)
+
+async_replica_engine = async_engine
+AsyncReplicaSessionLocal = AsyncSessionLocal
+
+if ASYNC_REPLICA_DATABASE_URL != '':
+    async_replica_engine = create_async_engine(ASYNC_REPLICA_DATABASE_URL, **POOL_SETTINGS)
+    AsyncReplicaSessionLocal = async_sessionmaker(bind=async_replica_engine, autoflush=False, expire_on_commit=False)
+
 # Base class for models
 Base = declarative_base()
 
 
 # Dependency to get DB session
 @contextmanager
-def get_db_conn() -> Generator[Session, None, None]:
+def get_db_conn(readonly: bool=False) -> Generator[Session, None, None]:
     '''
-    This file gives out the object connection to the specified database
-    
+    This file gives out the object connection to the specified database.
+    Read only connections are made to the replica, which may lag
+    behind the primary database so must never be written to.
+
+    readonly (bool): whether to connect to the replica [default - False]
+
     yeild (Session, None, None): only yeilds the database connection
     '''
 
-    db = SessionLocal()
+    db = ReplicaSessionLocal() if readonly else SessionLocal()
 
     try:
         yield db
@@ -63,6 +107,27 @@ def get_db_conn() -> Generator[Session, None, None]:
         db.close()
 
 
+@asynccontextmanager
+async def get_async_db_conn(readonly: bool=False) -> AsyncGenerator[AsyncSession, None]:
+    '''
+    This file gives out the asyncio object connection to the specified database.
+    Blocking helper functions written for Session can be reused
+    through AsyncSession.run_sync without occupying a thread.
+
+    readonly (bool): whether to connect to the replica [default - False]
+
+    yeild (AsyncSession, None): only yeilds the database connection
+    '''
+
+    db = AsyncReplicaSessionLocal() if readonly else AsyncSessionLocal()
+
+    try:
+        yield db
+
+    finally:
+        await db.close()
+
+
 def database_initialization(database_name: str=DATABASE_NAME) -> None:
     '''
     This function checks whether the database has been created.
@@ -0,0 +1,188 @@
+'''
+Versioned schema changes for the account database.
+
+Base.metadata.create_all only creates the tables that do not exist,
+so changes to existing tables, such as new indexes, are applied here.
+Each migration is applied once and in order, then recorded in the
+schema_version table. Indexes are built concurrently so a live
+database keeps accepting writes while they are created.
+
+New migrations are appended to MIGRATIONS with the next version,
+the matching change should also be declared in models.py so new
+databases created by create_all are already up to date.
+'''
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from sqlalchemy import Connection, Engine
+from sqlalchemy.sql import text
+from typing import Tuple, Union
+
+from src.backend_services.account.database.database import engine
+
+
+@dataclass(frozen=True, slots=True)
+class Migration:
+    '''
+    A single change to the database schema.
+    Concurrent index builds can not run within a transaction,
+    so those migrations are ran with transactional set to False.
+    A failed concurrent build leaves an invalid index behind,
+    given the index_name it is removed before the build is retried.
+    '''
+
+    version: int
+    description: str
+    statements: Tuple[str, ...]
+    transactional: bool = True
+    index_name: Union[str, None] = None
+
+
+MIGRATIONS = (
+    Migration(
+        version=1,
+        description='Index failed login attempts by user and expiry',
+        statements=(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_login_attempts_user_id_expires '
+            'ON user_login_attempts (user_id, expires)',
+        ),
+        transactional=False,
+        index_name='ix_user_login_attempts_user_id_expires'
+    ),
+    Migration(
+        version=2,
+        description='Index failed login attempts by expiry',
+        statements=(
+            'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_user_login_attempts_expires '
+            'ON user_login_attempts (expires)',
+        ),
+        transactional=False,
+        index_name='ix_user_login_attempts_expires'
+    ),
+)
+
+# Held while migrating so only one server instance applies the migrations
+MIGRATION_LOCK_ID = 72400019
+
+
+def create_version_table(conn: Connection) -> None:
+    '''
+    Creates the table recording the applied migrations.
+
+    conn (Connection): an autocommit connection to the database
+
+    return (None):
+    '''
+
+    conn.execute(text(
+        'CREATE TABLE IF NOT EXISTS schema_version ('
+        'version INTEGER PRIMARY KEY, '
+        'description TEXT NOT NULL, '
+        'applied_at INTEGER NOT NULL)'
+    ))
+
+
+def get_schema_version(conn: Connection) -> int:
+    '''
+    Fetches the latest migration applied to the database.
+
+    conn (Connection): an autocommit connection to the database
+
+    return (int): the schema version, 0 when no migration has been applied
+    '''
+
+    return conn.execute(text('SELECT COALESCE(MAX(version), 0) FROM schema_version')).scalar()
+
+
+def drop_invalid_index(conn: Connection, index_name: str) -> None:
+    '''
+    Removes an index left invalid by a failed concurrent build.
+
+    conn (Connection): an autocommit connection to the database
+    index_name (str): the name of the index
+
+    return (None):
+    '''
+
+    invalid = conn.execute(text(
+        'SELECT 1 FROM pg_index JOIN pg_class ON pg_class.oid = pg_index.indexrelid '
+        'WHERE pg_class.relname = :name AND NOT pg_index.indisvalid'
+    ), { 'name': index_name }).scalar() is not None
+
+    if invalid:
+        conn.execute(text(f'DROP INDEX CONCURRENTLY IF EXISTS {index_name}'))
+
+
+def apply_migration(conn: Connection, bind: Engine, migration: Migration) -> None:
+    '''
+    Applies a single migration and records its version.
+    Transactional migrations are ran on their own connection
+    as the autocommit connection can not hold a transaction.
+
+    conn (Connection): an autocommit connection to the database
+    bind (Engine): the engine of the database being migrated
+    migration (Migration): the migration to apply
+
+    return (None):
+    '''
+
+    if migration.index_name is not None:
+        drop_invalid_index(conn, migration.index_name)
+
+    record = text('INSERT INTO schema_version (version, description, applied_at) VALUES (:version, :description, :applied_at)')
+    values = {
+        'version': migration.version,
+        'description': migration.description,
+        'applied_at': int(datetime.now(timezone.utc).timestamp())
+    }
+
+    if migration.transactional:
+        with bind.begin() as transaction:
+            for statement in migration.statements:
+                transaction.execute(text(statement))
+
+            transaction.execute(record, values)
+
+        return
+
+    for statement in migration.statements:
+        conn.execute(text(statement))
+
+    conn.execute(record, values)
+
+
+def run_migrations(bind: Engine=engine, migrations: Tuple[Migration, ...]=MIGRATIONS) -> Tuple[bool, str, int]:
+    '''
+    Applies every migration newer than the version of the database.
+    Migrations stop at the first failure, which is retried on the next startup.
+
+    bind (Engine): the engine of the database to migrate [default - engine]
+    migrations (Tuple[Migration, ...]): the migrations in version order [default - MIGRATIONS]
+
+    return (bool, str, int): a success flag, message and the schema version of the database
+    '''
+
+    with bind.connect().execution_options(isolation_level='AUTOCOMMIT') as conn:
+        conn.execute(text('SELECT pg_advisory_lock(:lock_id)'), { 'lock_id': MIGRATION_LOCK_ID })
+
+        try:
+            create_version_table(conn)
+            version = get_schema_version(conn)
+
+            for migration in migrations:
+                if migration.version <= version:
+                    continue
+
+                try:
+                    apply_migration(conn, bind, migration)
+
+                except Exception as e:
+                    return False, f'Migration {migration.version} ({migration.description}) Failed: {e}', version
+
+                version = migration.version
+                print(f'- Migration {migration.version} Applied: {migration.description}')
+
+            return True, 'Database Schema Up To Date', version
+
+        finally:
+            conn.execute(text('SELECT pg_advisory_unlock(:lock_id)'), { 'lock_id': MIGRATION_LOCK_ID })
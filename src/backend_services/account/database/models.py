@@ -3,7 +3,7 @@ The tables required for the account-service to operate
 '''
 
 from datetime import datetime, timezone, UTC
-from sqlalchemy import Column, String, Boolean, Date, Text, Integer, ForeignKey
+from sqlalchemy import Column, String, Boolean, Date, Text, Integer, ForeignKey, Index
 from typing import Self
 
 from src.backend_services.account.database.db_enum_statuses import USER_STATUS_ENUM, GENDER_ENUM, ROLE_ENUM
@@ -93,6 +93,13 @@ class UserLoginAttempts(Base):
     '''
 
     __tablename__ = "user_login_attempts"
+    __table_args__ = (
+        # Attempts are always fetched per user, and expired attempts per user are removed
+        # Existing databases receive the index through migrations.py
+        Index('ix_user_login_attempts_user_id_expires', 'user_id', 'expires'),
+        # Expired attempts of every user are removed by attempt_sweeper.py
+        Index('ix_user_login_attempts_expires', 'expires'),
+    )
 
     id = Column(Integer, primary_key=True, nullable=False)
     user_id = Column(ForeignKey('user.id'))
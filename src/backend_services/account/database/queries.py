@@ -0,0 +1,93 @@
+'''
+Lightweight read queries for the account database.
+
+Loading a User entity fetches every column, password hash included,
+and registers the row with the session to track changes. Requests that
+only read the public profile of a user instead select just those columns
+into a slotted UserProfile. Full entities are only loaded by requests
+that modify the user.
+'''
+
+from dataclasses import dataclass
+from datetime import date
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from typing import Union
+
+from src.backend_services.account.database.models import User
+
+
+@dataclass(frozen=True, slots=True)
+class UserProfile:
+    '''
+    The publicly accessible data of a single user.
+    The fields share their names with the User columns
+    so either can be given to user_proto_format.
+    '''
+
+    uuid: str
+    email: str
+    password_last_changed_at: int
+    first_name: str
+    last_name: str
+    gender: str
+    date_of_birth: date
+    created_at: int
+    updated_at: int
+    last_login: Union[int, None]
+    email_verified: bool
+    user_status: str
+    user_role: str
+
+
+# Selected in the same order as the UserProfile fields
+PROFILE_COLUMNS = tuple(getattr(User, field) for field in UserProfile.__slots__)
+
+
+def select_user_profile(*criteria) -> Select:
+    '''
+    Builds the query selecting the profile columns of the matching user.
+
+    criteria (ColumnElement): the filters of the user to select
+
+    return (Select): the query selecting the profile columns
+    '''
+
+    return select(*PROFILE_COLUMNS).where(*criteria).limit(1)
+
+
+def get_user_profile(session: Session, *criteria) -> Union[UserProfile, None]:
+    '''
+    Fetches the profile of the first user matching the criteria.
+
+    session (Session): the connection to the database
+    criteria (ColumnElement): the filters of the user to select
+
+    return ([UserProfile, None]): the users profile, None when no user matches
+    '''
+
+    row = session.execute(select_user_profile(*criteria)).first()
+
+    if row is None:
+        return None
+
+    return UserProfile(*row)
+
+
+async def async_get_user_profile(session: AsyncSession, *criteria) -> Union[UserProfile, None]:
+    '''
+    The asyncio counterpart of get_user_profile.
+
+    session (AsyncSession): the asyncio connection to the database
+    criteria (ColumnElement): the filters of the user to select
+
+    return ([UserProfile, None]): the users profile, None when no user matches
+    '''
+
+    row = (await session.execute(select_user_profile(*criteria))).first()
+
+    if row is None:
+        return None
+
+    return UserProfile(*row)
@@ -0,0 +1,141 @@
+'''
+Decides whether a read only request can be served by the read replica.
+
+The replica applies the writes of the primary database after a short
+delay, so a user reading back their own change could be shown the data
+from before it. Every request that modifies a user pins the users uuid
+to the primary for REPLICA_STICKY_SECONDS, during which their reads are
+served by the primary. Only reads keyed by the users uuid are served by
+the replica, so the uuid is the only key pinned. Pins are stored in redis so they apply
+to every instance of the service, when redis can not be reached reads
+are served by the primary.
+'''
+
+import os
+
+from redis.exceptions import RedisError
+
+from src.backend_services.account.database.database import async_engine, async_replica_engine, engine, replica_engine
+from src.backend_services.common.redis.async_redis import get_async_redis_conn
+from src.backend_services.common.redis.redis import get_redis_conn
+
+
+# How long (seconds) the reads of a user are served by the primary after they modify their account
+# Should be kept above the replication delay of the replica
+REPLICA_STICKY_SECONDS = int(os.environ.get('DATABASE_REPLICA_STICKY_SECONDS', 10))
+
+# Requests not ported to asyncio still pin users in the asyncio server mode, so either replica enables pinning
+REPLICA_ENABLED = replica_engine is not engine or async_replica_engine is not async_engine
+
+
+def primary_pin_key(user_uuid: str) -> str:
+    '''
+    Gets the key pinning the reads of a user to the primary.
+
+    user_uuid (str): the users uuid
+
+    return (str): the redis key of the pin
+    '''
+
+    return f'primary_pin:{user_uuid}'
+
+
+def pin_to_primary(user_uuid: str) -> bool:
+    '''
+    Serves the reads of a user from the primary while the replica catches up with their change.
+    Called after committing every change to a user, before their cached profile is replaced.
+
+    user_uuid (str): the users uuid
+
+    return (bool): whether the user was pinned
+    '''
+
+    if not REPLICA_ENABLED:
+        return True
+
+    success, _, redis_client = get_redis_conn()
+
+    if not success:
+        return False
+
+    try:
+        redis_client.set(primary_pin_key(user_uuid), 1, ex=REPLICA_STICKY_SECONDS)
+
+    except RedisError:
+        return False
+
+    return True
+
+
+def can_read_replica(user_uuid: str) -> bool:
+    '''
+    Checks whether a read of the user can be served by the replica.
+
+    user_uuid (str): the users uuid
+
+    return (bool): True when the replica can be used, False to use the primary
+    '''
+
+    if not REPLICA_ENABLED:
+        return False
+
+    success, _, redis_client = get_redis_conn()
+
+    if not success:
+        return False
+
+    try:
+        return redis_client.exists(primary_pin_key(user_uuid)) == 0
+
+    except RedisError:
+        return False
+
+
+async def async_pin_to_primary(user_uuid: str) -> bool:
+    '''
+    The asyncio counterpart of pin_to_primary.
+
+    user_uuid (str): the users uuid
+
+    return (bool): whether the user was pinned
+    '''
+
+    if not REPLICA_ENABLED:
+        return True
+
+    success, _, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return False
+
+    try:
+        await redis_client.set(primary_pin_key(user_uuid), 1, ex=REPLICA_STICKY_SECONDS)
+
+    except RedisError:
+        return False
+
+    return True
+
+
+async def async_can_read_replica(user_uuid: str) -> bool:
+    '''
+    The asyncio counterpart of can_read_replica.
+
+    user_uuid (str): the users uuid
+
+    return (bool): True when the replica can be used, False to use the primary
+    '''
+
+    if not REPLICA_ENABLED:
+        return False
+
+    success, _, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return False
+
+    try:
+        return await redis_client.exists(primary_pin_key(user_uuid)) == 0
+
+    except RedisError:
+        return False
@@ -1,5 +1,6 @@
 '''
-The main root file for the specified gRPC account server
+The main root file for the specified gRPC account server,
+started by the account package __main__
 '''
 
 import os
@@ -7,10 +8,27 @@ import grpc
 
 from concurrent import futures
 
-from src.backend_services.account.database.database import database_initialization, Base, engine
+from src.backend_services.account.database.activity_buffer import start_activity_flusher, stop_activity_flusher
+from src.backend_services.account.database.attempt_sweeper import start_attempt_sweeper, stop_attempt_sweeper
+from src.backend_services.account.database.database import database_initialization, Base, engine, async_engine, \
+    replica_engine, async_replica_engine
+from src.backend_services.account.database.migrations import run_migrations
+from src.backend_services.account.authentication.async_login import AsyncUserAuthentication_Service
+from src.backend_services.account.authentication.async_settings import AsyncUserAction_Service
 from src.backend_services.account.authentication.login import UserAuthentication_Service
+from src.backend_services.account.authentication.password_hashing import shutdown_hash_pool, \
+    HASH_MAX_QUEUE, HASH_METHOD, HASH_WORKERS
 from src.backend_services.account.authentication.settings import UserAction_Service
 from src.backend_services.common.proto import user_login_pb2_grpc, user_actions_pb2_grpc
+from src.backend_services.common.redis.async_redis import init_async_redis_pool, close_async_redis_pool
+from src.backend_services.common.redis.redis import get_redis_pool_stats, start_pool_stats_reporter, \
+    stop_pool_stats_reporter
+from src.backend_services.common.utils.domain_cache import start_domain_preload
+from src.backend_services.common.utils.field_checks import shutdown_validation_pool
+
+
+# Either 'sync' (a thread per request) or 'async' (grpc.aio event loop)
+SERVER_MODE = os.environ.get('ACCOUNT_SERVER_MODE', 'sync').lower()
 
 
 def add_services(server: grpc.Server) -> None:
@@ -29,6 +47,51 @@ def add_services(server: grpc.Server) -> None:
     print('Service Added: User-Action')
 
 
+def add_async_services(server: grpc.aio.Server) -> None:
+    '''
+    All the services to be added to the asyncio gRPC server on startup.
+    Requests not yet ported to asyncio are ran by the servers migration thread pool.
+
+    server (grpc.aio.Server): the server to add the services to
+
+    return (None):
+    '''
+
+    user_login_pb2_grpc.add_UserAuthServiceServicer_to_server(AsyncUserAuthentication_Service(), server)
+    print('Service Added: User-Authentication (Async)')
+
+    user_actions_pb2_grpc.add_UserSettingsServiceServicer_to_server(AsyncUserAction_Service(), server)
+    print('Service Added: User-Action (Async)')
+
+
+def get_server_credentials() -> grpc.ServerCredentials:
+    '''
+    Loads the certificate and private key of the account-service.
+
+    return (ServerCredentials): the credentials used to secure the server port
+    '''
+
+    return grpc.ssl_server_credentials(
+        [(open(os.environ.get('ACCOUNT_PKEY'), 'rb').read(), open(os.environ.get('ACCOUNT_CERT'), 'rb').read())]
+    )
+
+
+def migrate_database() -> None:
+    '''
+    Applies any schema migrations missing from the database.
+    A failed migration does not stop the server, it is retried on the next startup.
+
+    return (None):
+    '''
+
+    success, message, version = run_migrations()
+
+    if not success:
+        print(f'WARNING: {message}')
+
+    print(f'Database Schema Version: {version}')
+
+
 def serve() -> None:
     '''
     Method to startup and initialise the gRPC server
@@ -42,25 +105,103 @@ def serve() -> None:
 
     print(f'Port: {port}')
     print(f'Max Workers Assigned: {max_workers}')
+    print(f'Password Hashing: {HASH_METHOD} On {HASH_WORKERS} Processes (Max Queue: {HASH_MAX_QUEUE})')
+    print(f'Read Replica: {"Enabled" if replica_engine is not engine else "Disabled"}')
 
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+    redis_pool_stats = get_redis_pool_stats()
+    print(f'Redis Max Connections: {redis_pool_stats["max_connections"]}')
 
-    server_credentials = grpc.ssl_server_credentials(
-        [(open(os.environ.get('ACCOUNT_PKEY'), 'rb').read(), open(os.environ.get('ACCOUNT_CERT'), 'rb').read())]
-    )
+    if redis_pool_stats['max_connections'] < max_workers:
+        print('WARNING: REDIS_MAX_CONNECTIONS Is Lower Than ACCOUNT_MAX_WORKERS. Workers May Wait On Redis Connections')
 
-    server.add_secure_port(f'[::]:{port}', server_credentials)
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=max_workers))
+
+    server.add_secure_port(f'[::]:{port}', get_server_credentials())
     print(f'Starting gRPC server on https://{host}:{port}')
     server.start()
 
     database_initialization()
     Base.metadata.create_all(engine)
+    migrate_database()
+
+    start_domain_preload()
+    start_attempt_sweeper()
+    start_activity_flusher()
+    start_pool_stats_reporter('account-service')
 
     add_services(server)
 
     print('Server Running')
-    server.wait_for_termination()
 
+    try:
+        server.wait_for_termination()
+
+    finally:
+        stop_pool_stats_reporter()
+        stop_attempt_sweeper()
+        stop_activity_flusher()
+        shutdown_hash_pool()
+        shutdown_validation_pool()
+
+
+async def serve_async() -> None:
+    '''
+    Method to startup and initialise the asyncio gRPC server.
+    Requests wait on the database, redis and other services without
+    holding a thread, ACCOUNT_MAX_WORKERS only sizes the thread pool
+    used by requests that have not been ported to asyncio.
+
+    return (None):
+    '''
+
+    host = os.environ.get('ACCOUNT_HOST')
+    port = os.environ.get('ACCOUNT_PORT')
+    max_workers = int(os.environ.get('ACCOUNT_MAX_WORKERS'))
+
+    print(f'Port: {port}')
+    print(f'Migration Workers Assigned: {max_workers}')
+    print(f'Password Hashing: {HASH_METHOD} On {HASH_WORKERS} Processes (Max Queue: {HASH_MAX_QUEUE})')
+    print(f'Read Replica: {"Enabled" if async_replica_engine is not async_engine else "Disabled"}')
+
+    server = grpc.aio.server(migration_thread_pool=futures.ThreadPoolExecutor(max_workers=max_workers))
+
+    database_initialization()
+    Base.metadata.create_all(engine)
+    migrate_database()
+
+    start_domain_preload()
+    start_attempt_sweeper()
+    start_activity_flusher()
+    start_pool_stats_reporter('account-service')
+
+    success, message = await init_async_redis_pool()
+
+    if not success:
+        print(f'WARNING: {message}. Connecting Again On First Request')
+
+    # Services are added before starting as the asyncio server
+    # does not accept handlers once it is running
+    add_async_services(server)
+
+    server.add_secure_port(f'[::]:{port}', get_server_credentials())
+    print(f'Starting asyncio gRPC server on https://{host}:{port}')
+    await server.start()
+
+    print('Server Running')
+
+    try:
+        await server.wait_for_termination()
+
+    finally:
+        await close_async_redis_pool()
+        await async_engine.dispose()
+
+        if async_replica_engine is not async_engine:
+            await async_replica_engine.dispose()
+
+        stop_pool_stats_reporter()
+        stop_attempt_sweeper()
+        stop_activity_flusher()
+        shutdown_hash_pool()
+        shutdown_validation_pool()
 
-if __name__ == '__main__':
-    serve()
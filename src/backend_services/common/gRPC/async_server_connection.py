@@ -0,0 +1,316 @@
+'''
+This file holds a class that is used to communicate to different
+gRPC servers from within an asyncio event loop (e.g. FastAPI routes).
+'''
+
+import asyncio
+import grpc
+import random
+
+from google.protobuf.message import Message
+from typing import Callable, Self, Tuple, Union
+
+from src.backend_services.common.gRPC.server_connection import DEFAULT_CHANNEL_OPTIONS, FAILED_CHANNEL_STATES, \
+    RETRYABLE_ERRORS, STUB, get_rpc_error_response
+from src.backend_services.common.proto.input_output_messages_pb2 import HTTP_Response
+
+
+# How long (seconds) requests still using a replaced channel have to complete before it is closed
+CHANNEL_CLOSE_GRACE_SECONDS = 5.0
+
+
+class AsyncServerCommunication():
+    '''
+    The asyncio counterpart of ServerCommunication built on grpc.aio.
+    Requests are awaited, meaning a slow gRPC server only delays
+    the request waiting on it rather than the whole event loop.
+
+    The channel is created on the first request so that it is bound
+    to the running event loop, and is kept open for the lifetime
+    of the class. Stubs are created once per stub class and reused.
+    This class should only be initialised once on startup and then
+    called upon by the running server when it is needed.
+    '''
+
+    def __init__(
+            cls: Self,
+            channel_host: str,
+            channel_port: str,
+            channel_secure: bool=False,
+            server_certificate: str=None,
+            rpc_max_retries: int=3,
+            channel_options: list=DEFAULT_CHANNEL_OPTIONS
+        ) -> None:
+
+        '''
+        Initialising the class by receiving all the variables required
+        to create and send a request to the targeted gRPC server.
+
+        cls (Self): the AsyncServerCommunication class
+        channel_host (str): the host used to call the server
+        channel_port (str): what port the server is located on within the host
+        channel_secure (bool): whethewr to use a secure channel or an insecure channel [default - False]
+        server_certificate (str): the root to the servers certificate [default - None]
+        rpc_max_retries (int): how many times should the request be attempted [default - 3]
+        channel_options (list): a list of gRPC channel options [default - DEFAULT_CHANNEL_OPTIONS]
+
+        return (None): Nothing is returned
+        '''
+
+        cls.host = channel_host
+        cls.port = channel_port
+
+        cls.secure_channel = channel_secure
+        cls.certificate = None
+
+        cls.options = channel_options
+        cls.max_retries = rpc_max_retries
+
+        cls.channel = None
+        cls.stubs = {}
+        cls.reconnect_count = 0
+
+        # Replaced channels still closing, referenced so the tasks are not garbage collected
+        cls.closing_channels = set()
+
+        if cls.secure_channel:
+            if server_certificate is None:
+                error_msg = f'Failed To Initialise AsyncServerCommunication For {cls.host}:{cls.port}. Server Certificate Must Be Provided'
+                raise AttributeError(error_msg)
+
+            else:
+                credentials = open(server_certificate, 'rb').read()
+                cls.certificate = grpc.ssl_channel_credentials(root_certificates=credentials)
+
+
+    def connect(cls: Self) -> grpc.aio.Channel:
+        '''
+        Creates the channel to the specified server using
+        either a secure channel or insecure channel.
+        Must be called from within the running event loop.
+
+        cls (Self): the AsyncServerCommunication class
+
+        return (Channel): the newly created channel
+        '''
+
+        url = cls.host + ':' + cls.port
+
+        if cls.secure_channel:
+            cls.channel = grpc.aio.secure_channel(url, cls.certificate, options=cls.options)
+
+        else:
+            cls.channel = grpc.aio.insecure_channel(url, options=cls.options)
+
+        cls.stubs = {}
+
+        return cls.channel
+
+
+    async def reconnect(cls: Self) -> None:
+        '''
+        Replaces the current channel with a new channel.
+        Any cached stubs are dropped as they are bound to the old channel.
+        Other requests may still be using the old channel, so it is
+        closed in the background once they complete or the grace period ends.
+
+        cls (Self): the AsyncServerCommunication class
+
+        return (None): Nothing is returned
+        '''
+
+        old_channel = cls.channel
+        cls.connect()
+
+        if old_channel is not None:
+            cls.reconnect_count += 1
+
+            task = asyncio.create_task(old_channel.close(grace=CHANNEL_CLOSE_GRACE_SECONDS))
+            cls.closing_channels.add(task)
+            task.add_done_callback(cls.closing_channels.discard)
+
+
+    async def close(cls: Self) -> None:
+        '''
+        Closes the channel, used when the server shuts down.
+
+        cls (Self): the AsyncServerCommunication class
+
+        return (None): Nothing is returned
+        '''
+
+        if cls.channel is not None:
+            await cls.channel.close()
+
+        if len(cls.closing_channels) != 0:
+            await asyncio.gather(*cls.closing_channels, return_exceptions=True)
+
+        cls.channel = None
+        cls.stubs = {}
+
+
+    def get_channel_state(cls: Self) -> Union[grpc.ChannelConnectivity, None]:
+        '''
+        Fetches the current state of the channel without connecting.
+
+        cls (Self): the AsyncServerCommunication class
+
+        return ([ChannelConnectivity, None]): the state or None if no channel exists
+        '''
+
+        if cls.channel is None:
+            return None
+
+        return cls.channel.get_state(try_to_connect=False)
+
+
+    def connection_failed(cls: Self) -> bool:
+        '''
+        Checks whether the channel has failed to connect
+        and has to be rebuilt.
+
+        cls (Self): the AsyncServerCommunication class
+
+        return (bool): channel failed flag
+        '''
+
+        return cls.get_channel_state() in FAILED_CHANNEL_STATES
+
+
+    def get_stub(cls: Self, stub: Callable[[], STUB]) -> STUB:
+        '''
+        Fetches the stub initialised on the current channel,
+        creating the channel and stub when needed.
+
+        cls (Self): the AsyncServerCommunication class
+        stub (Callable): a gRPC stub class that has yet to be executed
+
+        return (STUB): the stub bound to the current channel
+        '''
+
+        if cls.channel is None:
+            cls.connect()
+
+        stub_channel = cls.stubs.get(stub)
+
+        if stub_channel is None:
+            stub_channel = stub(cls.channel)
+            cls.stubs[stub] = stub_channel
+
+        return stub_channel
+
+
+    def get_metrics(cls: Self) -> dict:
+        '''
+        Fetches the current state of the channel and how
+        often it has been rebuilt since initialisation.
+
+        cls (Self): the AsyncServerCommunication class
+
+        return (dict): the channel target, state, reconnect count and cached stub count
+        '''
+
+        channel_state = cls.get_channel_state()
+
+        return {
+            'target': f'{cls.host}:{cls.port}',
+            'channel_state': channel_state.name if channel_state is not None else None,
+            'reconnect_count': cls.reconnect_count,
+            'cached_stubs': len(cls.stubs)
+        }
+
+
+    async def grpc_request(
+            cls: Self,
+            request: Union[str, Callable],
+            stub: Callable[[], STUB],
+            data: Message,
+            idempotent: bool=False
+        ) -> Tuple[bool, Union[Message, HTTP_Response]]:
+
+        '''
+        With the provided method and data, it sends one request
+        to the dedicated server and awaits a single response.
+        Retries follow the same rules and backoff as
+        ServerCommunication.grpc_request, but wait without
+        blocking the event loop.
+
+        Only idempotent requests are retried. A request failing with
+        DEADLINE_EXCEEDED or INTERNAL may have already been acted on by
+        the server, so requests changing state are attempted once.
+
+        cls (Self): the AsyncServerCommunication class
+        stub (Callable): a gRPC stub class that has yet to be executed
+        request (str, Callable):
+            the request is the function to call the gRPC server.
+            it can either be a string or the actual calling method.
+        data (Message): the proto data structure containing the message request data
+        idempotent (bool): whether the request can safely be repeated, allowing retries [default - False]
+
+        return (bool, [Message, HTTP_Response]): success flag and the response or error
+        '''
+
+        backoff_factor = 0.5
+        max_attempts = cls.max_retries if idempotent else 1
+
+        for attempt in range(max_attempts):
+            try:
+                stub_channel = cls.get_stub(stub)
+
+                if isinstance(request, str):
+                    call_func = getattr(stub_channel, request)
+
+                else:
+                    call_func = request
+
+                return True, await call_func(data)
+
+            except grpc.RpcError as e:
+                status_code = e.code()
+
+                # The server either currently unavailable, crashed or took too long to respons
+                if status_code in RETRYABLE_ERRORS and attempt < max_attempts - 1:
+                    sleep_time = backoff_factor * (2 ** attempt) + random.uniform(0, 0.1)
+                    await asyncio.sleep(sleep_time)
+
+                    # The channel reconnects by itself unless it has failed
+                    if cls.connection_failed():
+                        await cls.reconnect()
+
+                    continue
+
+                # Requests that are not retried still leave a working channel for the next request
+                if status_code in RETRYABLE_ERRORS and cls.connection_failed():
+                    await cls.reconnect()
+
+                error_response = get_rpc_error_response(status_code)
+
+                if error_response is not None:
+                    return False, error_response
+
+            except AttributeError:
+                return False, HTTP_Response(
+                    success=False,
+                    http_status=500,
+                    message='Provided RPC Function Does Not Exist Or Stub Not Initialised'
+                )
+
+            except TypeError:
+                return False, HTTP_Response(
+                    success=False,
+                    http_status=500,
+                    message='Provided Request Is Not Callable Or A String'
+                )
+
+            except Exception:
+                return False, HTTP_Response(
+                    success=False,
+                    http_status=500,
+                    message='An Unexpected Error Occured'
+                )
+
+        return False, HTTP_Response(
+            success=False,
+            http_status=500,
+            message='No Response Received'
+        )
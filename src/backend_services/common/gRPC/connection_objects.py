@@ -1,5 +1,5 @@
 '''
-This file holds all the unique ServerCommunication
+This file holds all the unique AsyncServerCommunication
 instances that communicate to all gRPC servers.
 If any service wants to send a message to a gRPC service,
 they must fetch the clients initialised in this file and
@@ -8,13 +8,18 @@ save the object in their internal server.
 
 import os
 
-from src.backend_services.common.gRPC.server_connection import ServerCommunication
+from src.backend_services.common.gRPC.async_server_connection import AsyncServerCommunication
 
 
-account_client = ServerCommunication(
+# How many times an idempotent request to the account-service is attempted when the service is unavailable
+# Requests changing state are always attempted once
+ACCOUNT_RPC_MAX_RETRIES = int(os.environ.get('ACCOUNT_RPC_MAX_RETRIES', 3))
+
+
+async_account_client = AsyncServerCommunication(
     os.environ.get('ACCOUNT_SERVICE_NAME'),
     os.environ.get('ACCOUNT_PORT'),
     channel_secure=True,
     server_certificate=os.environ.get('ACCOUNT_CERT'),
-    rpc_max_retries=1
+    rpc_max_retries=ACCOUNT_RPC_MAX_RETRIES
 )
@@ -4,6 +4,7 @@ This file holds a class that is used to communicate to different gRPC servers.
 
 import grpc
 import random
+import threading
 import time
 
 from google.protobuf.message import Message
@@ -15,6 +16,20 @@ from src.backend_services.common.proto.input_output_messages_pb2 import HTTP_Res
 STUB = TypeVar("gRPC Stubs")
 
 
+# Channel states where the channel is unable to recover by itself
+FAILED_CHANNEL_STATES = [
+    grpc.ChannelConnectivity.TRANSIENT_FAILURE,
+    grpc.ChannelConnectivity.SHUTDOWN
+]
+
+# Status codes where the request is attempted again
+RETRYABLE_ERRORS = [
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.INTERNAL,
+    grpc.StatusCode.DEADLINE_EXCEEDED
+]
+
+
 DEFAULT_CHANNEL_OPTIONS = [
     # Defines the maximum data size of data one RPC 
     # call can send to a server.
@@ -71,6 +86,73 @@ DEFAULT_CHANNEL_OPTIONS = [
 ]
 
 
+def get_rpc_error_response(status_code: grpc.StatusCode) -> Union[HTTP_Response, None]:
+    '''
+    Converts the status code of a failed gRPC call into
+    the HTTP_Response error returned to the client.
+
+    status_code (StatusCode): the status code of the failed gRPC call
+
+    return ([HTTP_Response, None]): the error response or None if the status code is not handled
+    '''
+
+    # The server either currently unavailable, crashed or took too long to respons
+    if status_code == grpc.StatusCode.UNAVAILABLE:
+        return HTTP_Response(
+            success=False,
+            http_status=500,
+            message='Either Certificate Config Error Or Service Unreachable'
+        )
+
+    elif status_code == grpc.StatusCode.INTERNAL:
+        return HTTP_Response(
+            success=False,
+            http_status=500,
+            message='Internal Server Error'
+        )
+
+    elif status_code == grpc.StatusCode.DEADLINE_EXCEEDED:
+        return HTTP_Response(
+            success=False,
+            http_status=500,
+            message='Server Took Too Long To Respond'
+        )
+
+    # Response is missing authentication headers or invalid certificates
+    elif status_code == grpc.StatusCode.UNAUTHENTICATED:
+        return HTTP_Response(
+            success=False,
+            http_status=500,
+            message='Either Client Certificate Missing Or Server Certificate Invalid'
+        )
+
+    # Requests Data Is Malformed And Invalid
+    elif status_code == grpc.StatusCode.INVALID_ARGUMENT:
+        return HTTP_Response(
+            success=False,
+            http_status=400,
+            message='The Provided Input Is Incorrectly Formatted'
+        )
+
+    # RPC Request Does Not Exist
+    elif status_code == grpc.StatusCode.UNIMPLEMENTED:
+        return HTTP_Response(
+            success=False,
+            http_status=501,
+            message='RPC Call Does Not Exist Or Is Currently Not Implemented'
+        )
+
+    # Too Much Data Was Being Sent Over. Exceeds Data Limit Setting
+    elif status_code == grpc.StatusCode.RESOURCE_EXHAUSTED:
+        return HTTP_Response(
+            success=False,
+            http_status=400,
+            message='Maximum Data Provided Exceeds Data Limit'
+        )
+
+    return None
+
+
 class ServerCommunication():
     '''
     This class is used to communicate to a gRPC server and
@@ -80,9 +162,11 @@ class ServerCommunication():
     the request until either a successful response was given
     or the max ammount of attempts were used.
 
-    When a failed response is received, depending on the error,
-    it reconnects to the server which ensures that the
-    connection was not the issue. This class should only be
+    The channel is kept open for the lifetime of the class so that
+    the HTTP/2 connection, TLS session and keepalives are reused
+    between requests. The state of the channel is tracked and the
+    channel is only rebuilt when a request fails while the channel
+    is in a failed state. This class should only be
     initialised once on startup and then called upon by the
     running server when it is needed.
     '''
@@ -93,6 +177,7 @@ class ServerCommunication():
     options = []
 
     channel = None
+    channel_state = None
 
     def __init__(
             cls: Self,
@@ -130,6 +215,10 @@ class ServerCommunication():
         cls.options = channel_options
         cls.max_retries = rpc_max_retries
 
+        cls.state_lock = threading.Lock()
+        cls.reconnect_count = 0
+        cls.state_changes = {}
+
         if cls.secure_channel:
             if server_certificate is None:
                 error_msg = f'Failed To Initialise ServerCommunication For {cls.host}:{cls.port}. Server Certificate Must Be Provided'
@@ -146,7 +235,8 @@ class ServerCommunication():
         '''
         Attempts to connect to the specified server using
         either a secure channel or insecure channel.
-        Once connected, it then initialises a gRPC stub.
+        Any previously created channel is closed and the
+        state of the new channel is subscribed to.
 
         cls (Self): the ServerCommunication class
 
@@ -155,11 +245,67 @@ class ServerCommunication():
 
         url = cls.host + ':' + cls.port
 
-        if cls.secure_channel:
-            cls.channel = grpc.secure_channel(url, cls.certificate, options=cls.options)
+        with cls.state_lock:
+            if cls.channel is not None:
+                cls.channel.unsubscribe(cls.update_channel_state)
+                cls.channel.close()
+
+                cls.reconnect_count += 1
+
+            if cls.secure_channel:
+                cls.channel = grpc.secure_channel(url, cls.certificate, options=cls.options)
+
+            else:
+                cls.channel = grpc.insecure_channel(url, options=cls.options)
+
+            cls.channel_state = grpc.ChannelConnectivity.IDLE
+            cls.channel.subscribe(cls.update_channel_state, try_to_connect=False)
+
+
+    def update_channel_state(cls: Self, state: grpc.ChannelConnectivity) -> None:
+        '''
+        Called by gRPC whenever the state of the channel changes.
+        Records the current state and how often each state has been entered.
+
+        cls (Self): the ServerCommunication class
+        state (ChannelConnectivity): the new state of the channel
+
+        return (None): Nothing is returned
+        '''
+
+        cls.channel_state = state
+        cls.state_changes[state.name] = cls.state_changes.get(state.name, 0) + 1
+
 
-        else:
-            cls.channel = grpc.insecure_channel(url, options=cls.options)
+    def connection_failed(cls: Self) -> bool:
+        '''
+        Checks whether the channel has failed to connect
+        and has to be rebuilt.
+
+        cls (Self): the ServerCommunication class
+
+        return (bool): channel failed flag
+        '''
+
+        return cls.channel_state in FAILED_CHANNEL_STATES
+
+
+    def get_metrics(cls: Self) -> dict:
+        '''
+        Fetches the current state of the channel and how
+        often it has been rebuilt since initialisation.
+
+        cls (Self): the ServerCommunication class
+
+        return (dict): the channel target, state, reconnect count and state change counts
+        '''
+
+        return {
+            'target': f'{cls.host}:{cls.port}',
+            'channel_state': cls.channel_state.name if cls.channel_state is not None else None,
+            'reconnect_count': cls.reconnect_count,
+            'state_changes': dict(cls.state_changes)
+        }
 
 
     def grpc_request(
@@ -190,12 +336,6 @@ class ServerCommunication():
         return (bool, [Message, HTTP_Response]): Nothing is returned
         '''
 
-        retryable_errors = [
-            grpc.StatusCode.UNAVAILABLE,
-            grpc.StatusCode.INTERNAL,
-            grpc.StatusCode.DEADLINE_EXCEEDED
-        ]
-
         backoff_factor = 0.5
 
         for attempt in range(cls.max_retries):
@@ -214,65 +354,20 @@ class ServerCommunication():
                 status_code = e.code()
 
                 # The server either currently unavailable, crashed or took too long to respons
-                if status_code in retryable_errors:
-                    if attempt < cls.max_retries - 1:
-                        sleep_time = backoff_factor * (2 ** attempt) + random.uniform(0, 0.1)
-                        time.sleep(sleep_time)
+                if status_code in RETRYABLE_ERRORS and attempt < cls.max_retries - 1:
+                    sleep_time = backoff_factor * (2 ** attempt) + random.uniform(0, 0.1)
+                    time.sleep(sleep_time)
+
+                    # The channel reconnects by itself unless it has failed
+                    if cls.connection_failed():
                         cls.reconnect()
 
-                    else:
-                        if status_code == grpc.StatusCode.UNAVAILABLE:
-                            return False, HTTP_Response(
-                                success=False,
-                                http_status=500,
-                                message='Either Certificate Config Error Or Service Unreachable'
-                            )
-
-                        elif status_code == grpc.StatusCode.INTERNAL:
-                            return False, HTTP_Response(
-                                success=False,
-                                http_status=500,
-                                message='Internal Server Error'
-                            )
-
-                        elif status_code == grpc.StatusCode.DEADLINE_EXCEEDED:
-                            return False, HTTP_Response(
-                                success=False,
-                                http_status=500,
-                                message='Server Took Too Long To Respond'
-                            )
-
-                # Response is missing authentication headers or invalid certificates
-                elif status_code == grpc.StatusCode.UNAUTHENTICATED:
-                    return False, HTTP_Response(
-                        success=False,
-                        http_status=500,
-                        message='Either Client Certificate Missing Or Server Certificate Invalid'
-                    )
-
-                # Requests Data Is Malformed And Invalid
-                elif status_code == grpc.StatusCode.INVALID_ARGUMENT:
-                    return False, HTTP_Response(
-                        success=False,
-                        http_status=400,
-                        message='The Provided Input Is Incorrectly Formatted'
-                    )
-
-                # RPC Request Does Not Exist
-                elif status_code == grpc.StatusCode.UNIMPLEMENTED:
-                    return False, HTTP_Response(
-                        success=False,
-                        http_status=501,
-                        message='RPC Call Does Not Exist Or Is Currently Not Implemented'
-                    )
-
-                # Too Much Data Was Being Sent Over. Exceeds Data Limit Setting
-                elif status_code == grpc.StatusCode.RESOURCE_EXHAUSTED:
-                    return False, HTTP_Response(
-                        success=False,
-                        http_status=400,
-                        message='Maximum Data Provided Exceeds Data Limit'
-                    )
+                    continue
+
+                error_response = get_rpc_error_response(status_code)
+
+                if error_response is not None:
+                    return False, error_response
 
             except AttributeError:
                 return False, HTTP_Response(
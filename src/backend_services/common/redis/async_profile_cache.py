@@ -0,0 +1,132 @@
+'''
+This file holds the asyncio counterparts of the profile cache,
+sharing the keys and encoding of profile_cache.
+'''
+
+from redis.exceptions import RedisError
+from typing import Tuple, Union
+
+from src.backend_services.common.proto.user_login_pb2 import UserData
+from src.backend_services.common.redis.async_redis import get_async_redis_conn
+from src.backend_services.common.redis.profile_cache import PROFILE_CACHE_TTL, PROFILE_MISS_FIELD, PROFILE_READ_FIELD, \
+    PROFILE_STATS_KEY, decode_profile, decode_profile_stats, profile_key
+
+
+async def async_get_cached_profile(user_uuid: str) -> Union[UserData, None]:
+    '''
+    Fetches the cached profile of the user, counting the read.
+
+    user_uuid (str): the users uuid
+
+    return ([UserData, None]): the users profile, None when not cached or redis is unavailable
+    '''
+
+    success, _, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return None
+
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.get(profile_key(user_uuid))
+            pipe.hincrby(PROFILE_STATS_KEY, PROFILE_READ_FIELD, 1)
+
+            cached_profile, _ = await pipe.execute()
+
+    except RedisError:
+        return None
+
+    return decode_profile(cached_profile)
+
+
+async def async_cache_profile(user: UserData, miss: bool=False) -> bool:
+    '''
+    Caches the profile of the user, replacing any previous profile.
+
+    user (UserData): the users profile
+    miss (bool): whether the profile was read from the database after a cache miss [default - False]
+
+    return (bool): whether the profile was cached
+    '''
+
+    success, _, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return False
+
+    try:
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(profile_key(user.uuid), user.SerializeToString(), ex=PROFILE_CACHE_TTL)
+
+            if miss:
+                pipe.hincrby(PROFILE_STATS_KEY, PROFILE_MISS_FIELD, 1)
+
+            await pipe.execute()
+
+    except RedisError:
+        return False
+
+    return True
+
+
+async def async_count_profile_miss() -> None:
+    '''
+    The asyncio counterpart of count_profile_miss.
+
+    return (None):
+    '''
+
+    success, _, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return
+
+    try:
+        await redis_client.hincrby(PROFILE_STATS_KEY, PROFILE_MISS_FIELD, 1)
+
+    except RedisError:
+        pass
+
+
+async def async_invalidate_profile(user_uuid: str) -> bool:
+    '''
+    Removes the cached profile of the user so the next read fetches it from the database.
+
+    user_uuid (str): the users uuid
+
+    return (bool): whether the cache was reached
+    '''
+
+    success, _, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return False
+
+    try:
+        await redis_client.delete(profile_key(user_uuid))
+
+    except RedisError:
+        return False
+
+    return True
+
+
+async def async_get_profile_cache_stats() -> Tuple[bool, str, Union[dict, None]]:
+    '''
+    Fetches how often profiles were served from the cache.
+
+    return (bool, str, [dict, None]): success flag, message and the hits, misses and hit ratio
+    '''
+
+    success, message, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return False, message, None
+
+    try:
+        stats = await redis_client.hgetall(PROFILE_STATS_KEY)
+
+    except RedisError:
+        return False, 'Unable To Connect To Redis Server', None
+
+    return True, 'Request Successful', decode_profile_stats(stats)
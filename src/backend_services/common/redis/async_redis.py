@@ -0,0 +1,221 @@
+'''
+This file holds the method to get an asyncio connection to the redis server.
+
+The connection pool is created by the service during startup
+(e.g. FastAPI lifespan) so that it is bound to the running event loop,
+and shared by every coroutine within the service.
+'''
+
+import json
+import redis.asyncio as async_redis
+import time
+
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError, AuthenticationError, RedisError, TimeoutError
+from typing import Self, Tuple, Union
+
+from src.backend_services.common.redis.redis import REDIS_URL, REDIS_MAX_CONNECTIONS, REDIS_POOL_TIMEOUT, \
+    REDIS_HEALTH_CHECK_INTERVAL, REDIS_SOCKET_TIMEOUT, REDIS_SOCKET_CONNECT_TIMEOUT, REDIS_POOL_STATS_PREFIX
+
+
+_pool = None
+_client = None
+
+# The redis server is assumed reachable until this time (monotonic seconds)
+_healthy_until = 0.0
+
+
+class SharedAsyncRedis(Redis):
+    '''
+    The asyncio client shared by every coroutine within the service.
+    A command unable to reach the server makes the next
+    get_async_redis_conn call ping the server before handing it out.
+    '''
+
+    async def execute_command(cls: Self, *args, **options):
+        '''
+        Runs a single command, marking the server as unchecked when it can not be reached.
+
+        cls (Self): the SharedAsyncRedis class
+        args (Any): the command and its arguments
+        options (Any): the options of the command
+
+        return (Any): the response of the server
+        '''
+
+        global _healthy_until
+
+        try:
+            return await super().execute_command(*args, **options)
+
+        except (ConnectionError, TimeoutError):
+            _healthy_until = 0.0
+            raise
+
+
+async def init_async_redis_pool() -> Tuple[bool, str]:
+    '''
+    Creates the shared asyncio connection pool and checks
+    the redis server can be reached.
+
+    return (bool, str): success flag and message
+    '''
+
+    global _pool, _client, _healthy_until
+
+    if _client is not None:
+        return True, 'Connected Successfully'
+
+    status = False
+    message = 'Connected Successfully'
+
+    try:
+        pool = async_redis.BlockingConnectionPool.from_url(
+            REDIS_URL,
+            max_connections=REDIS_MAX_CONNECTIONS,
+            timeout=REDIS_POOL_TIMEOUT,
+            health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+            socket_timeout=REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=REDIS_SOCKET_CONNECT_TIMEOUT,
+            socket_keepalive=True
+        )
+
+        redis_client = SharedAsyncRedis(connection_pool=pool)
+        await redis_client.ping()
+
+        _pool = pool
+        _client = redis_client
+        _healthy_until = time.monotonic() + REDIS_HEALTH_CHECK_INTERVAL
+
+        status = True
+
+    except (ValueError, TypeError):
+        message = 'Invalid URL Provided'
+
+    except ConnectionError:
+        message = 'Unable To Connect To Redis Server'
+
+    except AuthenticationError:
+        message = 'Invalid Redis Authentication'
+
+    except Exception:
+        message = 'Unknown Error When Connecting To Redis Occurred'
+
+    return status, message
+
+
+async def get_async_redis_conn() -> Tuple[bool, str, Union[Redis, None]]:
+    '''
+    This gets the asyncio connection to the redis server and returns
+    the object used to communicate to the server.
+    The pool is created if the service did not create it on startup.
+    The server is pinged once every REDIS_HEALTH_CHECK_INTERVAL and after
+    a command failed to reach it, while the server can not be reached
+    a failed success flag is returned.
+
+    returns (bool, str, [Redis, None]): success flag, message and a redis object to the redis server
+    '''
+
+    global _healthy_until
+
+    if _client is None:
+        success, message = await init_async_redis_pool()
+
+        return success, message, _client
+
+    if time.monotonic() < _healthy_until:
+        return True, 'Connected Successfully', _client
+
+    try:
+        await _client.ping()
+
+    except (ConnectionError, TimeoutError):
+        return False, 'Unable To Connect To Redis Server', None
+
+    _healthy_until = time.monotonic() + REDIS_HEALTH_CHECK_INTERVAL
+
+    return True, 'Connected Successfully', _client
+
+
+def get_async_redis_pool_stats() -> dict:
+    '''
+    Fetches the usage of the shared asyncio connection pool,
+    in_use_connections reaching max_connections means coroutines
+    are waiting on a connection.
+
+    The counts are read from the internals of the redis-py pool, they
+    are None when the installed redis-py stores its connections differently.
+
+    return (dict): whether the pool has been created, its limit and the created, in use and available connections
+    '''
+
+    stats = {
+        'initialised': _pool is not None,
+        'max_connections': REDIS_MAX_CONNECTIONS,
+        'created_connections': 0,
+        'in_use_connections': 0,
+        'available_connections': 0
+    }
+
+    pool = _pool
+
+    if pool is None:
+        return stats
+
+    try:
+        in_use = len(pool._in_use_connections)
+        available = len(pool._available_connections)
+
+    except AttributeError:
+        return { **stats, 'created_connections': None, 'in_use_connections': None, 'available_connections': None }
+
+    stats['created_connections'] = in_use + available
+    stats['in_use_connections'] = in_use
+    stats['available_connections'] = available
+
+    return stats
+
+
+async def get_published_pool_stats() -> Tuple[bool, str, Union[dict, None]]:
+    '''
+    Fetches the pool usage reported by every running service instance.
+
+    return (bool, str, [dict, None]): success flag, message and the pool usage keyed by instance
+    '''
+
+    success, message, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return False, message, None
+
+    try:
+        keys = [key async for key in redis_client.scan_iter(match=f'{REDIS_POOL_STATS_PREFIX}*')]
+        values = await redis_client.mget(keys) if len(keys) != 0 else []
+
+    except RedisError:
+        return False, 'Unable To Connect To Redis Server', None
+
+    return True, 'Request Successful', {
+        key.decode('utf-8')[len(REDIS_POOL_STATS_PREFIX):]: json.loads(value)
+        for key, value in zip(keys, values) if value is not None
+    }
+
+
+async def close_async_redis_pool() -> None:
+    '''
+    Disconnects every connection within the shared asyncio pool.
+
+    return (None):
+    '''
+
+    global _pool, _client, _healthy_until
+
+    if _client is not None:
+        await _client.aclose()
+
+    if _pool is not None:
+        await _pool.disconnect()
+
+    _pool = None
+    _client = None
+    _healthy_until = 0.0
@@ -0,0 +1,181 @@
+'''
+This file holds the asyncio counterparts of the session
+functions used by services running within an event loop.
+The session layout is identical to user_sessions.
+'''
+
+import uuid
+
+from redis.asyncio import Redis
+from typing import Tuple, Union
+
+from src.backend_services.account.database.models import User
+from src.backend_services.common.redis.async_redis import get_async_redis_conn
+from src.backend_services.common.redis.user_sessions import decode_legacy_session, decode_session_fields, \
+    encode_session_fields, publish_session_invalidation, session_index_key, session_key, store_session, \
+    validate_session_data, SESSION_INVALIDATION_CHANNEL, SESSION_VERIFIED_FIELD, UPDATE_SESSION_FIELDS_SCRIPT
+
+
+async def async_create_session(user_uuid: str, user_data: User) -> Tuple[str, int]:
+    '''
+    Creates a session with an hour time limit.
+    The session holds the user data and whether the user has been verified.
+    The session is written in a single round trip to redis.
+
+    user_uuid (str): the users uuid
+    user_data (User): an sqlalchemy object containing one row for the specified users data
+
+    return (str, int): the session uuid and the expiry time
+    '''
+
+    success, message, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return False, message
+
+    session_uuid = str(uuid.uuid4())
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        unix_time = store_session(pipe, session_uuid, user_uuid, user_data)
+        await pipe.execute()
+
+    return session_uuid, unix_time
+
+
+async def async_delete_session(session_uuid: str, user_uuid: str) -> Tuple[bool, str]:
+    '''
+    Deletes the sessions linked to the user.
+
+    session_uuid (str): the clients session uuid identifier
+    user_uuid (str): the users uuid
+
+    return (bool, str): the success flag and a message
+    '''
+
+    success, message, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return False, message
+
+    session_id = session_key(session_uuid, user_uuid)
+
+    async with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(session_id)
+        pipe.delete(session_id + ':user_data', session_id + ':verified')
+        pipe.delete(session_index_key(session_uuid))
+        publish_session_invalidation(pipe, session_uuid, user_uuid)
+
+        session_deleted, legacy_deleted, _, _ = await pipe.execute()
+
+    success = bool(session_deleted or legacy_deleted == 2)
+
+    if not success:
+        return False, 'Unable To Log Out'
+
+    return True, 'User Logged Out'
+
+
+async def async_read_session(redis_client: Redis, session_uuid: str, user_uuid: str) -> Tuple[Union[dict, None], bool]:
+    '''
+    Reads the users data and verified flag of a session.
+    Falls back to the previous two key layout when no session hash exists.
+
+    redis_client (Redis): the asyncio connection to the redis server
+    session_uuid (str): the clients session uuid identifier
+    user_uuid (str): the users uuid
+
+    return ([dict, None], bool): the users data (None when no session exists) and whether the session is verified
+    '''
+
+    session_id = session_key(session_uuid, user_uuid)
+    user_data, verified = decode_session_fields(await redis_client.hgetall(session_id))
+
+    if user_data is not None:
+        return user_data, verified
+
+    async with redis_client.pipeline(transaction=False) as pipe:
+        pipe.get(session_id + ':user_data')
+        pipe.get(session_id + ':verified')
+
+        redis_user_data, redis_verified = await pipe.execute()
+
+    return decode_legacy_session(redis_user_data, redis_verified)
+
+
+async def async_check_session(session_uuid: str, user_uuid: str) -> Tuple[bool, str]:
+    '''
+    Verifies whether the session that the
+    user currently has is valid and correct.
+
+    session_uuid (str): the clients session uuid identifier
+    user_uuid (str): the users uuid
+
+    return (bool, str): success flag and message
+    '''
+
+    success, message, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return False, message
+
+    user_data, verified = await async_read_session(redis_client, session_uuid, user_uuid)
+
+    return validate_session_data(user_uuid, user_data, verified)
+
+
+async def async_get_session_user_data(session_uuid: str, user_uuid: str) -> Tuple[bool, str, Union[dict, None]]:
+    '''
+    Fetches the user data stored within an active session.
+
+    session_uuid (str): the clients session uuid identifier
+    user_uuid (str): the users uuid
+
+    return (bool, str, [dict, None]): success flag, message and the users data
+    '''
+
+    success, message, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return False, message, None
+
+    user_data, _ = await async_read_session(redis_client, session_uuid, user_uuid)
+
+    if user_data is None:
+        return False, 'Unable To Fetch User Session Data', None
+
+    return True, '', user_data
+
+
+async def async_update_user_email_session(session_uuid: str, user_uuid: str, new_email: str, verified: bool=True) -> Tuple[bool, str]:
+    '''
+    Updates the email and verified fields stored on the redis session.
+    Unlike update_user_email_session, sessions still using the
+    previous layout are not converted and are reported as not found.
+
+    session_uuid (str): the clients session uuid identifier
+    user_uuid (str): the users uuid
+    new_email (str): the users new email
+    verified (bool): specify whether to set the account as verified or unverified in redis [default - True]
+
+    return (bool, str): success flag and message
+    '''
+
+    success, message, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return False, message
+
+    fields = encode_session_fields({ 'email': new_email, SESSION_VERIFIED_FIELD: verified })
+    arguments = []
+
+    for field, value in fields.items():
+        arguments += [field, value]
+
+    update_fields = redis_client.register_script(UPDATE_SESSION_FIELDS_SCRIPT)
+
+    if await update_fields(keys=[session_key(session_uuid, user_uuid)], args=arguments) == -1:
+        return False, 'Unable To Fetch User Session Data'
+
+    await redis_client.publish(SESSION_INVALIDATION_CHANNEL, f'{session_uuid}:{user_uuid}')
+
+    return True, ''
@@ -3,11 +3,11 @@ This file handles the fetching and modification
 of session data stored within redis.
 '''
 
-import json
-
 from typing import Tuple, Union
 
 from src.backend_services.common.redis.redis import get_redis_conn
+from src.backend_services.common.redis.user_sessions import read_session, update_session_fields, \
+    SESSION_VERIFIED_FIELD
 
 
 def get_session_user_data(session_uuid: str, user_uuid: str) -> Tuple[bool, str, Union[dict, None]]:
@@ -25,14 +25,11 @@ def get_session_user_data(session_uuid: str, user_uuid: str) -> Tuple[bool, str,
     if not success:
         return False, message, None
 
-    session_id = f'sid:{session_uuid}:{user_uuid}'
-    redis_user_data = redis_client.get(session_id + ':user_data')
+    user_data, _ = read_session(redis_client, session_uuid, user_uuid)
 
-    if redis_user_data is None:
+    if user_data is None:
         return False, 'Unable To Fetch User Session Data', None
 
-    user_data = json.loads(redis_user_data.decode('utf-8'))
-
     return True, '', user_data
 
 
@@ -40,6 +37,7 @@ def update_user_email_session(session_uuid: str, user_uuid: str, new_email: str,
     '''
     Updates the email storeed on the redis session
     ensuring data is kept up to date, even when temporary.
+    Only the email and verified fields of the session are rewritten.
 
     session_uuid (str): the clients session uuid identifier
     user_uuid (str): the users uuid
@@ -53,22 +51,16 @@ def update_user_email_session(session_uuid: str, user_uuid: str, new_email: str,
     if not success:
         return False, message
 
-    session_id = f'sid:{session_uuid}:{user_uuid}'
-
-    expiry_time = redis_client.ttl(session_id + ':verified')
-    redis_user_data = redis_client.get(session_id + ':user_data')
-
-    user_data = json.loads(redis_user_data.decode('utf-8'))
-    user_data['email'] = new_email
-
-    if expiry_time != -1:
-        redis_client.set(session_id + ':verified', json.dumps(verified), ex=expiry_time)
-        redis_client.set(session_id + ':user_data', json.dumps(user_data), ex=expiry_time)
+    updated = update_session_fields(
+        redis_client,
+        session_uuid,
+        user_uuid,
+        { 'email': new_email, SESSION_VERIFIED_FIELD: verified }
+    )
 
-    else:
-        redis_client.set(session_id + ':verified', json.dumps(verified))
-        redis_client.set(session_id + ':user_data', json.dumps(user_data))
+    if not updated:
+        return False, 'Unable To Fetch User Session Data'
 
-    print('New User_Data In Redis:', user_data)
+    print('New User Email In Redis:', new_email)
 
     return True, ''
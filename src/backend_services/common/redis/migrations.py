@@ -0,0 +1,73 @@
+'''
+This file holds one-off migrations that are run against
+the redis server when the layout of stored data changes.
+
+Migrations can be run directly from the project root e.g.
+python -m src.backend_services.common.redis.migrations
+'''
+
+from typing import Tuple
+
+from src.backend_services.common.redis.redis import get_redis_conn
+from src.backend_services.common.redis.user_sessions import session_index_key
+
+
+def backfill_session_index(batch_size: int=500) -> Tuple[bool, str, int]:
+    '''
+    Creates the session index for every session that was created
+    before the index existed. The index inherits the remaining
+    time limit of the session it points to.
+
+    batch_size (int): how many keys to fetch and write per round trip [default - 500]
+
+    return (bool, str, int): success flag, message and the amount of indexes created
+    '''
+
+    success, message, redis_client = get_redis_conn()
+
+    if not success:
+        return False, message, 0
+
+    created = 0
+    batch = []
+
+    def write_batch(keys: list) -> int:
+        with redis_client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.ttl(key)
+
+            expiry_times = pipe.execute()
+
+        with redis_client.pipeline(transaction=False) as pipe:
+            for key, expiry_time in zip(keys, expiry_times):
+                # Key expired between scanning and fetching the ttl
+                if expiry_time == -2:
+                    continue
+
+                _, session_uuid, user_uuid, _ = key.decode('utf-8').split(':')
+
+                pipe.set(
+                    session_index_key(session_uuid),
+                    user_uuid,
+                    ex=expiry_time if expiry_time > 0 else None,
+                    nx=True
+                )
+
+            return sum(1 for result in pipe.execute() if result)
+
+    for key in redis_client.scan_iter(match='sid:*:*:user_data', count=batch_size, _type='string'):
+        batch.append(key)
+
+        if len(batch) >= batch_size:
+            created += write_batch(batch)
+            batch = []
+
+    if len(batch) != 0:
+        created += write_batch(batch)
+
+    return True, 'Session Index Backfilled', created
+
+
+if __name__ == '__main__':
+    success, message, created = backfill_session_index()
+    print(f'{message}: {created} Indexes Created' if success else message)
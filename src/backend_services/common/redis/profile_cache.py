@@ -0,0 +1,183 @@
+'''
+This file handles the read-through cache of user profiles.
+
+The profile returned by GetBasicAccountData rarely changes, so the
+serialized UserData message is cached under profile:v{version}:{user_uuid}.
+Profiles are cached when read from the database and rewritten or removed
+by every request that changes the user. A cache that can not be reached
+is treated as a miss so requests fall back to the database.
+
+Reads and misses are counted in the profile:stats hash, shared by
+every instance of the service, to measure the load taken off the database.
+The counters are sent in the same round trip as the read or the caching
+of the profile read from the database, so counting adds no round trips
+to requests served by the cache.
+'''
+
+import os
+
+from redis.exceptions import RedisError
+from typing import Union
+
+from src.backend_services.common.proto.user_login_pb2 import UserData
+from src.backend_services.common.redis.redis import get_redis_conn
+
+
+# Increased whenever the UserData message changes so old profiles are no longer read
+PROFILE_CACHE_VERSION = 1
+# How long (seconds) a cached profile is kept before being read from the database again
+PROFILE_CACHE_TTL = int(os.environ.get('PROFILE_CACHE_TTL', 3600))
+
+PROFILE_STATS_KEY = 'profile:stats'
+PROFILE_READ_FIELD = 'reads'
+PROFILE_MISS_FIELD = 'misses'
+
+
+def profile_key(user_uuid: str) -> str:
+    '''
+    Gets the key of the cached profile of the user.
+
+    user_uuid (str): the users uuid
+
+    return (str): the redis key of the profile
+    '''
+
+    return f'profile:v{PROFILE_CACHE_VERSION}:{user_uuid}'
+
+
+def decode_profile(cached_profile: Union[bytes, None]) -> Union[UserData, None]:
+    '''
+    Converts the cached bytes back into the users profile.
+
+    cached_profile ([bytes, None]): the serialized UserData message
+
+    return ([UserData, None]): the users profile, None when not cached
+    '''
+
+    if cached_profile is None:
+        return None
+
+    return UserData.FromString(cached_profile)
+
+
+def decode_profile_stats(stats: dict) -> dict:
+    '''
+    Converts the raw stats hash into the hit and miss counts.
+    Every read is counted, the hits are the reads that did not miss.
+
+    stats (dict): the raw hash fields and values returned from redis
+
+    return (dict): the hits, misses and hit ratio of the cache
+    '''
+
+    stats = { (field.decode('utf-8') if isinstance(field, bytes) else field): int(value) for field, value in stats.items() }
+
+    reads = stats.get(PROFILE_READ_FIELD, 0)
+    misses = min(stats.get(PROFILE_MISS_FIELD, 0), reads)
+    hits = reads - misses
+
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': hits / reads if reads != 0 else 0.0
+    }
+
+
+def get_cached_profile(user_uuid: str) -> Union[UserData, None]:
+    '''
+    Fetches the cached profile of the user, counting the read.
+    A miss is counted once the profile is read from the database, see cache_profile.
+
+    user_uuid (str): the users uuid
+
+    return ([UserData, None]): the users profile, None when not cached or redis is unavailable
+    '''
+
+    success, _, redis_client = get_redis_conn()
+
+    if not success:
+        return None
+
+    try:
+        with redis_client.pipeline(transaction=False) as pipe:
+            pipe.get(profile_key(user_uuid))
+            pipe.hincrby(PROFILE_STATS_KEY, PROFILE_READ_FIELD, 1)
+
+            cached_profile, _ = pipe.execute()
+
+    except RedisError:
+        return None
+
+    return decode_profile(cached_profile)
+
+
+def cache_profile(user: UserData, miss: bool=False) -> bool:
+    '''
+    Caches the profile of the user, replacing any previous profile.
+
+    user (UserData): the users profile
+    miss (bool): whether the profile was read from the database after a cache miss [default - False]
+
+    return (bool): whether the profile was cached
+    '''
+
+    success, _, redis_client = get_redis_conn()
+
+    if not success:
+        return False
+
+    try:
+        with redis_client.pipeline(transaction=False) as pipe:
+            pipe.set(profile_key(user.uuid), user.SerializeToString(), ex=PROFILE_CACHE_TTL)
+
+            if miss:
+                pipe.hincrby(PROFILE_STATS_KEY, PROFILE_MISS_FIELD, 1)
+
+            pipe.execute()
+
+    except RedisError:
+        return False
+
+    return True
+
+
+def count_profile_miss() -> None:
+    '''
+    Counts a miss without caching a profile, for reads of users that do not exist.
+
+    return (None):
+    '''
+
+    success, _, redis_client = get_redis_conn()
+
+    if not success:
+        return
+
+    try:
+        redis_client.hincrby(PROFILE_STATS_KEY, PROFILE_MISS_FIELD, 1)
+
+    except RedisError:
+        pass
+
+
+def invalidate_profile(user_uuid: str) -> bool:
+    '''
+    Removes the cached profile of the user so the next read fetches it from the database.
+
+    user_uuid (str): the users uuid
+
+    return (bool): whether the cache was reached
+    '''
+
+    success, _, redis_client = get_redis_conn()
+
+    if not success:
+        return False
+
+    try:
+        redis_client.delete(profile_key(user_uuid))
+
+    except RedisError:
+        return False
+
+    return True
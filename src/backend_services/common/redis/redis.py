@@ -1,13 +1,31 @@
 '''
 This file holds the method to get a connection to the redis server.
+
+A single connection pool is shared by every caller within the process.
+Clients handed out by get_redis_conn borrow a connection from the pool
+for each command and return it straight after, meaning no new TCP or
+AUTH handshake is made per operation.
+
+The server is pinged at most once per REDIS_HEALTH_CHECK_INTERVAL,
+and again by the next caller after any command fails to reach it,
+so callers are still told when redis is unavailable.
+
+Services can report how busy their pool is on an interval. The counts
+are stored in redis under metrics:redis_pool:{instance}, where the
+gateway metrics route reads them, so the pool can be sized against
+the worker threads of each service.
 '''
 
+import json
 import os
 import redis
+import socket
+import threading
+import time
 
 from redis import Redis
-from redis.exceptions import ConnectionError, AuthenticationError
-from typing import Tuple, Union
+from redis.exceptions import ConnectionError, AuthenticationError, TimeoutError
+from typing import Self, Tuple, Union
 
 
 REDIS_HOST = os.environ.get('REDIS_HOST')
@@ -18,35 +36,288 @@ REDIS_DB = os.environ.get('REDIS_DB')
 
 REDIS_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
 
+# Pool configuration
+# Max connections should be at least the amount of worker
+# threads that can use redis at once (e.g. ACCOUNT_MAX_WORKERS)
+REDIS_MAX_CONNECTIONS = int(os.environ.get('REDIS_MAX_CONNECTIONS', 50))
+# How long (seconds) a caller waits for a free connection before failing
+REDIS_POOL_TIMEOUT = float(os.environ.get('REDIS_POOL_TIMEOUT', 5))
+# Idle connections are pinged after this many seconds before being reused
+REDIS_HEALTH_CHECK_INTERVAL = int(os.environ.get('REDIS_HEALTH_CHECK_INTERVAL', 30))
+REDIS_SOCKET_TIMEOUT = float(os.environ.get('REDIS_SOCKET_TIMEOUT', 5))
+REDIS_SOCKET_CONNECT_TIMEOUT = float(os.environ.get('REDIS_SOCKET_CONNECT_TIMEOUT', 5))
+# How often (seconds) a service reports the usage of its pool, 0 disables the reporter
+REDIS_POOL_STATS_INTERVAL = float(os.environ.get('REDIS_POOL_STATS_INTERVAL', 30))
+
+REDIS_POOL_STATS_PREFIX = 'metrics:redis_pool:'
+
+
+_pool = None
+_client = None
+_pool_lock = threading.Lock()
+
+_stats_stop_event = threading.Event()
+_stats_thread = None
+
+# The redis server is assumed reachable until this time (monotonic seconds)
+_healthy_until = 0.0
+
+
+class SharedRedis(Redis):
+    '''
+    The client shared by every caller within the process.
+    A command unable to reach the server makes the next
+    get_redis_conn call ping the server before handing it out.
+    '''
+
+    def execute_command(cls: Self, *args, **options):
+        '''
+        Runs a single command, marking the server as unchecked when it can not be reached.
+
+        cls (Self): the SharedRedis class
+        args (Any): the command and its arguments
+        options (Any): the options of the command
+
+        return (Any): the response of the server
+        '''
+
+        global _healthy_until
+
+        try:
+            return super().execute_command(*args, **options)
+
+        except (ConnectionError, TimeoutError):
+            _healthy_until = 0.0
+            raise
+
+
+def create_redis_pool() -> redis.BlockingConnectionPool:
+    '''
+    Creates the connection pool used by all redis clients within the process.
+    A blocking pool is used so that when every connection is in use,
+    callers wait for one to be released instead of erroring straight away.
+
+    return (BlockingConnectionPool): the newly created connection pool
+    '''
+
+    return redis.BlockingConnectionPool.from_url(
+        REDIS_URL,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=REDIS_SOCKET_CONNECT_TIMEOUT,
+        socket_keepalive=True
+    )
+
 
 def get_redis_conn() -> Tuple[bool, str, Union[Redis, None]]:
     '''
     This gets the connection to the redis server and returns
     the object used to communicate to the server.
 
+    The client is created once and shared between all threads.
+    The server is pinged when the pool is first created, once every
+    REDIS_HEALTH_CHECK_INTERVAL and after a command failed to reach it.
+    While the server can not be reached a failed success flag is returned.
+
     returns (bool, str, [Redis, None]): success flag, message and a redis object to the redis server
     '''
 
+    global _pool, _client, _healthy_until
+
+    if _client is not None and time.monotonic() < _healthy_until:
+        return True, 'Connected Successfully', _client
+
     status = False
     message = 'Connected Successfully'
     redis_client = None
 
-    try:
-        redis_client = redis.from_url(REDIS_URL)
-        redis_client.ping()
+    with _pool_lock:
+        if _client is not None and time.monotonic() < _healthy_until:
+            return True, message, _client
+
+        try:
+            pool = _pool if _pool is not None else create_redis_pool()
+            redis_client = _client if _client is not None else SharedRedis(connection_pool=pool)
+            redis_client.ping()
 
-        status = True
+            _pool = pool
+            _client = redis_client
+            _healthy_until = time.monotonic() + REDIS_HEALTH_CHECK_INTERVAL
 
-    except (ValueError, TypeError):
-        message = 'Invalid URL Provided'
+            status = True
 
-    except ConnectionError:
-        message = 'Unable To Connect To Redis Server'
+        except (ValueError, TypeError):
+            message = 'Invalid URL Provided'
 
-    except AuthenticationError:
-        message = 'Invalid Redis Authentication'
+        except (ConnectionError, TimeoutError):
+            message = 'Unable To Connect To Redis Server'
 
-    except Exception:
-        message = 'Unknown Error When Connecting To Redis Occurred'
+        except AuthenticationError:
+            message = 'Invalid Redis Authentication'
+
+        except Exception:
+            message = 'Unknown Error When Connecting To Redis Occurred'
+
+    if not status:
+        redis_client = None
 
     return status, message, redis_client
+
+
+def get_redis_pool_stats() -> dict:
+    '''
+    Fetches the usage of the shared connection pool.
+    Used to size REDIS_MAX_CONNECTIONS against the amount of worker
+    threads a service runs with, in_use_connections reaching
+    max_connections means callers are waiting on a connection.
+
+    The counts are read from the internals of the redis-py pool without
+    its lock, so they are a snapshot. They are None when the installed
+    redis-py stores its connections differently.
+
+    return (dict): whether the pool has been created, its limit and the created, in use and available connections
+    '''
+
+    stats = {
+        'initialised': _pool is not None,
+        'max_connections': REDIS_MAX_CONNECTIONS,
+        'created_connections': 0,
+        'in_use_connections': 0,
+        'available_connections': 0
+    }
+
+    pool = _pool
+
+    if pool is None:
+        return stats
+
+    try:
+        # The blocking pool queues created connections that are free, and None for connections yet to be created
+        created = len(pool._connections)
+        available = sum(1 for connection in list(pool.pool.queue) if connection is not None)
+
+    except AttributeError:
+        return { **stats, 'created_connections': None, 'in_use_connections': None, 'available_connections': None }
+
+    stats['created_connections'] = created
+    stats['in_use_connections'] = created - available
+    stats['available_connections'] = available
+
+    return stats
+
+
+def redis_pool_stats_key(service_name: str) -> str:
+    '''
+    Gets the key holding the pool usage of this instance of the service.
+
+    service_name (str): the name of the service
+
+    return (str): the redis key of the pool usage
+    '''
+
+    return f'{REDIS_POOL_STATS_PREFIX}{service_name}:{socket.gethostname()}:{os.getpid()}'
+
+
+def publish_redis_pool_stats(service_name: str, interval: float=REDIS_POOL_STATS_INTERVAL) -> bool:
+    '''
+    Stores the usage of the pool in redis for the gateway metrics route.
+    The usage expires when the service stops reporting it.
+
+    service_name (str): the name of the service
+    interval (float): how often (seconds) the usage is reported [default - REDIS_POOL_STATS_INTERVAL]
+
+    return (bool): whether the usage was stored
+    '''
+
+    success, _, redis_client = get_redis_conn()
+
+    if not success:
+        return False
+
+    stats = get_redis_pool_stats()
+
+    if stats['in_use_connections'] is not None and stats['in_use_connections'] >= stats['max_connections']:
+        print('WARNING: Every Redis Connection Is In Use. Increase REDIS_MAX_CONNECTIONS')
+
+    try:
+        redis_client.set(redis_pool_stats_key(service_name), json.dumps(stats), ex=max(int(interval * 3), 1))
+
+    except redis.RedisError:
+        return False
+
+    return True
+
+
+def run_pool_stats_reporter(service_name: str, interval: float) -> None:
+    '''
+    Reports the usage of the pool on an interval until the reporter is stopped.
+
+    service_name (str): the name of the service
+    interval (float): how often (seconds) the usage is reported
+
+    return (None):
+    '''
+
+    while not _stats_stop_event.wait(interval):
+        publish_redis_pool_stats(service_name, interval)
+
+
+def start_pool_stats_reporter(service_name: str, interval: float=REDIS_POOL_STATS_INTERVAL) -> Union[threading.Thread, None]:
+    '''
+    Starts reporting the usage of the pool on a background thread.
+
+    service_name (str): the name of the service
+    interval (float): how often (seconds) the usage is reported [default - REDIS_POOL_STATS_INTERVAL]
+
+    return ([Thread, None]): the started thread, None when the reporter is disabled
+    '''
+
+    global _stats_thread
+
+    if interval <= 0:
+        return None
+
+    _stats_stop_event.clear()
+
+    _stats_thread = threading.Thread(target=run_pool_stats_reporter, args=(service_name, interval), name='redis-pool-stats', daemon=True)
+    _stats_thread.start()
+
+    return _stats_thread
+
+
+def stop_pool_stats_reporter() -> None:
+    '''
+    Stops reporting the usage of the pool.
+
+    return (None):
+    '''
+
+    global _stats_thread
+
+    _stats_stop_event.set()
+
+    if _stats_thread is not None:
+        _stats_thread.join()
+
+    _stats_thread = None
+
+
+def close_redis_pool() -> None:
+    '''
+    Disconnects every connection within the shared pool.
+    The next call to get_redis_conn will create a new pool.
+
+    return (None):
+    '''
+
+    global _pool, _client, _healthy_until
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.disconnect()
+
+        _pool = None
+        _client = None
+        _healthy_until = 0.0
@@ -7,17 +7,257 @@ import json
 import uuid
 
 from datetime import datetime, timedelta, UTC
-from typing import Tuple
+from redis import Redis
+from redis.client import Pipeline
+from typing import List, Tuple, Union
 
 from src.backend_services.account.database.models import User
 from src.backend_services.common.proto.user_login_pb2 import UserData
 from src.backend_services.common.redis.redis import get_redis_conn
 
 
+SESSION_EXPIRY = 3600 # 1 hour expiry
+
+# Sessions are stored as one hash per session (sid:{session_uuid}:{user_uuid})
+# with a field per user detail plus a verified field. Each field value is json encoded.
+# Sessions created before this layout used two string keys
+# (sid:...:user_data and sid:...:verified) and are still read until they expire.
+SESSION_VERIFIED_FIELD = 'verified'
+
+# Every change to a session is published on this channel as
+# "{session_uuid}:{user_uuid}" so services caching sessions can drop them
+SESSION_INVALIDATION_CHANNEL = 'session:invalidate'
+
+# Only updates the hash fields when the session still exists,
+# otherwise HSET would create a new session without a time limit
+UPDATE_SESSION_FIELDS_SCRIPT = '''
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return -1
+end
+return redis.call('HSET', KEYS[1], unpack(ARGV))
+'''
+
+
+def session_key(session_uuid: str, user_uuid: str) -> str:
+    '''
+    Gets the key of the hash holding the session data.
+
+    session_uuid (str): the clients session uuid identifier
+    user_uuid (str): the users uuid
+
+    return (str): the redis key of the session
+    '''
+
+    return f'sid:{session_uuid}:{user_uuid}'
+
+
+def session_index_key(session_uuid: str) -> str:
+    '''
+    Gets the key of the index that maps a session uuid
+    to the uuid of the user that owns the session.
+
+    session_uuid (str): the clients session uuid identifier
+
+    return (str): the redis key of the session index
+    '''
+
+    return f'session:{session_uuid}'
+
+
+def publish_session_invalidation(redis_client: Union[Redis, Pipeline], session_uuid: str, user_uuid: str) -> None:
+    '''
+    Notifies every service caching sessions that the session has changed.
+    When given a pipeline the message is sent as part of the pipeline.
+
+    redis_client ([Redis, Pipeline]): the connection or pipeline to the redis server
+    session_uuid (str): the clients session uuid identifier
+    user_uuid (str): the users uuid
+
+    return (None):
+    '''
+
+    redis_client.publish(SESSION_INVALIDATION_CHANNEL, f'{session_uuid}:{user_uuid}')
+
+
+def encode_session_fields(fields: dict) -> dict:
+    '''
+    Json encodes every value so the original
+    data types are kept when read back from redis.
+
+    fields (dict): the session fields and their values
+
+    return (dict): the fields with their values json encoded
+    '''
+
+    return { field: json.dumps(value) for field, value in fields.items() }
+
+
+def decode_session_fields(fields: dict) -> Tuple[Union[dict, None], bool]:
+    '''
+    Converts the raw hash returned by redis back into the
+    users data and the verified flag of the session.
+
+    fields (dict): the raw hash fields and values returned from redis
+
+    return ([dict, None], bool): the users data and whether the session is verified
+    '''
+
+    if not fields:
+        return None, False
+
+    user_data = {}
+    verified = False
+
+    for field, value in fields.items():
+        if isinstance(field, bytes):
+            field = field.decode('utf-8')
+
+        if field == SESSION_VERIFIED_FIELD:
+            verified = json.loads(value)
+
+        else:
+            user_data[field] = json.loads(value)
+
+    return user_data, verified
+
+
+def decode_legacy_session(redis_user_data: Union[bytes, None], redis_verified: Union[bytes, None]) -> Tuple[Union[dict, None], bool]:
+    '''
+    Converts the two string keys of the previous session
+    layout into the users data and the verified flag.
+
+    redis_user_data (bytes, None): the json encoded users data
+    redis_verified (bytes, None): the json encoded verified flag
+
+    return ([dict, None], bool): the users data and whether the session is verified
+    '''
+
+    if redis_user_data is None or redis_verified is None:
+        return None, False
+
+    user_data = json.loads(redis_user_data.decode('utf-8'))
+    verified = json.loads(redis_verified.decode('utf-8'))
+
+    return user_data, verified
+
+
+def read_session(redis_client: Redis, session_uuid: str, user_uuid: str) -> Tuple[Union[dict, None], bool]:
+    '''
+    Reads the users data and verified flag of a session.
+    Falls back to the previous two key layout when no session hash exists.
+
+    redis_client (Redis): the connection to the redis server
+    session_uuid (str): the clients session uuid identifier
+    user_uuid (str): the users uuid
+
+    return ([dict, None], bool): the users data (None when no session exists) and whether the session is verified
+    '''
+
+    session_id = session_key(session_uuid, user_uuid)
+    user_data, verified = decode_session_fields(redis_client.hgetall(session_id))
+
+    if user_data is not None:
+        return user_data, verified
+
+    with redis_client.pipeline(transaction=False) as pipe:
+        pipe.get(session_id + ':user_data')
+        pipe.get(session_id + ':verified')
+
+        redis_user_data, redis_verified = pipe.execute()
+
+    return decode_legacy_session(redis_user_data, redis_verified)
+
+
+def update_session_fields(redis_client: Redis, session_uuid: str, user_uuid: str, fields: dict) -> bool:
+    '''
+    Updates individual fields of a session without rewriting the whole session.
+    The remaining time limit of the session is kept.
+    Sessions still using the previous layout are converted into a session hash.
+
+    redis_client (Redis): the connection to the redis server
+    session_uuid (str): the clients session uuid identifier
+    user_uuid (str): the users uuid
+    fields (dict): the fields and their new values (user detail names or verified)
+
+    return (bool): whether the session existed and was updated
+    '''
+
+    session_id = session_key(session_uuid, user_uuid)
+    encoded_fields = encode_session_fields(fields)
+
+    arguments = []
+
+    for field, value in encoded_fields.items():
+        arguments += [field, value]
+
+    update_fields = redis_client.register_script(UPDATE_SESSION_FIELDS_SCRIPT)
+
+    if update_fields(keys=[session_id], args=arguments) != -1:
+        publish_session_invalidation(redis_client, session_uuid, user_uuid)
+
+        return True
+
+    with redis_client.pipeline(transaction=False) as pipe:
+        pipe.ttl(session_id + ':verified')
+        pipe.get(session_id + ':user_data')
+        pipe.get(session_id + ':verified')
+
+        expiry_time, redis_user_data, redis_verified = pipe.execute()
+
+    user_data, verified = decode_legacy_session(redis_user_data, redis_verified)
+
+    if user_data is None:
+        return False
+
+    session_fields = { **user_data, SESSION_VERIFIED_FIELD: verified, **fields }
+
+    with redis_client.pipeline(transaction=True) as pipe:
+        pipe.hset(session_id, mapping=encode_session_fields(session_fields))
+
+        if expiry_time > 0:
+            pipe.expire(session_id, expiry_time)
+
+        pipe.delete(session_id + ':user_data', session_id + ':verified')
+        publish_session_invalidation(pipe, session_uuid, user_uuid)
+        pipe.execute()
+
+    return True
+
+
+def store_session(pipe: Pipeline, session_uuid: str, user_uuid: str, user_data: User) -> int:
+    '''
+    Queues the session hash and the session index onto a redis pipeline.
+    The pipeline must be transactional so that the session
+    never exists without its time limit. Both blocking and asyncio
+    pipelines can be given as queuing commands does not wait on redis.
+
+    pipe (Pipeline): the redis pipeline to queue the commands on
+    session_uuid (str): the clients session uuid identifier
+    user_uuid (str): the users uuid
+    user_data (User): an sqlalchemy object containing one row for the specified users data
+
+    return (int): the unix time the session expires at
+    '''
+
+    session_id = session_key(session_uuid, user_uuid)
+
+    session_fields = user_to_json(user_data)
+    session_fields[SESSION_VERIFIED_FIELD] = user_data.is_verified()
+
+    pipe.hset(session_id, mapping=encode_session_fields(session_fields))
+    pipe.expire(session_id, SESSION_EXPIRY)
+    pipe.set(session_index_key(session_uuid), user_uuid, ex=SESSION_EXPIRY)
+
+    expiry_time = datetime.now(UTC) + timedelta(seconds=SESSION_EXPIRY)
+
+    return int(expiry_time.timestamp())
+
+
 def create_session(user_uuid: str, user_data: User) -> Tuple[str, int]:
     '''
-    Creates two session instances with an hour time limit.
-    An instance each for the user data and whether the user has been verified.
+    Creates a session with an hour time limit.
+    The session holds the user data and whether the user has been verified.
+    The session is written in a single round trip to redis.
 
     user_uuid (str): the users uuid
     user_data (User): an sqlalchemy object containing one row for the specified users data
@@ -31,27 +271,50 @@ def create_session(user_uuid: str, user_data: User) -> Tuple[str, int]:
         return False, message
 
     session_uuid = str(uuid.uuid4())
-    session_id = f'sid:{session_uuid}:{user_uuid}'
-
-    redis_client.set(session_id + ':user_data', json.dumps(user_to_json(user_data)))
-    redis_client.set(session_id + ':verified', json.dumps(user_data.is_verified()))
 
-    redis_client.expire(session_id + ':user_data', 3600) # 1 hour expiry
-    redis_client.expire(session_id + ':verified', 3600) # 1 hour expiry
+    with redis_client.pipeline(transaction=True) as pipe:
+        unix_time = store_session(pipe, session_uuid, user_uuid, user_data)
+        pipe.execute()
 
-    expiry_time = datetime.now(UTC) + timedelta(hours=1)
-    unix_time = int(expiry_time.timestamp())
-
-    print('Stored User Session Data:', redis_client.get(session_id + ':user_data'))
     print('Session UUID:', session_uuid)
 
     return session_uuid, unix_time
 
 
+def create_sessions(users: List[User]) -> Tuple[bool, str, List[Tuple[str, int]]]:
+    '''
+    Creates a session for every provided user within one redis pipeline.
+    Used for load testing and bulk re-authentication of users.
+
+    users (list[User]): sqlalchemy objects each containing one row of a users data
+
+    return (bool, str, list[(str, int)]): success flag, message and the session uuid and expiry time per user
+    '''
+
+    success, message, redis_client = get_redis_conn()
+
+    if not success:
+        return False, message, []
+
+    sessions = []
+
+    with redis_client.pipeline(transaction=True) as pipe:
+        for user in users:
+            session_uuid = str(uuid.uuid4())
+            unix_time = store_session(pipe, session_uuid, user.uuid, user)
+
+            sessions.append((session_uuid, unix_time))
+
+        pipe.execute()
+
+    return True, f'{len(sessions)} Sessions Created', sessions
+
+
 def update_session(session_uuid: str, user_uuid: str, user_data: User) -> Tuple[str, int]:
     '''
-    Updates the two existing session instances with an hour time limit.
-    An instance each for the user data and whether the user has been verified.
+    Updates the existing session and resets its hour time limit.
+    The session holds the user data and whether the user has been verified.
+    The session is written in a single round trip to redis.
 
     session_uuid (str): the clients session uuid identifier
     user_uuid (str): the users uuid
@@ -65,18 +328,16 @@ def update_session(session_uuid: str, user_uuid: str, user_data: User) -> Tuple[
     if not success:
         return False, message
 
-    session_id = f'sid:{session_uuid}:{user_uuid}'
-
-    redis_client.set(session_id + ':user_data', json.dumps(user_to_json(user_data)))
-    redis_client.set(session_id + ':verified', json.dumps(user_data.is_verified()))
+    session_id = session_key(session_uuid, user_uuid)
 
-    redis_client.expire(session_id + ':user_data', 3600) # 1 hour expiry
-    redis_client.expire(session_id + ':verified', 3600) # 1 hour expiry
+    with redis_client.pipeline(transaction=True) as pipe:
+        # Removes the session if it was stored using the previous layout
+        pipe.delete(session_id + ':user_data', session_id + ':verified')
 
-    expiry_time = datetime.now(UTC) + timedelta(hours=1)
-    unix_time = int(expiry_time.timestamp())
+        unix_time = store_session(pipe, session_uuid, user_uuid, user_data)
+        publish_session_invalidation(pipe, session_uuid, user_uuid)
+        pipe.execute()
 
-    print('Stored User Session Data:', redis_client.get(session_id + ':user_data'))
     print('Session UUID:', session_uuid)
 
     return session_uuid, unix_time
@@ -97,12 +358,17 @@ def delete_session(session_uuid: str, user_uuid: str) -> Tuple[bool, str]:
     if not success:
         return False, message
     
-    session_id = f'sid:{session_uuid}:{user_uuid}'
-    
-    u_data = redis_client.delete(session_id + ':user_data')
-    ver = redis_client.delete(session_id + ':verified')
+    session_id = session_key(session_uuid, user_uuid)
+
+    with redis_client.pipeline(transaction=True) as pipe:
+        pipe.delete(session_id)
+        pipe.delete(session_id + ':user_data', session_id + ':verified')
+        pipe.delete(session_index_key(session_uuid))
+        publish_session_invalidation(pipe, session_uuid, user_uuid)
+
+        session_deleted, legacy_deleted, _, _ = pipe.execute()
 
-    success = bool(u_data and ver)
+    success = bool(session_deleted or legacy_deleted == 2)
 
     if not success:
         return False, 'Unable To Log Out'
@@ -110,6 +376,28 @@ def delete_session(session_uuid: str, user_uuid: str) -> Tuple[bool, str]:
     return True, 'User Logged Out'
 
 
+def get_session_user_uuid(session_uuid: str) -> Tuple[bool, str, Union[str, None]]:
+    '''
+    Fetches the uuid of the user that owns the session using the session index.
+
+    session_uuid (str): the clients session uuid identifier
+
+    return (bool, str, [str, None]): success flag, message and the users uuid
+    '''
+
+    success, message, redis_client = get_redis_conn()
+
+    if not success:
+        return False, message, None
+
+    user_uuid = redis_client.get(session_index_key(session_uuid))
+
+    if user_uuid is None:
+        return False, 'Session Either Expired Or Never Existed', None
+
+    return True, '', user_uuid.decode('utf-8')
+
+
 def check_session(session_uuid: str, user_uuid: str) -> Tuple[bool, str]:
     '''
     Verifies whether the session that the
@@ -121,20 +409,30 @@ def check_session(session_uuid: str, user_uuid: str) -> Tuple[bool, str]:
     return (bool, str): success flag and message
     '''
 
-    session_id = f'sid:{session_uuid}:{user_uuid}'
     success, message, redis_client = get_redis_conn()
 
     if not success:
         return False, message
 
-    redis_user_data = redis_client.get(session_id + ':user_data')
-    redis_verified = redis_client.get(session_id + ':verified')
+    user_data, verified = read_session(redis_client, session_uuid, user_uuid)
 
-    if redis_user_data is None or redis_verified is None:
-        return False, 'Session Expired Or Invalid. Please Log In Again'
+    return validate_session_data(user_uuid, user_data, verified)
 
-    user_data = json.loads(redis_user_data.decode('utf-8'))
-    verified = json.loads(redis_verified.decode('utf-8'))
+
+def validate_session_data(user_uuid: str, user_data: Union[dict, None], verified: bool) -> Tuple[bool, str]:
+    '''
+    Checks that the session data read from redis
+    belongs to the user and has been verified.
+
+    user_uuid (str): the users uuid
+    user_data ([dict, None]): the users data stored on the session
+    verified (bool): whether the session has been verified
+
+    return (bool, str): success flag and message
+    '''
+
+    if user_data is None:
+        return False, 'Session Expired Or Invalid. Please Log In Again'
 
     if user_data['uuid'] != user_uuid:
         return False, 'Session Expired Or Invalid. Please Log In Again'
@@ -142,7 +440,7 @@ def check_session(session_uuid: str, user_uuid: str) -> Tuple[bool, str]:
     if not verified:
         return False, 'Verify Your Account Before Performing This Action'
 
-    return True, 'Valid Session' 
+    return True, 'Valid Session'
 
 
 def user_to_json(user: UserData) -> dict:
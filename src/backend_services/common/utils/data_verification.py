@@ -2,13 +2,20 @@
 File containing a class to validate all types of data.
 '''
 
-import dns.resolver
+import calendar
+import copy
+import re
 import uuid
 
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from functools import partial
+from datetime import date, datetime, timedelta, timezone
 from enum import Enum
 from math import inf as INFINITY
-from typing import Any, Callable, Self, Tuple, TypeVar
+from typing import Any, Awaitable, Callable, Self, Tuple, TypeVar, Union
+
+from src.backend_services.common.utils.domain_cache import async_check_email_domain, check_email_domain, normalise_domain, DomainStatus
+from src.backend_services.common.utils.field_checks import async_run_checks, run_checks
 
 ENUM_CLASS = TypeVar('Enum Class', bound=Enum)
 
@@ -78,6 +85,237 @@ class NullBooleanEnum(Enum):
         return None
 
 
+# Character classes returned by classify_characters
+CHAR_LOWER_CASE = 1
+CHAR_UPPER_CASE = 2
+CHAR_NUMBER = 4
+CHAR_SYMBOL = 8
+
+
+def classify_character(char: str) -> int:
+    '''
+    Finds the character classes of a single character.
+
+    char (str): the character to classify
+
+    return (int): the CHAR_* flags of the character
+    '''
+
+    char_classes = 0
+
+    if char.islower():
+        char_classes |= CHAR_LOWER_CASE
+
+    if char.isupper():
+        char_classes |= CHAR_UPPER_CASE
+
+    if char.isdigit():
+        char_classes |= CHAR_NUMBER
+
+    if not char.isalnum():
+        char_classes |= CHAR_SYMBOL
+
+    return char_classes
+
+
+# The classes of every ascii character, indexed by the character code
+ASCII_CLASS_TABLE = bytes(classify_character(chr(code)) for code in range(128)) + bytes(128)
+
+
+def classify_characters(data: str) -> int:
+    '''
+    Finds every character class within the string in a single pass.
+    Ascii strings are translated to their classes by a precomputed
+    table, otherwise each unique character is classified once.
+
+    data (str): the string to classify
+
+    return (int): the CHAR_* flags found within the string
+    '''
+
+    char_classes = 0
+
+    if data.isascii():
+        for found_classes in set(data.encode('ascii').translate(ASCII_CLASS_TABLE)):
+            char_classes |= found_classes
+
+        return char_classes
+
+    for char in set(data):
+        char_classes |= classify_character(char)
+
+    return char_classes
+
+
+@dataclass(frozen=True, slots=True)
+class StringRestrictions:
+    '''
+    The parsed restrictions of a string, see verify_string_data.
+    '''
+
+    min_len: Union[int, float] = 0
+    max_len: Union[int, float] = INFINITY
+    lower_case: CharReqEnum = CharReqEnum.DEFAULT
+    upper_case: CharReqEnum = CharReqEnum.DEFAULT
+    numbers: CharReqEnum = CharReqEnum.DEFAULT
+    symbols: CharReqEnum = CharReqEnum.DEFAULT
+
+
+    def checks_characters(cls: Self) -> bool:
+        '''
+        Checks whether any character requirement has to be validated.
+
+        cls (Self): the StringRestrictions class
+
+        return (bool): character requirement flag
+        '''
+
+        return not (cls.lower_case == cls.upper_case == cls.numbers == cls.symbols == CharReqEnum.DEFAULT)
+
+
+@dataclass(frozen=True, slots=True)
+class NumberRestrictions:
+    '''
+    The parsed restrictions of a number, see verify_number_data.
+    '''
+
+    data_type: type = int
+    min_num: Union[int, float] = -INFINITY
+    max_num: Union[int, float] = INFINITY
+
+
+@dataclass(frozen=True, slots=True)
+class DatetimeRestrictions:
+    '''
+    The parsed restrictions of a datetime string, see verify_datetime_string.
+    A format of None means no date or time restriction was given.
+    '''
+
+    format: Union[str, None] = None
+    min_val: Union[datetime, None] = None
+    max_val: Union[datetime, None] = None
+
+
+# Dates relative to today, such as -110y or +2w (days, weeks, months or years)
+RELATIVE_DATE_PATTERN = re.compile(r'^([+-]?\d+)([dwmy])$')
+
+
+def is_relative_date(value: Any) -> bool:
+    '''
+    Checks whether the value is a date relative to today.
+
+    value (Any): the date restriction value
+
+    return (bool): relative date flag
+    '''
+
+    return isinstance(value, str) and RELATIVE_DATE_PATTERN.match(value) is not None
+
+
+def resolve_relative_date(value: str, today: date) -> str:
+    '''
+    Converts a relative date into a date string.
+    Moving by months or years onto a day that does not
+    exist uses the last day of that month instead.
+
+    value (str): the relative date, such as -9y
+    today (date): the date the value is relative to
+
+    return (str): the date formatted as YYYY-MM-DD
+    '''
+
+    amount, unit = RELATIVE_DATE_PATTERN.match(value).groups()
+    amount = int(amount)
+
+    if unit == 'd':
+        return (today + timedelta(days=amount)).strftime("%Y-%m-%d")
+
+    if unit == 'w':
+        return (today + timedelta(weeks=amount)).strftime("%Y-%m-%d")
+
+    if unit == 'y':
+        amount *= 12
+
+    month_index = today.year * 12 + today.month - 1 + amount
+    year, month = divmod(month_index, 12)
+    day = min(today.day, calendar.monthrange(year, month + 1)[1])
+
+    return date(year, month + 1, day).strftime("%Y-%m-%d")
+
+
+def combine_field_results(results: list) -> Tuple[bool, list]:
+    '''
+    Combines the results of each field into the result of the request.
+    Errors of optional fields are returned without failing the request.
+
+    results (list): the optional flag, success flag and errors of each field
+
+    return (bool, list): a success flag and the errors detected are returned
+    '''
+
+    total_errors = []
+    optional_errors = []
+
+    for optional, success, errors in results:
+        if optional:
+            optional_errors += errors
+
+        elif len(errors) != 0 and not success:
+            total_errors += errors
+
+    if len(total_errors) != 0:
+        return False, total_errors + optional_errors
+
+    return True, optional_errors
+
+
+class AdaptiveDatetimeRestrictions():
+    '''
+    Datetime restrictions holding dates relative to today.
+    The restrictions are parsed once and only parsed
+    again once the day has changed.
+    '''
+
+    def __init__(cls: Self, verifier: 'DataVerification', restrictions: dict) -> None:
+        '''
+        Stores the restrictions and parses them for today.
+
+        cls (Self): the AdaptiveDatetimeRestrictions class
+        verifier (DataVerification): the verification class parsing the restrictions
+        restrictions (dict): the datetime restrictions, see verify_datetime_string
+
+        return (None):
+        '''
+
+        cls.verifier = verifier
+        cls.restrictions = copy.deepcopy(restrictions)
+        cls.current = None
+
+        cls.get()
+
+
+    def get(cls: Self) -> DatetimeRestrictions:
+        '''
+        Fetches the restrictions parsed for today.
+
+        cls (Self): the AdaptiveDatetimeRestrictions class
+
+        return (DatetimeRestrictions): the parsed restrictions
+        '''
+
+        today = date.today()
+        # Swapped as a single tuple so concurrent requests never see a mismatched day
+        current = cls.current
+
+        if current is not None and current[0] == today:
+            return current[1]
+
+        parsed = cls.verifier.parse_datetime_restrictions(cls.restrictions, today)
+        cls.current = (today, parsed)
+
+        return parsed
+
+
 class DataVerification():
     '''
     This class contains all the functions that are
@@ -238,6 +476,46 @@ class DataVerification():
         return data_errors
 
 
+    def validate_char_class(
+            cls: Self,
+            char_classes: int,
+            char_class: int,
+            requirement: ENUM_CLASS,
+            name: str,
+            char_req: str,
+            data_errors: list
+        ) -> list:
+
+        '''
+        The same check as validate_char_requirement, using the character
+        classes already found by classify_characters instead of
+        scanning the string again.
+
+        cls (Self): the verification class
+        char_classes (int): the CHAR_* flags found within the string
+        char_class (int): the CHAR_* flag to check
+        requirement (ENUM_CLASS): a specified class state. The class holds custom enum values
+        name (str): the name of the variable
+        char_req (str): the name of the requirement
+        data_errors (list): the total errors
+
+        return (list): the errors when applying restrictions
+        '''
+
+        if requirement == CharReqEnum.DEFAULT:
+            return data_errors
+
+        has_char = bool(char_classes & char_class)
+
+        if has_char and requirement == CharReqEnum.NONE:
+            data_errors.append(f'{name} must not contain {char_req}')
+
+        elif not has_char and requirement == CharReqEnum.MUST:
+            data_errors.append(f'{name} must contain at least one {char_req}')
+
+        return data_errors
+
+
     def verify_data(cls: Self, data: dict) -> Tuple[bool, list]:
         '''
         This function recieves nested dictionaries containing the
@@ -265,8 +543,10 @@ class DataVerification():
             }
         }
 
-        The dictionary will be looped through and call the relevant
-        verification function depending on the type of data.
+        The dictionary will be looped through and call the validator
+        registered for the type of data, see register_validator.
+        Types without a registered validator are reported as errors.
+        Io bound validators are ran concurrently, see field_checks.run_checks.
         The value of the variable is held in "data" and all the
         restrictions that are upheld for the variable is all organised
         in its respective dictionary. If the restriction is not defined
@@ -278,64 +558,115 @@ class DataVerification():
         return (bool, list): a success flag and the errors detected are returned
         '''
 
-        total_errors = []
-        optional_errors = []
+        fields = cls.collect_fields(data)
+
+        field_results = run_checks(
+            (variable, is_io_bound(data_type), partial(cls.verify_field, variable, value, data_type, restrictions))
+            for variable, value, data_type, restrictions, _ in fields
+        )
+
+        return combine_field_results([
+            (field[4], success, errors) for field, (success, errors) in zip(fields, field_results)
+        ])
+
+
+    async def async_verify_data(cls: Self, data: dict) -> Tuple[bool, list]:
+        '''
+        The asyncio counterpart of verify_data.
+        Fields with async validators, such as emails looking up
+        their domain, are all checked concurrently within the deadline.
+
+        cls (Self): the verification class
+        data (dict): the data to check, including restrictions
+
+        return (bool, list): a success flag and the errors detected are returned
+        '''
+
+        fields = cls.collect_fields(data)
+
+        field_results = await async_run_checks(
+            (variable, partial(cls.async_verify_field, variable, value, data_type, restrictions))
+            for variable, value, data_type, restrictions, _ in fields
+        )
+
+        return combine_field_results([
+            (field[4], success, errors) for field, (success, errors) in zip(fields, field_results)
+        ])
+
+
+    def collect_fields(cls: Self, data: dict) -> list:
+        '''
+        Finds the fields of verify_data that are to be checked.
+
+        cls (Self): the verification class
+        data (dict): the data to check, including restrictions
+
+        return (list): the name, data, type, restrictions and optional flag of each field
+        '''
+
+        fields = []
 
         for variable, data_points in data.items():
             if not data_points['check']:
                 continue
 
-            success = True
-            errors = []
+            value = data_points['data']
 
-            data = data_points['data']
-            restrictions = {}
+            if data_points.get('skip_empty') and value == '':
+                continue
 
-            optional = False
+            fields.append((
+                variable,
+                value,
+                data_points['type'],
+                data_points.get('restrictions', {}),
+                bool(data_points.get('optional', False))
+            ))
 
-            if 'optional' in data_points:
-                if data_points['optional']:
-                    optional = True
+        return fields
 
-            if 'skip_empty' in data_points:
-                if data_points['skip_empty']:
-                    if data == '':
-                        continue
- 
-            if 'restrictions' in data_points:
-                restrictions = data_points['restrictions']
 
-            # TODO: Rework to be a dictionary, making it more maintainable
-            if data_points['type'] == str:
-                success, errors = cls.verify_string_data(variable, data, restrictions)
+    def verify_field(cls: Self, name: str, data: Any, data_type: Union[type, str], restrictions: dict={}) -> Tuple[bool, list]:
+        '''
+        Verifies a single field with the validator registered for its type.
 
-            elif data_points['type'] in [int, float]:
-                restrictions['type'] = data_points['type']
-                success, errors = cls.verify_number_data(variable, data, restrictions)
+        cls (Self): the verification class
+        name (str): the name of the data
+        data (Any): the data to be verified
+        data_type ([type, str]): the type of the field
+        restrictions (dict): a dictionary of all the restrictions to apply [default - {}]
 
-            elif data_points['type'] == 'email':
-                success, errors = cls.verify_email_data(variable, data)
+        return (bool, list): returns a success flag and a list of errors detected
+        '''
 
-            elif data_points['type'] == 'str_uuid':
-                success, errors = cls.verify_uuid4_string(variable, data)
+        validator = get_validator(data_type)
 
-            elif data_points['type'] == 'unix':
-                success, errors = cls.verify_unix(variable, data, restrictions)
+        if validator is None:
+            return False, [f'{name} type {getattr(data_type, "__name__", data_type)} is not supported']
 
-            elif data_points['type'] == 'datetime':
-                success, errors = cls.verify_datetime_string(variable, data, restrictions)
+        return validator.verify(cls, name, data, restrictions)
 
-            if optional:
-                optional_errors += errors
 
-            else:
-                if len(errors) != 0 and not success:
-                    total_errors += errors
+    async def async_verify_field(cls: Self, name: str, data: Any, data_type: Union[type, str], restrictions: dict={}) -> Tuple[bool, list]:
+        '''
+        The asyncio counterpart of verify_field,
+        validators without an async check are ran directly.
 
-        if len(total_errors) != 0:
-            return False, total_errors + optional_errors
-        
-        return True, optional_errors
+        cls (Self): the verification class
+        name (str): the name of the data
+        data (Any): the data to be verified
+        data_type ([type, str]): the type of the field
+        restrictions (dict): a dictionary of all the restrictions to apply [default - {}]
+
+        return (bool, list): returns a success flag and a list of errors detected
+        '''
+
+        validator = get_validator(data_type)
+
+        if validator is None or validator.async_verify is None:
+            return cls.verify_field(name, data, data_type, restrictions)
+
+        return await validator.async_verify(cls, name, data, restrictions)
 
 
     def verify_string_data(
@@ -417,14 +748,31 @@ class DataVerification():
 
         if type(data) != str:
             return False, [f'{name} type is invalid. Expected str but received {type(data).__name__}']
-        
+
+        success, rest_errors, parsed = cls.parse_string_restrictions(name, restrictions)
+
+        if not success:
+            return False, rest_errors
+
+        return cls.check_string_data(name, data, parsed)
+
+
+    def parse_string_restrictions(cls: Self, name: str, restrictions: dict={}) -> Tuple[bool, list, StringRestrictions]:
+        '''
+        Converts the string restrictions into their parsed form,
+        see verify_string_data for the available restrictions.
+        The parsed restrictions can be reused to check any amount of strings.
+
+        cls (Self): the verification class
+        name (str): the name of the data
+        restrictions (dict): a dictionary of all the restrictions to apply [default - {}]
+
+        return (bool, list, StringRestrictions): returns a success flag, a list of errors detected and the parsed restrictions
+        '''
+
         # Default Restrictions
         min_len = 0
         max_len = INFINITY
-        lower_case = CharReqEnum.DEFAULT
-        upper_case = CharReqEnum.DEFAULT
-        numbers = CharReqEnum.DEFAULT
-        symbols = CharReqEnum.DEFAULT
 
         rest_errors = []
 
@@ -442,24 +790,44 @@ class DataVerification():
         if min_len < 0:
             rest_errors.append(f'DEV ERROR: {name}-restriction-min_len is invalid. min_len must be a positive integer')
 
-        if len(rest_errors) != 0:
-            return False, rest_errors
-        
+        parsed = StringRestrictions(min_len, max_len, lower_case, upper_case, numbers, symbols)
+
+        return len(rest_errors) == 0, rest_errors, parsed
+
+
+    def check_string_data(cls: Self, name: str, data: Any, parsed: StringRestrictions) -> Tuple[bool, list]:
+        '''
+        Checks the string against restrictions that have already been parsed.
+
+        cls (Self): the verification class
+        name (str): the name of the data
+        data (Any): the data to be verified
+        parsed (StringRestrictions): the restrictions returned by parse_string_restrictions
+
+        return (bool, list): returns a success flag and a list of errors detected
+        '''
+
+        if type(data) != str:
+            return False, [f'{name} type is invalid. Expected str but received {type(data).__name__}']
+
         data_errors = []
 
         # Checking data to specified restrictions
         data_len = len(data)
 
-        if data_len < min_len:
-            data_errors.append(f'{name} string length of {data_len} is too short. Minimum expected length is {min_len} characters')
+        if data_len < parsed.min_len:
+            data_errors.append(f'{name} string length of {data_len} is too short. Minimum expected length is {parsed.min_len} characters')
+
+        if data_len > parsed.max_len:
+            data_errors.append(f'{name} string length of {data_len} is too long. Maximum expected length is {parsed.max_len} characters')
 
-        if data_len > max_len:
-            data_errors.append(f'{name} string length of {data_len} is too long. Maximum expected length is {max_len} characters')
+        if parsed.checks_characters():
+            char_classes = classify_characters(data)
 
-        data_errors = cls.validate_char_requirement(data, str.islower, lower_case, name, 'lower_case', data_errors)
-        data_errors = cls.validate_char_requirement(data, str.isupper, upper_case, name, 'upper_case', data_errors)
-        data_errors = cls.validate_char_requirement(data, str.isdigit, numbers,    name, 'number',     data_errors)
-        data_errors = cls.validate_char_requirement(data, lambda c: not c.isalnum(), symbols,    name, 'symbol',     data_errors)
+            data_errors = cls.validate_char_class(char_classes, CHAR_LOWER_CASE, parsed.lower_case, name, 'lower_case', data_errors)
+            data_errors = cls.validate_char_class(char_classes, CHAR_UPPER_CASE, parsed.upper_case, name, 'upper_case', data_errors)
+            data_errors = cls.validate_char_class(char_classes, CHAR_NUMBER,     parsed.numbers,    name, 'number',     data_errors)
+            data_errors = cls.validate_char_class(char_classes, CHAR_SYMBOL,     parsed.symbols,    name, 'symbol',     data_errors)
 
         if len(data_errors) != 0:
             return False, data_errors
@@ -513,6 +881,33 @@ class DataVerification():
         return (bool, list): returns a success flag and a list of errors detected
         '''
 
+        success, rest_errors, parsed = cls.parse_number_restrictions(name, restrictions)
+
+        # An incorrect data type is reported before any restriction errors
+        success, type_errors, data = cls.convert_number_data(name, data, parsed.data_type)
+
+        if not success:
+            return False, type_errors
+
+        if len(rest_errors) != 0:
+            return False, rest_errors
+
+        return cls.check_number_range(name, data, parsed)
+
+
+    def parse_number_restrictions(cls: Self, name: str, restrictions: dict={}) -> Tuple[bool, list, NumberRestrictions]:
+        '''
+        Converts the number restrictions into their parsed form,
+        see verify_number_data for the available restrictions.
+        The parsed restrictions can be reused to check any amount of numbers.
+
+        cls (Self): the verification class
+        name (str): the name of the data
+        restrictions (dict): a dictionary of all the restrictions to apply [default - {}]
+
+        return (bool, list, NumberRestrictions): returns a success flag, a list of errors detected and the parsed restrictions
+        '''
+
         # Default Restrictions
         min_num = -INFINITY
         max_num = INFINITY
@@ -524,30 +919,58 @@ class DataVerification():
         min_num = cls.set_min_restriction(min_num, restrictions)
         max_num = cls.set_max_restriction(max_num, restrictions)
 
+        if max_num < min_num:
+            rest_errors.append(f'DEV ERROR: {name}-restriction-len_limits is invalid. max_num must be >= min_num')
+
+        return len(rest_errors) == 0, rest_errors, NumberRestrictions(data_type, min_num, max_num)
+
+
+    def convert_number_data(cls: Self, name: str, data: Any, data_type: type) -> Tuple[bool, list, Any]:
+        '''
+        Checks the data is the expected number type,
+        converting it when a float is expected.
+
+        cls (Self): the verification class
+        name (str): the name of the data
+        data (Any): the data to be verified
+        data_type (type): either int or float
+
+        return (bool, list, Any): returns a success flag, a list of errors detected and the converted data
+        '''
+
         if data_type.__name__ == 'float':
             try:
                 data = float(data)
 
             except:
-                return False, [f'{name} type is invalid. Expected {data_type.__name__} but received {type(data).__name__}']
+                return False, [f'{name} type is invalid. Expected {data_type.__name__} but received {type(data).__name__}'], data
 
         if type(data).__name__ != data_type.__name__:
-            return False, [f'{name} type is invalid. Expected {data_type.__name__} but received {type(data).__name__}']
+            return False, [f'{name} type is invalid. Expected {data_type.__name__} but received {type(data).__name__}'], data
 
-        if max_num < min_num:
-            rest_errors.append(f'DEV ERROR: {name}-restriction-len_limits is invalid. max_num must be >= min_num')
+        return True, [], data
+
+
+    def check_number_range(cls: Self, name: str, data: Union[int, float], parsed: NumberRestrictions) -> Tuple[bool, list]:
+        '''
+        Checks the number is within the parsed limits.
+
+        cls (Self): the verification class
+        name (str): the name of the data
+        data ([int, float]): the converted number
+        parsed (NumberRestrictions): the restrictions returned by parse_number_restrictions
+
+        return (bool, list): returns a success flag and a list of errors detected
+        '''
 
-        if len(rest_errors) != 0:
-            return False, rest_errors
-        
         # Checking data to specified restrictions
         data_errors = []
 
-        if data < min_num:
-            data_errors.append(f'{name} integer {data} is too small. Minimum expected number is {min_num}')
+        if data < parsed.min_num:
+            data_errors.append(f'{name} integer {data} is too small. Minimum expected number is {parsed.min_num}')
 
-        if data > max_num:
-            data_errors.append(f'{name} integer {data} is too large. Maximum expected number is {max_num}')
+        if data > parsed.max_num:
+            data_errors.append(f'{name} integer {data} is too large. Maximum expected number is {parsed.max_num}')
 
         if len(data_errors) != 0:
             return False, data_errors
@@ -555,42 +978,124 @@ class DataVerification():
         return True, []
 
 
-    def verify_email_data(cls: Self, name: str, data: Any) -> Tuple[bool, list]:
+    def check_number_data(cls: Self, name: str, data: Any, parsed: NumberRestrictions) -> Tuple[bool, list]:
         '''
-        This function will validate the incoming data
-        to check if it is a valid email.
+        Checks the number against restrictions that have already been parsed.
 
         cls (Self): the verification class
         name (str): the name of the data
         data (Any): the data to be verified
+        parsed (NumberRestrictions): the restrictions returned by parse_number_restrictions
 
         return (bool, list): returns a success flag and a list of errors detected
         '''
 
+        success, errors, data = cls.convert_number_data(name, data, parsed.data_type)
+
+        if not success:
+            return False, errors
+
+        return cls.check_number_range(name, data, parsed)
+
+
+    def verify_email_format(cls: Self, name: str, data: Any) -> Tuple[bool, list, Union[str, None]]:
+        '''
+        This function will validate the incoming data
+        to check if it is formatted as an email.
+
+        cls (Self): the verification class
+        name (str): the name of the data
+        data (Any): the data to be verified
+
+        return (bool, list, [str, None]): returns a success flag, a list of errors detected and the email domain
+        '''
+
         if type(data) != str:
-            return False, [f'{name} type is invalid. Expected str but received {type(data).__name__}']
+            return False, [f'{name} type is invalid. Expected str but received {type(data).__name__}'], None
 
         if data.count('@') != 1:
-            return False, [f'{name} is invalid. Email must only contain one @']
+            return False, [f'{name} is invalid. Email must only contain one @'], None
 
         email_parts = data.split('@')
         success, errors = cls.verify_string_data('Email', email_parts[0], { 'min_len': 1, 'max_len': 63 })
 
         if not success:
-            return False, errors
+            return False, errors, None
 
-        try:
-            dns.resolver.resolve(email_parts[1], 'MX')
+        return True, [], email_parts[1]
 
-        except dns.resolver.NoAnswer:
-            return False, [f'{name} was unable to be verified']
 
-        except dns.resolver.NXDOMAIN:
+    def verify_email_domain_status(cls: Self, name: str, status: DomainStatus) -> Tuple[bool, list]:
+        '''
+        This function converts the result of looking up
+        the email domain into the verification result.
+
+        cls (Self): the verification class
+        name (str): the name of the data
+        status (DomainStatus): the status of the email domain
+
+        return (bool, list): returns a success flag and a list of errors detected
+        '''
+
+        if status == DomainStatus.NXDOMAIN:
             return False, [f'{name} has an invalid domain']
 
+        if status != DomainStatus.VALID:
+            return False, [f'{name} was unable to be verified']
+
         return True, []
 
 
+    def verify_email_data(cls: Self, name: str, data: Any, domain_statuses: dict=None) -> Tuple[bool, list]:
+        '''
+        This function will validate the incoming data
+        to check if it is a valid email.
+        The MX records of the domain are looked up through the domain cache.
+
+        cls (Self): the verification class
+        name (str): the name of the data
+        data (Any): the data to be verified
+        domain_statuses (dict): domains already looked up, keyed by normalised domain [default - None]
+
+        return (bool, list): returns a success flag and a list of errors detected
+        '''
+
+        success, errors, domain = cls.verify_email_format(name, data)
+
+        if not success:
+            return False, errors
+
+        status = None
+
+        if domain_statuses is not None:
+            status = domain_statuses.get(normalise_domain(domain))
+
+        if status is None:
+            status = check_email_domain(domain)
+
+        return cls.verify_email_domain_status(name, status)
+
+
+    async def async_verify_email_data(cls: Self, name: str, data: Any) -> Tuple[bool, list]:
+        '''
+        The asyncio counterpart of verify_email_data,
+        the MX records are looked up without blocking the event loop.
+
+        cls (Self): the verification class
+        name (str): the name of the data
+        data (Any): the data to be verified
+
+        return (bool, list): returns a success flag and a list of errors detected
+        '''
+
+        success, errors, domain = cls.verify_email_format(name, data)
+
+        if not success:
+            return False, errors
+
+        return cls.verify_email_domain_status(name, await async_check_email_domain(domain))
+
+
     def verify_uuid4_string(cls: Self, name: str, data: Any) -> Tuple[bool, list]:
         '''
         This function will validate the incoming data
@@ -919,6 +1424,8 @@ class DataVerification():
                     - DEFAULT = 100 years in the future
                     - The latest allowed date in string format (e.g., "2025-12-31").
                     - Must be in a consistent and parseable format (e.g., ISO 8601).
+                - Either date can instead be relative to today, given as a signed
+                  amount of days, weeks, months or years (e.g., "-110y", "-9y", "+2w").
 
         - **time (dict)**:
             - Specifies restrictions related to time of day.
@@ -940,25 +1447,47 @@ class DataVerification():
         return (bool, list): returns a success flag and a list of errors detected
         '''
 
+        if type(data) != str:
+            return False, [f'{name} type is invalid. Expected str but received {type(data).__name__}']
 
-        def check_data_format(data, _format):
-            try:
-                data_object = datetime.strptime(data, _format)
+        return cls.check_datetime_string(name, data, cls.parse_datetime_restrictions(restrictions))
 
-                return True, data_object
 
-            except:
-                return False, None
+    def has_relative_dates(cls: Self, restrictions: dict={}) -> bool:
+        '''
+        Checks whether the date restrictions are relative to today.
 
-        if type(data) != str:
-            return False, [f'{name} type is invalid. Expected str but received {type(data).__name__}']
-        
-        data_object = 0
-        today = datetime.today()
+        cls (Self): the verification class
+        restrictions (dict): a dictionary of all the restrictions to apply [default - {}]
+
+        return (bool): relative date flag
+        '''
+
+        date_restrictions = restrictions.get('date', {})
+
+        return is_relative_date(date_restrictions.get('min')) or is_relative_date(date_restrictions.get('max'))
+
+
+    def parse_datetime_restrictions(cls: Self, restrictions: dict={}, today: date=None) -> DatetimeRestrictions:
+        '''
+        Converts the datetime restrictions into the expected format and limits,
+        see verify_datetime_string for the available restrictions.
+        The parsed restrictions can be reused to check any amount of datetimes.
+        Dates relative to today are resolved against the given day.
+
+        cls (Self): the verification class
+        restrictions (dict): a dictionary of all the restrictions to apply [default - {}]
+        today (date): the day relative dates are resolved against [default - None, the current day]
+
+        return (DatetimeRestrictions): the parsed restrictions
+        '''
+
+        if today is None:
+            today = date.today()
 
         _date = False      
-        min_date = today.replace(year=today.year - 100).strftime("%Y-%m-%d")
-        max_date = today.replace(year=today.year + 100).strftime("%Y-%m-%d")
+        min_date = resolve_relative_date('-100y', today)
+        max_date = resolve_relative_date('+100y', today)
 
         _time = False
         min_time = '00:00:00'
@@ -973,6 +1502,12 @@ class DataVerification():
             if 'max' in restrictions['date']:
                 max_date = restrictions['date']['max']
 
+            if is_relative_date(min_date):
+                min_date = resolve_relative_date(min_date, today)
+
+            if is_relative_date(max_date):
+                max_date = resolve_relative_date(max_date, today)
+
         if 'time' in restrictions:
             _time = True
 
@@ -982,32 +1517,322 @@ class DataVerification():
             if 'max' in restrictions['time']:
                 max_time = restrictions['time']['max']
 
-        min_val = 0
-        max_val = 0
-        success = None
-
         if _date and _time:
-            min_val = datetime.strptime(f'{min_date} {min_time}', "%Y-%m-%d %H:%M:%S")
-            max_val = datetime.strptime(f'{max_date} {max_time}', "%Y-%m-%d %H:%M:%S")
-
-            success, data_object = check_data_format(data, "%Y-%m-%d %H:%M:%S")
+            return DatetimeRestrictions(
+                "%Y-%m-%d %H:%M:%S",
+                datetime.strptime(f'{min_date} {min_time}', "%Y-%m-%d %H:%M:%S"),
+                datetime.strptime(f'{max_date} {max_time}', "%Y-%m-%d %H:%M:%S")
+            )
 
         elif _date:
-            min_val = datetime.strptime(f'{min_date}', "%Y-%m-%d")
-            max_val = datetime.strptime(f'{max_date}', "%Y-%m-%d")
-
-            success, data_object = check_data_format(data, "%Y-%m-%d")
+            return DatetimeRestrictions(
+                "%Y-%m-%d",
+                datetime.strptime(f'{min_date}', "%Y-%m-%d"),
+                datetime.strptime(f'{max_date}', "%Y-%m-%d")
+            )
 
         elif _time:
-            min_val = datetime.strptime(f'{min_time}', "%H:%M:%S")
-            max_val = datetime.strptime(f'{max_time}', "%H:%M:%S")
+            return DatetimeRestrictions(
+                "%H:%M:%S",
+                datetime.strptime(f'{min_time}', "%H:%M:%S"),
+                datetime.strptime(f'{max_time}', "%H:%M:%S")
+            )
 
-            success, data_object = check_data_format(data, "%H:%M:%S")
+        return DatetimeRestrictions()
 
-        if not success:
+
+    def check_datetime_string(cls: Self, name: str, data: Any, parsed: DatetimeRestrictions) -> Tuple[bool, list]:
+        '''
+        Checks the datetime string against restrictions that have already been parsed.
+
+        cls (Self): the verification class
+        name (str): the name of the data
+        data (Any): the data to be verified
+        parsed (DatetimeRestrictions): the restrictions returned by parse_datetime_restrictions
+
+        return (bool, list): returns a success flag and a list of errors detected
+        '''
+
+        if type(data) != str:
+            return False, [f'{name} type is invalid. Expected str but received {type(data).__name__}']
+
+        if parsed.format is None:
             return False, [f'{name} invalid datetime format. Expected YYYY-MM-DD']
 
-        if (min_val > data_object) and (max_val < data_object):
+        try:
+            data_object = datetime.strptime(data, parsed.format)
+
+        except:
+            return False, [f'{name} invalid datetime format. Expected YYYY-MM-DD']
+
+        if (parsed.min_val > data_object) or (parsed.max_val < data_object):
             return False, [f'{name} datetime out of range']
         
         return True, []
+
+
+    def check_adaptive_datetime_string(cls: Self, name: str, data: Any, adaptive: AdaptiveDatetimeRestrictions) -> Tuple[bool, list]:
+        '''
+        Checks the datetime string against restrictions relative to today.
+
+        cls (Self): the verification class
+        name (str): the name of the data
+        data (Any): the data to be verified
+        adaptive (AdaptiveDatetimeRestrictions): the restrictions parsed for the current day
+
+        return (bool, list): returns a success flag and a list of errors detected
+        '''
+
+        return cls.check_datetime_string(name, data, adaptive.get())
+
+
+# Signature of the functions registered to validate a type
+VALIDATOR = Callable[[DataVerification, str, Any, dict], Tuple[bool, list]]
+ASYNC_VALIDATOR = Callable[[DataVerification, str, Any, dict], Awaitable[Tuple[bool, list]]]
+CHECKER_COMPILER = Callable[[DataVerification, str, dict], Callable[[Any], Tuple[bool, list]]]
+
+
+@dataclass(frozen=True, slots=True)
+class TypeValidator:
+    '''
+    The functions validating a schema type, see register_validator.
+    '''
+
+    verify: VALIDATOR
+    async_verify: Union[ASYNC_VALIDATOR, None] = None
+    compiler: Union[CHECKER_COMPILER, None] = None
+    io_bound: bool = False
+
+
+# Validators keyed by the type given in the schema
+TYPE_VALIDATORS = {}
+
+
+def register_validator(
+        data_type: Union[type, str],
+        verify: VALIDATOR,
+        async_verify: ASYNC_VALIDATOR=None,
+        compiler: CHECKER_COMPILER=None,
+        io_bound: bool=False
+    ) -> TypeValidator:
+
+    '''
+    Registers the validator of a schema type, replacing any existing validator.
+
+    Validators receive the verification class, field name, data and
+    restrictions, returning a success flag and errors. Validators
+    waiting on io, such as DNS lookups, can also provide an async
+    counterpart so the fields of a request are checked concurrently.
+    A compiler receives the verification class, field name and
+    restrictions, returning a checker of the data with the restrictions
+    already parsed. Without one the restrictions are read every request.
+    Io bound validators of the same request are ran concurrently.
+
+    Example: -
+
+    register_validator('postcode', verify_postcode)
+
+    data_type ([type, str]): the type given in the schema
+    verify (VALIDATOR): the function validating the data
+    async_verify (ASYNC_VALIDATOR): the asyncio counterpart of verify [default - None]
+    compiler (CHECKER_COMPILER): the function creating a checker for compiled schemas [default - None]
+    io_bound (bool): whether the validator waits on io, such as the network [default - False]
+
+    return (TypeValidator): the registered validator
+    '''
+
+    validator = TypeValidator(verify=verify, async_verify=async_verify, compiler=compiler, io_bound=io_bound)
+    TYPE_VALIDATORS[data_type] = validator
+
+    return validator
+
+
+def get_validator(data_type: Union[type, str]) -> Union[TypeValidator, None]:
+    '''
+    Fetches the validator registered for a schema type.
+
+    data_type ([type, str]): the type given in the schema
+
+    return ([TypeValidator, None]): the registered validator, None when the type is not supported
+    '''
+
+    return TYPE_VALIDATORS.get(data_type)
+
+
+def is_io_bound(data_type: Union[type, str]) -> bool:
+    '''
+    Checks whether the validator of a schema type waits on io.
+
+    data_type ([type, str]): the type given in the schema
+
+    return (bool): io bound flag
+    '''
+
+    validator = TYPE_VALIDATORS.get(data_type)
+
+    return validator is not None and validator.io_bound
+
+
+def compile_string_checker(verifier: DataVerification, name: str, restrictions: dict) -> Callable[[Any], Tuple[bool, list]]:
+    '''
+    Creates the checker of a string field with its restrictions already parsed.
+
+    verifier (DataVerification): the verification class the checker is bound to
+    name (str): the name of the field
+    restrictions (dict): the restrictions of the field
+
+    return (Callable): a function receiving the data and returning a success flag and errors
+    '''
+
+    success, errors, parsed = verifier.parse_string_restrictions(name, restrictions)
+
+    if not success:
+        raise ValueError(', '.join(errors))
+
+    return partial(verifier.check_string_data, name, parsed=parsed)
+
+
+def verify_number_field(verifier: DataVerification, name: str, data: Any, restrictions: dict, data_type: type) -> Tuple[bool, list]:
+    '''
+    Validates a number field of the given type.
+
+    verifier (DataVerification): the verification class
+    name (str): the name of the data
+    data (Any): the data to be verified
+    restrictions (dict): the restrictions of the field
+    data_type (type): the expected number type
+
+    return (bool, list): returns a success flag and a list of errors detected
+    '''
+
+    # Copied so the shared schema restrictions are left unchanged
+    return verifier.verify_number_data(name, data, { **restrictions, 'type': data_type })
+
+
+def compile_number_checker(verifier: DataVerification, name: str, restrictions: dict, data_type: type) -> Callable[[Any], Tuple[bool, list]]:
+    '''
+    Creates the checker of a number field with its restrictions already parsed.
+
+    verifier (DataVerification): the verification class the checker is bound to
+    name (str): the name of the field
+    restrictions (dict): the restrictions of the field
+    data_type (type): the expected number type
+
+    return (Callable): a function receiving the data and returning a success flag and errors
+    '''
+
+    success, errors, parsed = verifier.parse_number_restrictions(name, { **restrictions, 'type': data_type })
+
+    if not success:
+        raise ValueError(', '.join(errors))
+
+    return partial(verifier.check_number_data, name, parsed=parsed)
+
+
+def verify_email_field(verifier: DataVerification, name: str, data: Any, restrictions: dict) -> Tuple[bool, list]:
+    '''
+    Validates an email field, emails have no restrictions.
+
+    verifier (DataVerification): the verification class
+    name (str): the name of the data
+    data (Any): the data to be verified
+    restrictions (dict): the restrictions of the field
+
+    return (bool, list): returns a success flag and a list of errors detected
+    '''
+
+    return verifier.verify_email_data(name, data)
+
+
+async def async_verify_email_field(verifier: DataVerification, name: str, data: Any, restrictions: dict) -> Tuple[bool, list]:
+    '''
+    The asyncio counterpart of verify_email_field.
+
+    verifier (DataVerification): the verification class
+    name (str): the name of the data
+    data (Any): the data to be verified
+    restrictions (dict): the restrictions of the field
+
+    return (bool, list): returns a success flag and a list of errors detected
+    '''
+
+    return await verifier.async_verify_email_data(name, data)
+
+
+def verify_uuid4_field(verifier: DataVerification, name: str, data: Any, restrictions: dict) -> Tuple[bool, list]:
+    '''
+    Validates a uuid4 field, uuids have no restrictions.
+
+    verifier (DataVerification): the verification class
+    name (str): the name of the data
+    data (Any): the data to be verified
+    restrictions (dict): the restrictions of the field
+
+    return (bool, list): returns a success flag and a list of errors detected
+    '''
+
+    return verifier.verify_uuid4_string(name, data)
+
+
+def compile_unix_checker(verifier: DataVerification, name: str, restrictions: dict) -> Callable[[Any], Tuple[bool, list]]:
+    '''
+    Creates the checker of a unix time field.
+    The limits are relative to the current time so are parsed per request.
+
+    verifier (DataVerification): the verification class the checker is bound to
+    name (str): the name of the field
+    restrictions (dict): the restrictions of the field
+
+    return (Callable): a function receiving the data and returning a success flag and errors
+    '''
+
+    return partial(verifier.verify_unix, name, restrictions=copy.deepcopy(restrictions))
+
+
+def compile_datetime_checker(verifier: DataVerification, name: str, restrictions: dict) -> Callable[[Any], Tuple[bool, list]]:
+    '''
+    Creates the checker of a datetime field with its restrictions already parsed.
+    Restrictions relative to today are parsed again once the day changes.
+
+    verifier (DataVerification): the verification class the checker is bound to
+    name (str): the name of the field
+    restrictions (dict): the restrictions of the field
+
+    return (Callable): a function receiving the data and returning a success flag and errors
+    '''
+
+    if verifier.has_relative_dates(restrictions):
+        return partial(verifier.check_adaptive_datetime_string, name, adaptive=AdaptiveDatetimeRestrictions(verifier, restrictions))
+
+    return partial(verifier.check_datetime_string, name, parsed=verifier.parse_datetime_restrictions(restrictions))
+
+
+def verify_type_field(verifier: DataVerification, name: str, data: Any, restrictions: dict, data_type: type) -> Tuple[bool, list]:
+    '''
+    Validates a field only requiring the data to be of the given type.
+
+    verifier (DataVerification): the verification class
+    name (str): the name of the data
+    data (Any): the data to be verified
+    restrictions (dict): the restrictions of the field
+    data_type (type): the expected type
+
+    return (bool, list): returns a success flag and a list of errors detected
+    '''
+
+    if type(data) != data_type:
+        return False, [f'{name} type is invalid. Expected {data_type.__name__} but received {type(data).__name__}']
+
+    return True, []
+
+
+register_validator(str, DataVerification.verify_string_data, compiler=compile_string_checker)
+register_validator(int, partial(verify_number_field, data_type=int), compiler=partial(compile_number_checker, data_type=int))
+register_validator(float, partial(verify_number_field, data_type=float), compiler=partial(compile_number_checker, data_type=float))
+register_validator('email', verify_email_field, async_verify=async_verify_email_field, io_bound=True)
+register_validator('str_uuid', verify_uuid4_field)
+register_validator('unix', DataVerification.verify_unix, compiler=compile_unix_checker)
+register_validator('datetime', DataVerification.verify_datetime_string, compiler=compile_datetime_checker)
+register_validator(bool, partial(verify_type_field, data_type=bool))
+register_validator(list, partial(verify_type_field, data_type=list))
+register_validator(dict, partial(verify_type_field, data_type=dict))
@@ -0,0 +1,271 @@
+'''
+Contains the cache of email domain lookups used when verifying emails.
+
+Checking an email domain requires fetching its MX records, which
+is a DNS round trip that can hang on a slow resolver. The result of
+each lookup is cached for as long as the records time to live allows,
+and domains that do not exist or have no MX records are also cached
+so repeated invalid emails do not reach the resolver either.
+'''
+
+import dns.asyncresolver
+import dns.exception
+import dns.resolver
+import os
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Iterable, Self, Tuple, Union
+
+from src.backend_services.common.utils.ttl_cache import TTLCache
+
+
+# The maximum amount of domains held before the least recently used are removed
+DNS_CACHE_SIZE = int(os.environ.get('DNS_CACHE_SIZE', 10000))
+# Bounds (seconds) applied to the time to live given by the MX records
+DNS_CACHE_MIN_TTL = int(os.environ.get('DNS_CACHE_MIN_TTL', 60))
+DNS_CACHE_MAX_TTL = int(os.environ.get('DNS_CACHE_MAX_TTL', 86400))
+# How long (seconds) domains without MX records are cached for
+DNS_NEGATIVE_TTL = int(os.environ.get('DNS_NEGATIVE_TTL', 300))
+
+# How long (seconds) to wait on each nameserver and on the lookup as a whole
+DNS_RESOLVER_TIMEOUT = float(os.environ.get('DNS_RESOLVER_TIMEOUT', 2))
+DNS_RESOLVER_LIFETIME = float(os.environ.get('DNS_RESOLVER_LIFETIME', 4))
+
+# The maximum amount of domains looked up at once when validating a batch of emails
+DNS_BATCH_WORKERS = int(os.environ.get('DNS_BATCH_WORKERS', 16))
+
+# Domains looked up on startup so the first users of common providers skip the resolver
+DNS_PRELOAD_DOMAINS = [
+    domain.strip() for domain in os.environ.get(
+        'DNS_PRELOAD_DOMAINS',
+        'gmail.com,googlemail.com,outlook.com,hotmail.com,hotmail.co.uk,live.com,yahoo.com,yahoo.co.uk,icloud.com,aol.com,protonmail.com'
+    ).split(',') if domain.strip()
+]
+
+
+class DomainStatus(Enum):
+    VALID = 'VALID'
+    NO_ANSWER = 'NO_ANSWER'
+    NXDOMAIN = 'NXDOMAIN'
+    UNKNOWN = 'UNKNOWN'
+
+
+class DomainCache(TTLCache):
+    '''
+    A bounded least recently used cache of domain lookups, mapping each
+    normalised domain to its DomainStatus, where every entry expires
+    after its own time to live. All operations are thread safe.
+    '''
+
+    def __init__(cls: Self, max_size: int=DNS_CACHE_SIZE) -> None:
+        '''
+        Initialises an empty cache.
+
+        cls (Self): the DomainCache class
+        max_size (int): the maximum amount of entries held [default - DNS_CACHE_SIZE]
+
+        return (None):
+        '''
+
+        super().__init__(max_size)
+
+
+domain_cache = DomainCache()
+
+_resolver = None
+_async_resolver = None
+
+
+def create_resolver(resolver_class: type) -> Union[dns.resolver.Resolver, dns.asyncresolver.Resolver]:
+    '''
+    Creates a resolver using the system nameservers and the configured timeouts.
+
+    resolver_class (type): either the blocking or asyncio resolver class
+
+    return ([Resolver]): the newly created resolver
+    '''
+
+    resolver = resolver_class()
+    resolver.timeout = DNS_RESOLVER_TIMEOUT
+    resolver.lifetime = DNS_RESOLVER_LIFETIME
+
+    return resolver
+
+
+def normalise_domain(domain: str) -> str:
+    '''
+    Formats the domain so the same domain always uses the same cache entry.
+
+    domain (str): the domain of an email
+
+    return (str): the lower case domain without a trailing dot
+    '''
+
+    return domain.strip().rstrip('.').lower()
+
+
+def clamp_ttl(ttl: int) -> int:
+    '''
+    Keeps the time to live of MX records within the configured bounds.
+
+    ttl (int): the time to live given by the records
+
+    return (int): the time to live to cache the domain for
+    '''
+
+    return max(DNS_CACHE_MIN_TTL, min(ttl, DNS_CACHE_MAX_TTL))
+
+
+def resolve_mx(domain: str) -> Tuple[DomainStatus, int]:
+    '''
+    Looks up the MX records of the domain.
+
+    domain (str): the normalised domain
+
+    return (DomainStatus, int): the domain status and how long (seconds) it can be cached for
+    '''
+
+    global _resolver
+
+    if _resolver is None:
+        _resolver = create_resolver(dns.resolver.Resolver)
+
+    try:
+        answer = _resolver.resolve(domain, 'MX')
+
+    except dns.resolver.NXDOMAIN:
+        return DomainStatus.NXDOMAIN, DNS_NEGATIVE_TTL
+
+    except dns.resolver.NoAnswer:
+        return DomainStatus.NO_ANSWER, DNS_NEGATIVE_TTL
+
+    except dns.exception.DNSException:
+        # Timeouts and unreachable nameservers say nothing about the domain
+        return DomainStatus.UNKNOWN, 0
+
+    return DomainStatus.VALID, clamp_ttl(answer.rrset.ttl)
+
+
+async def async_resolve_mx(domain: str) -> Tuple[DomainStatus, int]:
+    '''
+    Looks up the MX records of the domain without blocking the event loop.
+
+    domain (str): the normalised domain
+
+    return (DomainStatus, int): the domain status and how long (seconds) it can be cached for
+    '''
+
+    global _async_resolver
+
+    if _async_resolver is None:
+        _async_resolver = create_resolver(dns.asyncresolver.Resolver)
+
+    try:
+        answer = await _async_resolver.resolve(domain, 'MX')
+
+    except dns.resolver.NXDOMAIN:
+        return DomainStatus.NXDOMAIN, DNS_NEGATIVE_TTL
+
+    except dns.resolver.NoAnswer:
+        return DomainStatus.NO_ANSWER, DNS_NEGATIVE_TTL
+
+    except dns.exception.DNSException:
+        return DomainStatus.UNKNOWN, 0
+
+    return DomainStatus.VALID, clamp_ttl(answer.rrset.ttl)
+
+
+def check_email_domain(domain: str) -> DomainStatus:
+    '''
+    Fetches the status of an email domain, using the cache when available.
+
+    domain (str): the domain of an email
+
+    return (DomainStatus): the domain status
+    '''
+
+    domain = normalise_domain(domain)
+    status = domain_cache.get(domain)
+
+    if status is not None:
+        return status
+
+    status, ttl = resolve_mx(domain)
+    domain_cache.set(domain, status, ttl)
+
+    return status
+
+
+async def async_check_email_domain(domain: str) -> DomainStatus:
+    '''
+    Fetches the status of an email domain without blocking
+    the event loop, using the cache when available.
+
+    domain (str): the domain of an email
+
+    return (DomainStatus): the domain status
+    '''
+
+    domain = normalise_domain(domain)
+    status = domain_cache.get(domain)
+
+    if status is not None:
+        return status
+
+    status, ttl = await async_resolve_mx(domain)
+    domain_cache.set(domain, status, ttl)
+
+    return status
+
+
+def preload_domains(domains: Iterable[str]=DNS_PRELOAD_DOMAINS) -> dict:
+    '''
+    Looks up each domain so that they are cached before being requested.
+
+    domains (Iterable[str]): the domains to look up [default - DNS_PRELOAD_DOMAINS]
+
+    return (dict): the status of each domain
+    '''
+
+    return { domain: check_email_domain(domain) for domain in domains }
+
+
+def resolve_domains(domains: Iterable[str], max_workers: int=DNS_BATCH_WORKERS) -> dict:
+    '''
+    Looks up each unique domain once, with the lookups made concurrently.
+    Used to share the lookups between a batch of emails, the statuses
+    are returned even when they are not able to be cached.
+
+    domains (Iterable[str]): the domains to look up
+    max_workers (int): the maximum amount of concurrent lookups [default - DNS_BATCH_WORKERS]
+
+    return (dict): the status of each normalised domain
+    '''
+
+    unique_domains = list({ normalise_domain(domain) for domain in domains })
+
+    if len(unique_domains) == 0:
+        return {}
+
+    if max_workers <= 1 or len(unique_domains) == 1:
+        return { domain: check_email_domain(domain) for domain in unique_domains }
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_domains)), thread_name_prefix='domain-batch') as executor:
+        return dict(zip(unique_domains, executor.map(check_email_domain, unique_domains)))
+
+
+def start_domain_preload(domains: Iterable[str]=DNS_PRELOAD_DOMAINS) -> threading.Thread:
+    '''
+    Preloads the domains on a background thread so startup is not delayed.
+
+    domains (Iterable[str]): the domains to look up [default - DNS_PRELOAD_DOMAINS]
+
+    return (Thread): the started thread
+    '''
+
+    thread = threading.Thread(target=preload_domains, args=(list(domains),), name='domain-preload', daemon=True)
+    thread.start()
+
+    return thread
@@ -0,0 +1,184 @@
+'''
+Runs the field checks of a single request, with the checks
+waiting on io ran concurrently and bound by a deadline.
+
+Checks such as looking up an email domain spend their time waiting
+on the network. When a request holds more than one, they are ran on
+a small thread pool shared by every request so the request takes as
+long as its slowest check rather than the sum of them. Checks still
+running once the deadline passes are reported as errors.
+
+A check that has started can not be cancelled, so a timed out check
+keeps holding its worker until it returns. When every worker is held
+by slow checks, such as lookups against a hanging resolver, the checks
+of new requests queue behind them and fail with "unable to be verified
+in time" until the workers free up. VALIDATION_WORKERS bounds how many
+slow checks can be held at once, and should be kept above the expected
+amount of concurrent requests multiplied by their io bound checks.
+'''
+
+import asyncio
+import os
+import threading
+import time
+
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Iterable, Tuple, Union
+
+
+# How many threads run io bound checks, 0 runs every check on the calling thread
+VALIDATION_WORKERS = int(os.environ.get('VALIDATION_WORKERS', 8))
+# How long (seconds) a request waits on its io bound checks
+VALIDATION_DEADLINE_SECONDS = float(os.environ.get('VALIDATION_DEADLINE_SECONDS', 5))
+
+FIELD_CHECK = Callable[[], Tuple[bool, list]]
+ASYNC_FIELD_CHECK = Callable[[], Awaitable[Tuple[bool, list]]]
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_validation_pool() -> Union[ThreadPoolExecutor, None]:
+    '''
+    Fetches the thread pool used for io bound checks, creating it on first use.
+
+    return ([ThreadPoolExecutor, None]): the thread pool or None if checking on the calling thread
+    '''
+
+    global _pool
+
+    if VALIDATION_WORKERS <= 0:
+        return None
+
+    if _pool is not None:
+        return _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ThreadPoolExecutor(max_workers=VALIDATION_WORKERS, thread_name_prefix='validation')
+
+    return _pool
+
+
+def shutdown_validation_pool() -> None:
+    '''
+    Stops every thread within the validation pool.
+    The next io bound checks will create a new pool.
+
+    return (None):
+    '''
+
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+
+        _pool = None
+
+
+def timed_out(name: str) -> Tuple[bool, list]:
+    '''
+    The result of a check that did not complete before the deadline.
+
+    name (str): the name of the field
+
+    return (bool, list): a failed success flag and the error
+    '''
+
+    return False, [f'{name} was unable to be verified in time']
+
+
+def check_failed(name: str) -> Tuple[bool, list]:
+    '''
+    The result of a check that raised an error rather than returning its result.
+
+    name (str): the name of the field
+
+    return (bool, list): a failed success flag and the error
+    '''
+
+    return False, [f'{name} was unable to be verified']
+
+
+def run_checks(checks: Iterable[Tuple[str, bool, FIELD_CHECK]], deadline: float=VALIDATION_DEADLINE_SECONDS) -> list:
+    '''
+    Runs the checks of a request, returning their results in the same order.
+    The io bound checks are ran concurrently on the validation pool, so
+    every one of them is bound by the deadline, while the remaining checks
+    run on the calling thread. Checks queued behind a saturated pool count
+    towards the deadline too, see the module docstring.
+
+    checks (Iterable[str, bool, FIELD_CHECK]): the field name, io bound flag and check of each field
+    deadline (float): how long (seconds) to wait on the io bound checks [default - VALIDATION_DEADLINE_SECONDS]
+
+    return (list): the success flag and errors of each check
+    '''
+
+    checks = list(checks)
+    pool = get_validation_pool()
+
+    if pool is None or not any(io_bound for _, io_bound, _ in checks):
+        return [check() for _, _, check in checks]
+
+    start = time.monotonic()
+
+    futures = {
+        index: pool.submit(check)
+        for index, (_, io_bound, check) in enumerate(checks) if io_bound
+    }
+
+    results = [None if index in futures else check() for index, (_, _, check) in enumerate(checks)]
+
+    done, _ = wait(futures.values(), timeout=max(deadline - (time.monotonic() - start), 0))
+
+    for index, future in futures.items():
+        if future in done:
+            results[index] = check_failed(checks[index][0]) if future.exception() is not None else future.result()
+
+        else:
+            # Only removes checks still queued, a running check keeps its worker until it returns
+            future.cancel()
+            results[index] = timed_out(checks[index][0])
+
+    return results
+
+
+async def async_run_checks(checks: Iterable[Tuple[str, ASYNC_FIELD_CHECK]], deadline: float=VALIDATION_DEADLINE_SECONDS) -> list:
+    '''
+    The asyncio counterpart of run_checks, every check is ran concurrently
+    on the event loop and the checks still running at the deadline are cancelled.
+    A check raising an error is reported as failed rather than failing the request.
+
+    checks (Iterable[str, ASYNC_FIELD_CHECK]): the field name and check of each field
+    deadline (float): how long (seconds) to wait on the checks [default - VALIDATION_DEADLINE_SECONDS]
+
+    return (list): the success flag and errors of each check
+    '''
+
+    checks = list(checks)
+
+    if len(checks) == 0:
+        return []
+
+    tasks = [asyncio.ensure_future(check()) for _, check in checks]
+
+    _, pending = await asyncio.wait(tasks, timeout=deadline)
+
+    for task in pending:
+        task.cancel()
+
+    results = []
+
+    for (name, _), task in zip(checks, tasks):
+        if task in pending:
+            results.append(timed_out(name))
+
+        elif task.exception() is not None:
+            results.append(check_failed(name))
+
+        else:
+            results.append(task.result())
+
+    return results
@@ -8,6 +8,19 @@ import yaml
 from typing import Tuple, Union
 
 
+# Maps the type names used within the yaml schemas to the types used for validation
+SCHEMA_TYPES = {
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': bool,
+    'list': list,
+    'dict': dict,
+    'email': 'email',
+    'str_uuid': 'str_uuid',
+    'unix': 'unix',
+}
+
 def load_yaml_file_as_dict(direc: str) -> dict:
     '''
     Receives the directory of the specified yaml file, loads the data, and returns as a dict.
@@ -25,26 +38,29 @@ def load_yaml_file_as_dict(direc: str) -> dict:
 
 def insert_data_into_schema(schema: dict, data: dict) -> Tuple[bool, Union[dict, None]]:
     '''
-    Inserts the data into the given schema and assigns it to be checked.
+    Creates a copy of the given schema with the data inserted and assigned to be checked.
+    The given schema is never modified, so a schema shared between
+    requests can be used by any amount of threads at once.
 
-    schema (dict): the dict add the data to
+    schema (dict): the schema to add the data to
     data (dict): a dictionary of the data to add to the schema
 
-    return (bool, [dict, None]): returns a success flag and the modified data
+    return (bool, [dict, None]): returns a success flag and the new schema
     '''
 
     try:
+        request_schema = {}
+
         for field, field_data in schema.items():
             extracted_data = data.get(field)
-            field_data['data'] = extracted_data
-
-            if extracted_data is not None:
-                field_data['check'] = True
 
-            else:
-                field_data['check'] = False
+            request_schema[field] = {
+                **field_data,
+                'data': extracted_data,
+                'check': extracted_data is not None
+            }
 
-        return True, schema
+        return True, request_schema
     
     except (AttributeError, TypeError):
         return False, None
@@ -53,40 +69,36 @@ def insert_data_into_schema(schema: dict, data: dict) -> Tuple[bool, Union[dict,
 def format_schema_data_types(schema: dict, to_string: bool=True) -> dict:
     '''
     Converts the type of data to a string, making it more manageable.
+    A copy of the schema is returned, the given schema is never modified.
 
     schema (dict):  the dict with the data types
     to_string (bool): whether to convert types to strings
 
-    return (bool, [dict, None]): returns a success flag and the modified data
+    return (dict): returns the schema with the converted types
     '''
 
-    type_map = {
-        'str': str,
-        'int': int,
-        'float': float,
-        'bool': bool,
-        'list': list,
-        'dict': dict,
-        'email': 'email',
-        'str_uuid': 'str_uuid',
-        'unix': 'unix',
-    }
-
-    for _, field_data in schema.items():
+    formatted_schema = {}
+
+    for field, field_data in schema.items():
+        field_type = field_data['type']
+
         if to_string:
-            if isinstance(field_data['type'], type):
-                field_data['type'] = field_data['type'].__name__
+            if isinstance(field_type, type):
+                field_type = field_type.__name__
         else:
-            if isinstance(field_data['type'], str):
-                field_data['type'] = type_map.get(field_data['type'], field_data['type'])
+            if isinstance(field_type, str):
+                field_type = SCHEMA_TYPES.get(field_type, field_type)
+
+        formatted_schema[field] = { **field_data, 'type': field_type }
 
-    return schema
+    return formatted_schema
 
 
 def get_verification_schema(config: dict, data: dict) -> Tuple[bool, str, Union[dict, None]]:
     '''
     Fetches a formatted schema with the relevant data
     to be used for data validation.
+    The config is left unchanged, each request receives its own schema.
 
     config (dict): the foundational schema to be modified and completed
     data (dict): the data to be inserted into the schema
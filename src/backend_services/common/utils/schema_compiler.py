@@ -0,0 +1,280 @@
+'''
+Compiles the yaml verification schemas into immutable validator objects.
+
+Schemas are compiled once when a service starts. Every field holds a
+checker with its restrictions already parsed, so validating a request
+is a single loop over the fields without re-reading the yaml config.
+'''
+
+from dataclasses import dataclass, replace
+from functools import partial
+from typing import Any, Awaitable, Callable, Iterable, Self, Tuple, Union
+
+from src.backend_services.common.utils.data_verification import combine_field_results, get_validator, DataVerification
+from src.backend_services.common.utils.field_checks import async_run_checks, run_checks
+from src.backend_services.common.utils.domain_cache import resolve_domains
+from src.backend_services.common.utils.schema import SCHEMA_TYPES
+
+
+FIELD_CHECKER = Callable[[Any], Tuple[bool, list]]
+ASYNC_FIELD_CHECKER = Callable[[Any], Awaitable[Tuple[bool, list]]]
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledField:
+    '''
+    A single field of a compiled schema.
+    '''
+
+    name: str
+    type: Union[type, str]
+    checker: FIELD_CHECKER
+    optional: bool = False
+    skip_empty: bool = False
+    async_checker: Union[ASYNC_FIELD_CHECKER, None] = None
+    io_bound: bool = False
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledSchema:
+    '''
+    A compiled schema, validating the fields of a request.
+    '''
+
+    fields: Tuple[CompiledField, ...]
+
+
+    def validate(cls: Self, data: dict) -> Tuple[bool, list]:
+        '''
+        Validates the request data against every field within the schema.
+        Follows the same rules as DataVerification.verify_data, where
+        fields missing from the data (None) are not checked.
+        Io bound fields are checked concurrently within the deadline.
+
+        cls (Self): the CompiledSchema class
+        data (dict): the request data keyed by field name
+
+        return (bool, list): a success flag and the errors detected are returned
+        '''
+
+        fields = cls.fields_to_check(data)
+
+        field_results = run_checks(
+            (field.name, field.io_bound, partial(field.checker, data[field.name])) for field in fields
+        )
+
+        return combine_field_results([
+            (field.optional, success, errors) for field, (success, errors) in zip(fields, field_results)
+        ])
+
+
+    async def async_validate(cls: Self, data: dict) -> Tuple[bool, list]:
+        '''
+        The asyncio counterpart of validate.
+        Fields with async checkers, such as emails looking up
+        their domain, are all checked concurrently within the deadline.
+
+        cls (Self): the CompiledSchema class
+        data (dict): the request data keyed by field name
+
+        return (bool, list): a success flag and the errors detected are returned
+        '''
+
+        fields = cls.fields_to_check(data)
+
+        field_results = await async_run_checks(
+            (field.name, partial(run_field_checker, field, data[field.name])) for field in fields
+        )
+
+        return combine_field_results([
+            (field.optional, success, errors) for field, (success, errors) in zip(fields, field_results)
+        ])
+
+
+    def fields_to_check(cls: Self, data: dict) -> list:
+        '''
+        Finds the fields to check within the request data.
+        Follows the same rules as DataVerification.verify_data, where
+        fields missing from the data (None) are not checked.
+
+        cls (Self): the CompiledSchema class
+        data (dict): the request data keyed by field name
+
+        return (list): the fields to check
+        '''
+
+        fields = []
+
+        for field in cls.fields:
+            value = data.get(field.name)
+
+            if value is None:
+                continue
+
+            if field.skip_empty and value == '':
+                continue
+
+            fields.append(field)
+
+        return fields
+
+
+async def run_field_checker(field: CompiledField, value: Any) -> Tuple[bool, list]:
+    '''
+    Checks the value with the async checker of the field when available,
+    otherwise the checker is ran directly.
+
+    field (CompiledField): the field being checked
+    value (Any): the data to be verified
+
+    return (bool, list): returns a success flag and a list of errors detected
+    '''
+
+    if field.async_checker is None:
+        return field.checker(value)
+
+    return await field.async_checker(value)
+
+
+def compile_checker(name: str, field_type: Union[type, str], restrictions: dict, verifier: DataVerification) -> Tuple[FIELD_CHECKER, Union[ASYNC_FIELD_CHECKER, None]]:
+    '''
+    Creates the checkers of a field from the validator registered for its type.
+    Validators with a compiler have their restrictions parsed once.
+
+    name (str): the name of the field
+    field_type ([type, str]): the type of the field
+    restrictions (dict): the restrictions of the field
+    verifier (DataVerification): the verification class the checker is bound to
+
+    return (FIELD_CHECKER, [ASYNC_FIELD_CHECKER, None]): the checker and the async checker when the validator has one
+    '''
+
+    validator = get_validator(field_type)
+
+    if validator is None:
+        raise ValueError(f'Type {getattr(field_type, "__name__", field_type)} Is Not Supported')
+
+    if validator.compiler is not None:
+        checker = validator.compiler(verifier, name, restrictions)
+
+    else:
+        checker = partial(validator.verify, verifier, name, restrictions=restrictions)
+
+    async_checker = None
+
+    if validator.async_verify is not None:
+        async_checker = partial(validator.async_verify, verifier, name, restrictions=restrictions)
+
+    return checker, async_checker
+
+
+def compile_schema(config: dict, verifier: DataVerification=None) -> CompiledSchema:
+    '''
+    Compiles a single schema from a yaml file.
+    Invalid restrictions raise an error so they are found when the service starts.
+
+    config (dict): the schema as loaded from the yaml file
+    verifier (DataVerification): the verification class the checkers are bound to [default - None]
+
+    return (CompiledSchema): the compiled schema
+    '''
+
+    if config is None:
+        raise ValueError('Server Error: Required Schema Not Downloaded')
+
+    if verifier is None:
+        verifier = DataVerification()
+
+    fields = []
+
+    for name, field_config in config.items():
+        field_type = field_config['type']
+
+        if isinstance(field_type, str):
+            field_type = SCHEMA_TYPES.get(field_type, field_type)
+
+        try:
+            checker, async_checker = compile_checker(name, field_type, field_config.get('restrictions', {}), verifier)
+
+        except ValueError as e:
+            raise ValueError(f'Server Error: Schema Field {name} Incorrectly Formatted. {e}') from e
+
+        fields.append(CompiledField(
+            name=name,
+            type=field_type,
+            checker=checker,
+            optional=bool(field_config.get('optional', False)),
+            skip_empty=bool(field_config.get('skip_empty', False)),
+            async_checker=async_checker,
+            io_bound=get_validator(field_type).io_bound
+        ))
+
+    return CompiledSchema(tuple(fields))
+
+
+def compile_schemas(schemas: dict, verifier: DataVerification=None) -> dict:
+    '''
+    Compiles every schema within a yaml file.
+
+    schemas (dict): the yaml file as a dictionary of schemas
+    verifier (DataVerification): the verification class the checkers are bound to [default - None]
+
+    return (dict): the compiled schemas keyed by schema name
+    '''
+
+    if verifier is None:
+        verifier = DataVerification()
+
+    return { name: compile_schema(config, verifier) for name, config in schemas.items() }
+
+
+def verify_many(schema: Union[CompiledSchema, dict], payloads: Iterable[dict], verifier: DataVerification=None) -> Tuple[bool, list]:
+    '''
+    Validates a batch of requests against the same schema, such as
+    when importing accounts. The schema is compiled once for the whole
+    batch and each unique email domain is looked up once, with the
+    lookups made concurrently before any request is validated.
+
+    schema ([CompiledSchema, dict]): a compiled schema or the schema as loaded from the yaml file
+    payloads (Iterable[dict]): the request data of each record
+    verifier (DataVerification): the verification class the checkers are bound to [default - None]
+
+    return (bool, list): a flag set when every record is valid and the success flag and errors of each record
+    '''
+
+    if verifier is None:
+        verifier = DataVerification()
+
+    if not isinstance(schema, CompiledSchema):
+        schema = compile_schema(schema, verifier)
+
+    payloads = list(payloads)
+    email_fields = [field.name for field in schema.fields if field.type == 'email']
+
+    if len(email_fields) != 0:
+        domains = []
+
+        for data in payloads:
+            for name in email_fields:
+                value = data.get(name)
+
+                if value is None:
+                    continue
+
+                success, _, domain = verifier.verify_email_format(name, value)
+
+                if success:
+                    domains.append(domain)
+
+        domain_statuses = resolve_domains(domains)
+
+        schema = CompiledSchema(tuple(
+            # The domains are already looked up so the checks no longer wait on io
+            replace(field, checker=partial(verifier.verify_email_data, field.name, domain_statuses=domain_statuses), io_bound=False)
+            if field.type == 'email' else field
+            for field in schema.fields
+        ))
+
+    results = [schema.validate(data) for data in payloads]
+
+    return all(success for success, _ in results), results
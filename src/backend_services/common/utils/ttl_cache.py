@@ -0,0 +1,145 @@
+'''
+Contains the bounded in-process cache shared by the services.
+
+Entries are held in least recently used order and every entry expires
+after its time to live, given per entry or defaulting to the time to
+live of the cache. The least recently used entry is removed once the
+cache is full.
+'''
+
+import threading
+import time
+
+from collections import OrderedDict
+from typing import Any, Hashable, Self, Union
+
+
+class TTLCache():
+    '''
+    A bounded least recently used cache where every entry
+    expires after its time to live.
+    All operations are thread safe.
+    '''
+
+    def __init__(cls: Self, max_size: int, ttl: float=0) -> None:
+        '''
+        Initialises an empty cache.
+
+        cls (Self): the TTLCache class
+        max_size (int): the maximum amount of entries held
+        ttl (float): how long (seconds) an entry is valid for when not given to set [default - 0]
+
+        return (None):
+        '''
+
+        cls.max_size = max_size
+        cls.ttl = ttl
+
+        cls.entries = OrderedDict()
+        cls.lock = threading.Lock()
+
+        cls.hits = 0
+        cls.misses = 0
+
+
+    def get(cls: Self, key: Hashable) -> Union[Any, None]:
+        '''
+        Fetches a cached value if it exists and has not expired.
+
+        cls (Self): the TTLCache class
+        key (Hashable): the key of the entry
+
+        return ([Any, None]): the cached value or None if not cached
+        '''
+
+        with cls.lock:
+            entry = cls.entries.get(key)
+
+            if entry is None:
+                cls.misses += 1
+                return None
+
+            expires_at, value = entry
+
+            if expires_at < time.monotonic():
+                del cls.entries[key]
+                cls.misses += 1
+
+                return None
+
+            cls.entries.move_to_end(key)
+            cls.hits += 1
+
+            return value
+
+
+    def set(cls: Self, key: Hashable, value: Any, ttl: Union[float, None]=None) -> None:
+        '''
+        Caches a value, removing the least recently used entry when full.
+        Values with a time to live of 0 or less are not cached.
+
+        cls (Self): the TTLCache class
+        key (Hashable): the key of the entry
+        value (Any): the value to cache
+        ttl ([float, None]): how long (seconds) the value is valid for [default - None, the ttl of the cache]
+
+        return (None):
+        '''
+
+        if ttl is None:
+            ttl = cls.ttl
+
+        if cls.max_size <= 0 or ttl <= 0:
+            return
+
+        with cls.lock:
+            cls.entries[key] = (time.monotonic() + ttl, value)
+            cls.entries.move_to_end(key)
+
+            while len(cls.entries) > cls.max_size:
+                cls.entries.popitem(last=False)
+
+
+    def invalidate(cls: Self, key: Hashable) -> None:
+        '''
+        Removes an entry from the cache.
+
+        cls (Self): the TTLCache class
+        key (Hashable): the key of the entry
+
+        return (None):
+        '''
+
+        with cls.lock:
+            cls.entries.pop(key, None)
+
+
+    def clear(cls: Self) -> None:
+        '''
+        Removes every entry from the cache.
+
+        cls (Self): the TTLCache class
+
+        return (None):
+        '''
+
+        with cls.lock:
+            cls.entries.clear()
+
+
+    def stats(cls: Self) -> dict:
+        '''
+        Fetches the usage of the cache.
+
+        cls (Self): the TTLCache class
+
+        return (dict): the size, limit, hits and misses of the cache
+        '''
+
+        with cls.lock:
+            return {
+                'size': len(cls.entries),
+                'max_size': cls.max_size,
+                'hits': cls.hits,
+                'misses': cls.misses
+            }
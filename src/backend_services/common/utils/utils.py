@@ -2,18 +2,21 @@
 This file holds all the common utility functions that are currently uncategorised.
 '''
 
+from typing import Union
+
 from src.backend_services.account.database.models import User
+from src.backend_services.account.database.queries import UserProfile
 from src.backend_services.common.proto.user_login_pb2 import UserData
 
 
-def user_proto_format(user: User) -> UserData:
+def user_proto_format(user: Union[User, UserProfile]) -> UserData:
     '''
     This function takes the entire object row of the searched
     user and filters the data to only include publically accessible
     information. Once filtered down it inserts the data into a
     proto message ready to be sent to the client.
 
-    user (User): the sqlalchemy user object containing one user
+    user ([User, UserProfile]): the sqlalchemy user object or the profile of one user
 
     return (UserData): filtered down data of the relevant user
     '''
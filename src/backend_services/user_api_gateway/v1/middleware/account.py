@@ -7,7 +7,7 @@ import json
 
 from fastapi import HTTPException, Cookie
 
-from src.backend_services.common.redis.user_sessions import check_session
+from src.backend_services.user_api_gateway.v1.utils.session_cache import check_cached_session, get_cached_session_user_data
 
 
 async def is_user_logged_in(
@@ -34,7 +34,37 @@ async def is_user_logged_in(
     except json.JSONDecodeError:
         raise HTTPException(status_code=400, detail='Cookies Provided Incorrectly Formatted')
 
-    success, message = check_session(session_dict.get('session_uuid'), user_dict.get('uuid'))
+    success, message = await check_cached_session(session_dict.get('session_uuid'), user_dict.get('uuid'))
 
     if not success:
         raise HTTPException(status_code=400, detail=message)
+
+
+async def is_user_admin(
+        session: str = Cookie(default=None),
+        user: str = Cookie(default=None)
+    ) -> None:
+
+    '''
+    Checks whether the user is logged in as an admin.
+    The role is read from the session rather than the user cookie,
+    as the cookie can be modified by the client.
+
+    session (str): the session object containing the session_uuid and expiry time [default - No Cookie]
+    user (str): the user object containing the users public data [default - No Cookie]
+
+    return (None):
+    '''
+
+    await is_user_logged_in(session, user)
+
+    user_dict = json.loads(user)
+    session_dict = json.loads(session)
+
+    success, message, user_data = await get_cached_session_user_data(session_dict.get('session_uuid'), user_dict.get('uuid'))
+
+    if not success:
+        raise HTTPException(status_code=400, detail=message)
+
+    if user_data.get('user_role') != 'Admin':
+        raise HTTPException(status_code=403, detail='You Do Not Have Permission To Perform This Action')
@@ -6,17 +6,16 @@ in relation to account modifications.
 import json
 
 from fastapi import APIRouter, Response, Cookie, Depends
-from functools import partial
 from pydantic import BaseModel
 
 from src.backend_services.common.gRPC.data_conversion import get_status_response_data, get_user_response_data
-from src.backend_services.common.gRPC.server_connection import ServerCommunication
+from src.backend_services.common.gRPC.async_server_connection import AsyncServerCommunication
 from src.backend_services.common.proto import user_actions_pb2
 from src.backend_services.common.proto.user_actions_pb2_grpc import UserSettingsServiceStub
-from src.backend_services.common.redis.fetch_session_data import get_session_user_data
 
 from src.backend_services.user_api_gateway.v1.middleware.account import is_user_logged_in
 from src.backend_services.user_api_gateway.v1.utils.get_clients import get_grpc_account_client
+from src.backend_services.user_api_gateway.v1.utils.session_cache import get_cached_session_user_data, session_cache
 
 
 router = APIRouter()
@@ -52,7 +51,7 @@ class ChangeDetailsRequest(BaseModel):
 
 @router.get('/fetch-data', dependencies=[Depends(is_user_logged_in)])
 async def fetch_user_data(
-        client: ServerCommunication = Depends(get_grpc_account_client),
+        client: AsyncServerCommunication = Depends(get_grpc_account_client),
         session: str = Cookie(),
         user: str = Cookie()
     ) -> dict:
@@ -60,7 +59,7 @@ async def fetch_user_data(
     '''
     Fetches the users data from the account-service and returns it as a dictionary.
 
-    client (ServerCommunication): the class object used to communicate to the specific server [default - account-service object]
+    client (AsyncServerCommunication): the class object used to communicate to the specific server [default - account-service object]
     session (str): the session object containing the session_uuid and expiry time [default - No Cookie]
     user (str): the user object containing the users public data [default - No Cookie]
 
@@ -73,7 +72,7 @@ async def fetch_user_data(
     session_uuid = session_dict.get('session_uuid')
     user_uuid = user_dict.get('uuid')
 
-    success, message, session_user_data = get_session_user_data(session_uuid, user_uuid)
+    success, message, session_user_data = await get_cached_session_user_data(session_uuid, user_uuid)
 
     if not success:
         return {
@@ -88,7 +87,7 @@ async def fetch_user_data(
         user_uuid=session_user_data.get('uuid')
     )
 
-    success, data = client.grpc_request('GetBasicAccountData', partial(UserSettingsServiceStub), data)
+    success, data = await client.grpc_request('GetBasicAccountData', UserSettingsServiceStub, data, idempotent=True)
 
     if not success:
         return {
@@ -109,7 +108,7 @@ async def fetch_user_data(
 @router.post('/change-email', dependencies=[Depends(is_user_logged_in)])
 async def change_user_email(
         request_data: ChangeEmailRequest,
-        client: ServerCommunication = Depends(get_grpc_account_client),
+        client: AsyncServerCommunication = Depends(get_grpc_account_client),
         session: str = Cookie(),
         user: str = Cookie()
     ) -> dict:
@@ -121,7 +120,7 @@ async def change_user_email(
     use their account.
 
     request_data (ChangeEmailRequest): class containing all the expected inputs from the client
-    client (ServerCommunication): the class object used to communicate to the specific server [default - account-service object]
+    client (AsyncServerCommunication): the class object used to communicate to the specific server [default - account-service object]
     session (str): the session object containing the session_uuid and expiry time [default - No Cookie]
     user (str): the user object containing the users public data [default - No Cookie]
 
@@ -134,7 +133,7 @@ async def change_user_email(
     session_uuid = session_dict.get('session_uuid')
     user_uuid = user_dict.get('uuid')
 
-    success, message, session_user_data = get_session_user_data(session_uuid, user_uuid)
+    success, message, session_user_data = await get_cached_session_user_data(session_uuid, user_uuid)
 
     if not success:
         return {
@@ -152,7 +151,7 @@ async def change_user_email(
         new_email=request_data.new_email
     )
 
-    success, data = client.grpc_request('UpdateUserEmail', partial(UserSettingsServiceStub), data)
+    success, data = await client.grpc_request('UpdateUserEmail', UserSettingsServiceStub, data)
 
     if not success:
         return {
@@ -165,6 +164,7 @@ async def change_user_email(
         }
 
     http_status = get_status_response_data(data)
+    session_cache.invalidate((session_uuid, user_uuid))
 
     return { 'status': http_status, 'otp_required': data.otp_required }
 
@@ -172,7 +172,7 @@ async def change_user_email(
 @router.post('/change-password', dependencies=[Depends(is_user_logged_in)])
 async def change_user_password(
         request_data: ChangePasswordRequest,
-        client: ServerCommunication = Depends(get_grpc_account_client),
+        client: AsyncServerCommunication = Depends(get_grpc_account_client),
         session: str = Cookie(),
         user: str = Cookie()
     ) -> dict:
@@ -183,7 +183,7 @@ async def change_user_password(
     can change their password.
 
     request_data (ChangePasswordRequest): class containing all the expected inputs from the client
-    client (ServerCommunication): the class object used to communicate to the specific server [default - account-service object]
+    client (AsyncServerCommunication): the class object used to communicate to the specific server [default - account-service object]
     session (str): the session object containing the session_uuid and expiry time [default - No Cookie]
     user (str): the user object containing the users public data [default - No Cookie]
 
@@ -196,7 +196,7 @@ async def change_user_password(
     session_uuid = session_dict.get('session_uuid')
     user_uuid = user_dict.get('uuid')
 
-    success, message, session_user_data = get_session_user_data(session_uuid, user_uuid)
+    success, message, session_user_data = await get_cached_session_user_data(session_uuid, user_uuid)
 
     if not success:
         return {
@@ -214,7 +214,7 @@ async def change_user_password(
         new_password=request_data.new_password
     )
 
-    success, data = client.grpc_request('UpdateUserPassword', partial(UserSettingsServiceStub), data)
+    success, data = await client.grpc_request('UpdateUserPassword', UserSettingsServiceStub, data)
 
     if not success:
         return {
@@ -234,7 +234,7 @@ async def change_user_password(
 @router.post('/change-details', dependencies=[Depends(is_user_logged_in)])
 async def change_user_details(
         request_data: ChangeDetailsRequest,
-        client: ServerCommunication = Depends(get_grpc_account_client),
+        client: AsyncServerCommunication = Depends(get_grpc_account_client),
         session: str = Cookie(),
         user: str = Cookie()
     ) -> dict:
@@ -247,7 +247,7 @@ async def change_user_details(
 
     request_data (ChangeDetailsRequest): class containing all the expected inputs from the client
     response (Response): the response object FastAPI send to the client
-    client (ServerCommunication): the class object used to communicate to the specific server [default - account-service object]
+    client (AsyncServerCommunication): the class object used to communicate to the specific server [default - account-service object]
     session (str): the session object containing the session_uuid and expiry time [default - No Cookie]
     user (str): the user object containing the users public data [default - No Cookie]
 
@@ -260,7 +260,7 @@ async def change_user_details(
     session_uuid = session_dict.get('session_uuid')
     user_uuid = user_dict.get('uuid')
 
-    success, message, session_user_data = get_session_user_data(session_uuid, user_uuid)
+    success, message, session_user_data = await get_cached_session_user_data(session_uuid, user_uuid)
 
     if not success:
         return {
@@ -279,7 +279,7 @@ async def change_user_details(
         date_of_birth=request_data.date_of_birth
     )
 
-    success, data = client.grpc_request('UpdateUserDetails', partial(UserSettingsServiceStub), data)
+    success, data = await client.grpc_request('UpdateUserDetails', UserSettingsServiceStub, data)
 
     if not success:
         return {
@@ -300,7 +300,7 @@ async def change_user_details(
 @router.delete('/delete-account', dependencies=[Depends(is_user_logged_in)])
 async def delete_user_account(
         response: Response,
-        client: ServerCommunication = Depends(get_grpc_account_client),
+        client: AsyncServerCommunication = Depends(get_grpc_account_client),
         session: str = Cookie(),
         user: str = Cookie()
     ) -> dict:
@@ -313,7 +313,7 @@ async def delete_user_account(
     analysis methods.
 
     response (Response): the response object FastAPI send to the client
-    client (ServerCommunication): the class object used to communicate to the specific server [default - account-service object]
+    client (AsyncServerCommunication): the class object used to communicate to the specific server [default - account-service object]
     session (str): the session object containing the session_uuid and expiry time [default - No Cookie]
     user (str): the user object containing the users public data [default - No Cookie]
 
@@ -326,7 +326,7 @@ async def delete_user_account(
     session_uuid = session_dict.get('session_uuid')
     user_uuid = user_dict.get('uuid')
 
-    success, message, session_user_data = get_session_user_data(session_uuid, user_uuid)
+    success, message, session_user_data = await get_cached_session_user_data(session_uuid, user_uuid)
 
     if not success:
         return {
@@ -341,7 +341,7 @@ async def delete_user_account(
         user_uuid=session_user_data.get('uuid')
     )
 
-    success, data = client.grpc_request('DeleteAccount', partial(UserSettingsServiceStub), data)
+    success, data = await client.grpc_request('DeleteAccount', UserSettingsServiceStub, data)
 
     if not success:
         return {
@@ -354,7 +354,8 @@ async def delete_user_account(
         }
 
     http_status = get_status_response_data(data, embedded=False)
-    
+    session_cache.invalidate((session_uuid, user_uuid))
+
     response.delete_cookie(key="user")
     response.delete_cookie(key="session")
 
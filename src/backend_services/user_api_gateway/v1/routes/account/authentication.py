@@ -7,19 +7,18 @@ a user within the gateway API server.
 import json
 
 from fastapi import APIRouter, Response, Cookie, Depends
-from functools import partial
 from pydantic import BaseModel
 
-from src.backend_services.common.gRPC.server_connection import ServerCommunication
+from src.backend_services.common.gRPC.async_server_connection import AsyncServerCommunication
 from src.backend_services.common.gRPC.data_conversion import get_session_response_data, \
     get_status_response_data, get_user_response_data
 from src.backend_services.common.proto import user_login_pb2
 from src.backend_services.common.proto.user_login_pb2_grpc import UserAuthServiceStub
-from src.backend_services.common.redis.fetch_session_data import get_session_user_data
 
 from src.backend_services.user_api_gateway.v1.middleware.account import is_user_logged_in
 from src.backend_services.user_api_gateway.v1.routes.account.actions import router as settings_router
 from src.backend_services.user_api_gateway.v1.utils.get_clients import get_grpc_account_client
+from src.backend_services.user_api_gateway.v1.utils.session_cache import get_cached_session_user_data, session_cache
 
 
 router = APIRouter(prefix='/account')
@@ -59,14 +58,14 @@ class OTPEmailRequest(BaseModel):
 
 
 @router.post('/register')
-async def register_user(request_data: RegisterRequest, response: Response, client: ServerCommunication = Depends(get_grpc_account_client)) -> dict:
+async def register_user(request_data: RegisterRequest, response: Response, client: AsyncServerCommunication = Depends(get_grpc_account_client)) -> dict:
     '''
     Attempts to register a new user using the data provided by the client.
     Newly created accounts need to be verified before use.
 
     request_data (LoginRequest): class containing all the expected inputs from the client
     response (Response): the response object FastAPI send to the client
-    client (ServerCommunication): the class object used to communicate to the specific server [default - account-service object]
+    client (AsyncServerCommunication): the class object used to communicate to the specific server [default - account-service object]
 
     return (dict): returns a dict containing the response data
     '''
@@ -80,7 +79,7 @@ async def register_user(request_data: RegisterRequest, response: Response, clien
         gender=request_data.gender
     )
 
-    success, data = client.grpc_request('UserRegistration', partial(UserAuthServiceStub), data)
+    success, data = await client.grpc_request('UserRegistration', UserAuthServiceStub, data)
 
     if not success:
         return {
@@ -101,14 +100,14 @@ async def register_user(request_data: RegisterRequest, response: Response, clien
 
 
 @router.post('/login')
-async def login_user(request_data: LoginRequest, response: Response, client: ServerCommunication = Depends(get_grpc_account_client)) -> dict:
+async def login_user(request_data: LoginRequest, response: Response, client: AsyncServerCommunication = Depends(get_grpc_account_client)) -> dict:
     '''
     Attempts to log in the client to the account with
     the specified account details provided.
 
     request_data (LoginRequest): class containing all the expected inputs from the client
     response (Response): the response object FastAPI send to the client
-    client (ServerCommunication): the class object used to communicate to the specific server [default - account-service object]
+    client (AsyncServerCommunication): the class object used to communicate to the specific server [default - account-service object]
 
     return (dict): returns a dict containing the response data
     '''
@@ -118,7 +117,7 @@ async def login_user(request_data: LoginRequest, response: Response, client: Ser
         password=request_data.password
     )
 
-    success, data = client.grpc_request('UserLogin', partial(UserAuthServiceStub), data)
+    success, data = await client.grpc_request('UserLogin', UserAuthServiceStub, data)
 
     if not success:
         return {
@@ -144,7 +143,7 @@ async def login_user(request_data: LoginRequest, response: Response, client: Ser
 async def otp_verification(
     request_data: OTPEmailRequest,
     response: Response,
-    client: ServerCommunication = Depends(get_grpc_account_client),
+    client: AsyncServerCommunication = Depends(get_grpc_account_client),
     session: str = Cookie(default=None)
     ) -> dict:
 
@@ -154,7 +153,7 @@ async def otp_verification(
 
     request_data (OTPEmailRequest): class containing all the expected inputs from the client
     response (Response): the response object FastAPI send to the client
-    client (ServerCommunication): the class object used to communicate to the specific server [default - account-service object]
+    client (AsyncServerCommunication): the class object used to communicate to the specific server [default - account-service object]
     session (str): the session object containing the session_uuid and expiry time [default - No Cookie]
 
     return (dict): returns a dict containing the response data
@@ -194,7 +193,7 @@ async def otp_verification(
         return_action=request_data.return_action
     )
 
-    success, data = client.grpc_request('OTPVerification', partial(UserAuthServiceStub), data)
+    success, data = await client.grpc_request('OTPVerification', UserAuthServiceStub, data)
 
     if not success:
         return {
@@ -220,7 +219,7 @@ async def otp_verification(
 @router.post('/logout', dependencies=[Depends(is_user_logged_in)])
 async def logout_user(
         response: Response,
-        client: ServerCommunication = Depends(get_grpc_account_client),
+        client: AsyncServerCommunication = Depends(get_grpc_account_client),
         session: str = Cookie(default=None),
         user: str = Cookie(default=None)
     ) -> dict:
@@ -231,7 +230,7 @@ async def logout_user(
     Deletes the cookies related to the account when logged out.
 
     response (Response): the response object FastAPI send to the client
-    client (ServerCommunication): the class object used to communicate to the specific server [default - account-service object]
+    client (AsyncServerCommunication): the class object used to communicate to the specific server [default - account-service object]
     session (str): the session object containing the session_uuid and expiry time [default - No Cookie]
     user (str): the user object containing the users public data [default - No Cookie]
 
@@ -263,7 +262,7 @@ async def logout_user(
     session_uuid = session_dict.get('session_uuid')
     user_uuid = user_dict.get('uuid')
 
-    success, message, session_user_data = get_session_user_data(session_uuid, user_uuid)
+    success, message, session_user_data = await get_cached_session_user_data(session_uuid, user_uuid)
 
     if not success:
         return {
@@ -279,7 +278,7 @@ async def logout_user(
         user_uuid=session_user_data.get('uuid')
     )
 
-    success, data = client.grpc_request('UserLogout', partial(UserAuthServiceStub), data)
+    success, data = await client.grpc_request('UserLogout', UserAuthServiceStub, data)
 
     if not success:
         return {
@@ -291,6 +290,8 @@ async def logout_user(
             }
         }
 
+    session_cache.invalidate((session_uuid, user_uuid))
+
     response.delete_cookie(key="user")
     response.delete_cookie(key="session")
 
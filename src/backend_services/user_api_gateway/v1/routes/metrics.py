@@ -0,0 +1,42 @@
+'''
+Routes exposing the internal state of the gateway server.
+Used to monitor the connections the gateway holds to other services,
+only admins are able to view them.
+'''
+
+from fastapi import APIRouter, Depends
+
+from src.backend_services.common.gRPC.async_server_connection import AsyncServerCommunication
+from src.backend_services.common.redis.async_profile_cache import async_get_profile_cache_stats
+from src.backend_services.common.redis.async_redis import get_async_redis_pool_stats, get_published_pool_stats
+
+from src.backend_services.user_api_gateway.v1.middleware.account import is_user_admin
+from src.backend_services.user_api_gateway.v1.utils.get_clients import get_grpc_account_client
+from src.backend_services.user_api_gateway.v1.utils.session_cache import session_cache
+
+
+router = APIRouter(prefix='/metrics')
+
+
+@router.get('/connections', dependencies=[Depends(is_user_admin)])
+async def connection_metrics(client: AsyncServerCommunication = Depends(get_grpc_account_client)) -> dict:
+    '''
+    Fetches the state of every connection held by the gateway.
+
+    client (AsyncServerCommunication): the class object used to communicate to the specific server [default - account-service object]
+
+    return (dict): returns a dict containing the gRPC channel, redis pools, session and profile cache metrics
+    '''
+
+    _, _, profile_cache_stats = await async_get_profile_cache_stats()
+    _, _, service_pool_stats = await get_published_pool_stats()
+
+    return {
+        'grpc': {
+            'account_service': client.get_metrics()
+        },
+        'redis_pool': get_async_redis_pool_stats(),
+        'service_redis_pools': service_pool_stats,
+        'session_cache': session_cache.stats(),
+        'profile_cache': profile_cache_stats
+    }
@@ -5,23 +5,53 @@ The root file to run the FastAPI user_api_gateway server v1
 import os
 import uvicorn
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
-from src.backend_services.common.gRPC.connection_objects import account_client
+from src.backend_services.common.gRPC.connection_objects import async_account_client
+from src.backend_services.common.redis.async_redis import init_async_redis_pool, close_async_redis_pool
 
 from src.backend_services.user_api_gateway.v1.routes.account.authentication import router as account_router
+from src.backend_services.user_api_gateway.v1.routes.metrics import router as metrics_router
+from src.backend_services.user_api_gateway.v1.utils.session_cache import start_invalidation_listener, \
+    stop_invalidation_listener
 
 
 PREFIX = '/api/v1'
 
 
-app = FastAPI(redirect_slashes=False)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    '''
+    Starts the background services the gateway relies on
+    and stops them when the gateway shuts down.
 
-app.state.account_grpc_client = account_client
+    app (FastAPI): the gateway server
+    '''
+
+    success, message = await init_async_redis_pool()
+
+    if not success:
+        print('Unable To Create Redis Connection Pool:', message)
+
+    start_invalidation_listener()
+
+    yield
+
+    await stop_invalidation_listener()
+    await close_async_redis_pool()
+
+    await app.state.account_grpc_client.close()
+
+
+app = FastAPI(redirect_slashes=False, lifespan=lifespan)
+
+app.state.account_grpc_client = async_account_client
 
 
 # All routers for the gateway server
 app.include_router(account_router, prefix=PREFIX)
+app.include_router(metrics_router, prefix=PREFIX)
 
 
 if __name__ == "__main__":
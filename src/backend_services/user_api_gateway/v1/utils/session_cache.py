@@ -0,0 +1,232 @@
+'''
+Contains the in-process cache of user sessions used by the gateway.
+Sessions are cached for a short time so that one HTTP request
+only has to fetch the session from redis once, even when it is
+checked by the middleware and then read again by the route.
+
+Cached sessions are dropped as soon as the account-service publishes
+a change to the session (logout, email change, verification), keeping
+every gateway replica consistent with redis.
+'''
+
+import asyncio
+import os
+
+from typing import Self, Tuple, Union
+
+from src.backend_services.common.redis.async_redis import get_async_redis_conn
+from src.backend_services.common.redis.async_user_sessions import async_read_session
+from src.backend_services.common.redis.user_sessions import validate_session_data, SESSION_INVALIDATION_CHANNEL
+from src.backend_services.common.utils.ttl_cache import TTLCache
+
+
+# How long (seconds) a session is cached before being fetched from redis again
+SESSION_CACHE_TTL = float(os.environ.get('GATEWAY_SESSION_CACHE_TTL', 5))
+# The maximum amount of sessions held before the least recently used are removed
+SESSION_CACHE_SIZE = int(os.environ.get('GATEWAY_SESSION_CACHE_SIZE', 10000))
+# How long (seconds) the listener waits for an invalidation before checking again
+# Waiting is bounded here rather than by REDIS_SOCKET_TIMEOUT, so a quiet channel is not treated as a lost connection
+INVALIDATION_POLL_SECONDS = 1.0
+
+
+class SessionCache(TTLCache):
+    '''
+    A bounded least recently used cache of sessions, keyed by
+    the session uuid and user uuid, where every entry expires
+    after the specified time to live.
+    All operations are thread safe.
+    '''
+
+    def __init__(cls: Self, max_size: int=SESSION_CACHE_SIZE, ttl: float=SESSION_CACHE_TTL) -> None:
+        '''
+        Initialises an empty cache.
+
+        cls (Self): the SessionCache class
+        max_size (int): the maximum amount of entries held [default - SESSION_CACHE_SIZE]
+        ttl (float): how long (seconds) an entry is valid for [default - SESSION_CACHE_TTL]
+
+        return (None):
+        '''
+
+        super().__init__(max_size, ttl)
+
+
+    def stats(cls: Self) -> dict:
+        '''
+        Fetches the usage of the cache.
+
+        cls (Self): the SessionCache class
+
+        return (dict): the size, limits, hits and misses of the cache
+        '''
+
+        return { **super().stats(), 'ttl': cls.ttl }
+
+
+session_cache = SessionCache()
+
+_listener = None
+
+
+async def get_session(session_uuid: str, user_uuid: str) -> Tuple[bool, str, Union[dict, None], bool]:
+    '''
+    Fetches the session from the cache, or from redis if not cached.
+
+    session_uuid (str): the clients session uuid identifier
+    user_uuid (str): the users uuid
+
+    return (bool, str, [dict, None], bool): success flag, message, the users data and the verified flag
+    '''
+
+    key = (session_uuid, user_uuid)
+    cached = session_cache.get(key)
+
+    if cached is not None:
+        return True, '', cached[0], cached[1]
+
+    success, message, redis_client = await get_async_redis_conn()
+
+    if not success:
+        return False, message, None, False
+
+    user_data, verified = await async_read_session(redis_client, session_uuid, user_uuid)
+
+    if user_data is not None:
+        session_cache.set(key, (user_data, verified))
+
+    return True, '', user_data, verified
+
+
+async def check_cached_session(session_uuid: str, user_uuid: str) -> Tuple[bool, str]:
+    '''
+    Verifies whether the session that the user currently
+    has is valid and correct, using the cached session if available.
+
+    session_uuid (str): the clients session uuid identifier
+    user_uuid (str): the users uuid
+
+    return (bool, str): success flag and message
+    '''
+
+    success, message, user_data, verified = await get_session(session_uuid, user_uuid)
+
+    if not success:
+        return False, message
+
+    return validate_session_data(user_uuid, user_data, verified)
+
+
+async def get_cached_session_user_data(session_uuid: str, user_uuid: str) -> Tuple[bool, str, Union[dict, None]]:
+    '''
+    Fetches the user data stored within an active session,
+    using the cached session if available.
+
+    session_uuid (str): the clients session uuid identifier
+    user_uuid (str): the users uuid
+
+    return (bool, str, [dict, None]): success flag, message and the users data
+    '''
+
+    success, message, user_data, _ = await get_session(session_uuid, user_uuid)
+
+    if not success:
+        return False, message, None
+
+    if user_data is None:
+        return False, 'Unable To Fetch User Session Data', None
+
+    return True, '', user_data
+
+
+def handle_invalidation(message: dict) -> None:
+    '''
+    Removes the session named in an invalidation message from the cache.
+
+    message (dict): the pub/sub message received from redis
+
+    return (None):
+    '''
+
+    data = message.get('data')
+
+    if isinstance(data, bytes):
+        data = data.decode('utf-8')
+
+    session_uuid, _, user_uuid = str(data).partition(':')
+    session_cache.invalidate((session_uuid, user_uuid))
+
+
+async def listen_for_invalidations() -> None:
+    '''
+    Subscribes to the session invalidation channel until cancelled.
+    Invalidations may have been missed whenever the connection to
+    redis is lost, so every cached session is dropped before resubscribing.
+    A channel without invalidations is idle rather than disconnected,
+    so polling without receiving a message keeps the cache.
+
+    return (None):
+    '''
+
+    while True:
+        try:
+            success, message, redis_client = await get_async_redis_conn()
+
+            if not success:
+                raise ConnectionError(message)
+
+            async with redis_client.pubsub(ignore_subscribe_messages=True) as pubsub:
+                await pubsub.subscribe(SESSION_INVALIDATION_CHANNEL)
+
+                # Entries cached before subscribing may have missed invalidations
+                session_cache.clear()
+
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=INVALIDATION_POLL_SECONDS)
+
+                    if message is not None and message.get('type') == 'message':
+                        handle_invalidation(message)
+
+        except asyncio.CancelledError:
+            raise
+
+        except Exception as e:
+            print('Session Invalidation Listener Error:', e)
+            session_cache.clear()
+
+            # Avoids spinning while redis is unreachable
+            await asyncio.sleep(1)
+
+
+def start_invalidation_listener() -> None:
+    '''
+    Starts listening for session invalidations on the running event loop.
+
+    return (None):
+    '''
+
+    global _listener
+
+    if _listener is None:
+        _listener = asyncio.create_task(listen_for_invalidations())
+
+
+async def stop_invalidation_listener() -> None:
+    '''
+    Stops listening for session invalidations and clears the cache.
+
+    return (None):
+    '''
+
+    global _listener
+
+    if _listener is not None:
+        _listener.cancel()
+
+        try:
+            await _listener
+
+        except asyncio.CancelledError:
+            pass
+
+    _listener = None
+    session_cache.clear()
@@ -0,0 +1,81 @@
+'''
+Benchmark comparing the single pass character class scanner against
+scanning the string once per character class.
+
+A string holding only lower case characters is the worst case for the
+per class scan, as every class other than lower case reads the whole
+string. No external services are required. Run from the project root:
+python -m src.tests.benchmarks.bench_char_classes [iterations]
+'''
+
+import string
+import sys
+import timeit
+
+from src.backend_services.common.utils.data_verification import (
+    classify_characters,
+    CHAR_LOWER_CASE,
+    CHAR_UPPER_CASE,
+    CHAR_NUMBER,
+    CHAR_SYMBOL
+)
+
+
+MAX_LENGTH = 96
+
+
+def per_class_scan(data: str) -> int:
+    '''
+    Finds the character classes of the string with a separate scan per class.
+
+    data (str): the string to classify
+
+    return (int): the CHAR_* flags found within the string
+    '''
+
+    char_classes = 0
+
+    if any(char.islower() for char in data):
+        char_classes |= CHAR_LOWER_CASE
+
+    if any(char.isupper() for char in data):
+        char_classes |= CHAR_UPPER_CASE
+
+    if any(char.isdigit() for char in data):
+        char_classes |= CHAR_NUMBER
+
+    if any(not char.isalnum() for char in data):
+        char_classes |= CHAR_SYMBOL
+
+    return char_classes
+
+
+def main(iterations: int) -> None:
+    '''
+    Times both scanners against maximum length strings.
+
+    iterations (int): the amount of scans timed per repeat
+
+    return (None):
+    '''
+
+    strings = {
+        'worst case': 'a' * MAX_LENGTH,
+        'mixed': (string.ascii_letters + string.digits + string.punctuation + '  ')[:MAX_LENGTH]
+    }
+
+    print(f'Iterations: {iterations}')
+
+    for name, data in strings.items():
+        assert classify_characters(data) == per_class_scan(data)
+
+        per_class_time = min(timeit.repeat(lambda: per_class_scan(data), number=iterations, repeat=3))
+        single_pass_time = min(timeit.repeat(lambda: classify_characters(data), number=iterations, repeat=3))
+
+        print(f'{name:<10} - per class scan: {per_class_time:.4f}s, single pass: {single_pass_time:.4f}s ({per_class_time / single_pass_time:.2f}x)')
+
+
+if __name__ == '__main__':
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    main(iterations)
@@ -0,0 +1,94 @@
+'''
+Benchmark comparing request validation through the previous
+get_verification_schema + DataVerification.verify_data path against
+the schemas compiled by schema_compiler.
+
+No external services are required, the email domain is cached before
+running so DNS is not part of the measurement. Run from the project root:
+python -m src.tests.benchmarks.bench_schema_validation [iterations]
+'''
+
+import sys
+import time
+
+from typing import Callable
+
+from src.backend_services.common.utils.data_verification import DataVerification
+from src.backend_services.common.utils.domain_cache import domain_cache, DomainStatus
+from src.backend_services.common.utils.schema import load_yaml_file_as_dict, get_verification_schema
+from src.backend_services.common.utils.schema_compiler import compile_schema
+
+
+REGISTRATION_DATA = {
+    'email': 'benchmark@example.com',
+    'password': 'Benchmark1Password!',
+    'first_name': 'Bench',
+    'last_name': 'Mark',
+    'gender': 'Other',
+    'date_of_birth': '2000-01-01'
+}
+
+
+def load_auth_config() -> dict:
+    '''
+    Loads the registration schema.
+
+    return (dict): the registration schema
+    '''
+
+    return load_yaml_file_as_dict('src/backend_services/account/verification_config/user_auth.yaml')['auth']
+
+
+def run(validate: Callable[[], tuple], iterations: int) -> float:
+    '''
+    Validates the request repeatedly and returns how many validations completed per second.
+
+    validate (Callable): function performing one validation
+    iterations (int): the amount of validations to make
+
+    return (float): validations per second
+    '''
+
+    start = time.perf_counter()
+
+    for _ in range(iterations):
+        validate()
+
+    return iterations / (time.perf_counter() - start)
+
+
+def main(iterations: int) -> None:
+    '''
+    Benchmarks both validation paths against the same request.
+
+    iterations (int): the amount of validations to make
+
+    return (None):
+    '''
+
+    domain_cache.set('example.com', DomainStatus.VALID, 3600)
+
+    config = load_auth_config()
+    compiled = compile_schema(load_auth_config())
+
+    def previous():
+        _, _, schema = get_verification_schema(config, REGISTRATION_DATA)
+        return DataVerification().verify_data(schema)
+
+    def current():
+        return compiled.validate(REGISTRATION_DATA)
+
+    assert previous() == current()
+
+    previous_rate = run(previous, iterations)
+    current_rate = run(current, iterations)
+
+    print(f'Iterations: {iterations}')
+    print(f'verify_data:     {previous_rate:,.0f} validations/s')
+    print(f'CompiledSchema:  {current_rate:,.0f} validations/s ({current_rate / previous_rate:.2f}x)')
+
+
+if __name__ == '__main__':
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    main(iterations)
@@ -0,0 +1,115 @@
+'''
+Benchmark comparing session validation throughput of the blocking
+redis functions against their asyncio counterparts, both called from
+within an event loop as the gateway does.
+
+Requires a running redis server configured through the usual
+REDIS_* environment variables. Run from the project root:
+python -m src.tests.benchmarks.bench_session_lookup [requests] [concurrency]
+'''
+
+import asyncio
+import sys
+import time
+
+from datetime import date
+from types import SimpleNamespace
+
+from src.backend_services.common.redis.async_redis import init_async_redis_pool, close_async_redis_pool
+from src.backend_services.common.redis.async_user_sessions import async_check_session
+from src.backend_services.common.redis.user_sessions import create_session, check_session, delete_session
+
+
+def create_benchmark_user() -> SimpleNamespace:
+    '''
+    Creates an object holding the same public fields as the User table.
+
+    return (SimpleNamespace): the benchmark user
+    '''
+
+    user = SimpleNamespace(
+        uuid='00000000-0000-4000-8000-000000000000',
+        email='benchmark@example.com',
+        password_last_changed_at=0,
+        first_name='Bench',
+        last_name='Mark',
+        gender='Other',
+        date_of_birth=date(2000, 1, 1),
+        created_at=0,
+        updated_at=0,
+        last_login=0,
+        email_verified=True,
+        user_status='Active',
+        user_role='Customer'
+    )
+
+    user.is_verified = lambda: True
+
+    return user
+
+
+async def run_requests(check, total: int, concurrency: int) -> float:
+    '''
+    Runs the session check as many concurrent requests
+    and returns how many requests completed per second.
+
+    check (Callable): coroutine function performing one request
+    total (int): the total amount of requests to make
+    concurrency (int): how many requests are in flight at once
+
+    return (float): requests per second
+    '''
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request():
+        async with semaphore:
+            await check()
+
+    start = time.perf_counter()
+    await asyncio.gather(*[request() for _ in range(total)])
+
+    return total / (time.perf_counter() - start)
+
+
+async def main(total: int, concurrency: int) -> None:
+    '''
+    Benchmarks both implementations against the same session.
+
+    total (int): the total amount of requests to make
+    concurrency (int): how many requests are in flight at once
+
+    return (None):
+    '''
+
+    user = create_benchmark_user()
+    session_uuid, _ = create_session(user.uuid, user)
+
+    success, message = await init_async_redis_pool()
+
+    if not success:
+        print(message)
+        return
+
+    async def blocking_check():
+        check_session(session_uuid, user.uuid)
+
+    async def async_check():
+        await async_check_session(session_uuid, user.uuid)
+
+    blocking_rps = await run_requests(blocking_check, total, concurrency)
+    async_rps = await run_requests(async_check, total, concurrency)
+
+    print(f'Requests: {total} Concurrency: {concurrency}')
+    print(f'Blocking check_session:    {blocking_rps:,.0f} req/s')
+    print(f'Async async_check_session: {async_rps:,.0f} req/s')
+
+    delete_session(session_uuid, user.uuid)
+    await close_async_redis_pool()
+
+
+if __name__ == '__main__':
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    asyncio.run(main(requests, concurrency))
@@ -0,0 +1,31 @@
+'''
+Shared setup for the standalone tests.
+
+The service modules read their configuration from the environment on
+import, as the servers do within docker. Placeholder values are given
+to the settings without a default so the modules can be imported,
+no database, redis or email connection is made by importing them.
+'''
+
+import os
+import sys
+
+
+TEST_ENVIRONMENT = {
+    'DATABASE_PORT': '5432',
+    'ACCOUNT_MAX_LOGIN_ATTEMPTS': '5',
+    'EMAIL_ENDPOINT': 'https://email.example.com',
+    'EMAIL_CREDENTIAL': 'dGVzdA==',
+    'DEBUG_SEND_EMAILS': '0',
+    'DEBUG_SEND_EMAIL_DAY_LIMIT': '1',
+    'DEBUG_SEND_EMAIL_MINUTE_LIMIT': '1'
+}
+
+for name, value in TEST_ENVIRONMENT.items():
+    os.environ.setdefault(name, value)
+
+# The generated proto modules import each other by module name
+PROTO_DIRECTORY = os.path.join(os.path.dirname(__file__), '..', '..', 'backend_services', 'common', 'proto')
+
+if PROTO_DIRECTORY not in sys.path:
+    sys.path.append(PROTO_DIRECTORY)
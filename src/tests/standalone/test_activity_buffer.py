@@ -0,0 +1,51 @@
+'''
+This file contains the tests for flushing the buffered activity of users
+'''
+
+import pytest
+
+from typing import Dict, Self
+
+from src.backend_services.account.database import activity_buffer
+from src.backend_services.account.database.activity_buffer import ACTIVITY_KEYS, flush_activity
+
+
+class BusyRedis():
+    '''
+    A redis client whose sorted sets are refilled as fast as they are popped,
+    as under steady activity.
+    '''
+
+    def __init__(cls: Self, sizes: Dict[str, int]) -> None:
+        cls.sizes = sizes
+        cls.popped = { key: 0 for key in sizes }
+
+
+    def zcard(cls: Self, key: str) -> int:
+        return cls.sizes[key]
+
+
+    def zpopmin(cls: Self, key: str, count: int) -> list:
+        cls.popped[key] += 1
+        return [(f'user-{index}'.encode('utf-8'), 1.0) for index in range(count)]
+
+
+def test_flush_is_bounded_under_steady_activity(monkeypatch: pytest.MonkeyPatch) -> None:
+    '''
+    This test checks a flush writes at most the batches each column held
+    when it started, so a busy column does not starve the other.
+
+    monkeypatch (MonkeyPatch): the pytest monkeypatch fixture
+
+    return (None):
+    '''
+
+    redis_client = BusyRedis({ ACTIVITY_KEYS['last_login']: 25, ACTIVITY_KEYS['last_activity_at']: 10 })
+    written = []
+
+    monkeypatch.setattr(activity_buffer, 'get_redis_conn', lambda: (True, '', redis_client))
+    monkeypatch.setattr(activity_buffer, 'write_activity_batch', lambda column_name, timestamps: written.append(column_name))
+
+    assert flush_activity(batch_size=10) == 40
+    assert redis_client.popped == { ACTIVITY_KEYS['last_login']: 3, ACTIVITY_KEYS['last_activity_at']: 1 }
+    assert written == ['last_login', 'last_login', 'last_login', 'last_activity_at']
@@ -0,0 +1,175 @@
+'''
+This file contains the tests for the statements and migrations of failed login attempts
+'''
+
+import re
+
+from sqlalchemy.dialects import postgresql
+from typing import Self
+
+from src.backend_services.account.authentication.login_funcs import expired_attempts_statement, \
+    failed_attempts_update, get_failed_attempts
+from src.backend_services.account.database.attempt_sweeper import sweep_statement
+from src.backend_services.account.database.database import Base
+from src.backend_services.account.database.migrations import MIGRATIONS
+from src.backend_services.account.database.models import User
+
+
+def compile_sql(statement) -> str:
+    '''
+    Compiles the statement as postgres would receive it, on a single line.
+
+    statement (Executable): the statement to compile
+
+    return (str): the sql of the statement
+    '''
+
+    sql = str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={ 'literal_binds': True }))
+
+    return re.sub(r'\s+', ' ', sql).replace('( ', '(').strip()
+
+
+def test_expired_attempts_statement() -> None:
+    '''
+    This test checks the expired attempts of only the given user are
+    removed and counted alongside their recorded attempts in one statement.
+
+    return (None):
+    '''
+
+    sql = compile_sql(expired_attempts_statement(7, 1000.0))
+
+    assert sql.startswith('WITH expired_attempts AS (DELETE FROM user_login_attempts '
+        'WHERE user_login_attempts.user_id = 7 AND user_login_attempts.expires < 1000.0 '
+        'RETURNING user_login_attempts.id)')
+    assert '(SELECT count(*) AS count_1 FROM user_login_attempts WHERE user_login_attempts.user_id = 7)' in sql
+    assert '(SELECT count(*) AS count_2 FROM expired_attempts)' in sql
+
+
+def test_failed_attempts_update_is_relative() -> None:
+    '''
+    This test checks the failed login count is changed relative to the
+    stored count, rather than written from the count of the loaded user.
+
+    return (None):
+    '''
+
+    assert compile_sql(failed_attempts_update(7, -2)) == ('UPDATE "user" '
+        'SET failed_login_attempts=("user".failed_login_attempts + -2) '
+        'WHERE "user".id = 7 RETURNING "user".failed_login_attempts')
+
+
+def test_sweep_statement() -> None:
+    '''
+    This test checks a sweep removes a bounded batch of expired attempts,
+    skipping attempts locked by logins, reduces the count of each user
+    by their removed attempts within the same statement and returns
+    the amount of deleted attempts, including those without a user.
+
+    return (None):
+    '''
+
+    sql = compile_sql(sweep_statement(50, 1000.0))
+
+    assert sql.startswith('WITH expired_attempts AS (DELETE FROM user_login_attempts '
+        'WHERE user_login_attempts.id IN (SELECT user_login_attempts.id FROM user_login_attempts '
+        'WHERE user_login_attempts.expires < 1000.0 ORDER BY user_login_attempts.id '
+        'LIMIT 50 FOR UPDATE SKIP LOCKED) RETURNING user_login_attempts.user_id)')
+    assert ('removed_attempts AS (SELECT expired_attempts.user_id AS user_id, count(*) AS removed '
+        'FROM expired_attempts GROUP BY expired_attempts.user_id)') in sql
+    assert ('updated_users AS (UPDATE "user" SET failed_login_attempts=("user".failed_login_attempts - removed_attempts.removed) '
+        'FROM removed_attempts WHERE "user".id = removed_attempts.user_id)') in sql
+    assert sql.endswith('SELECT count(*) AS count_1 FROM expired_attempts')
+
+
+class RecordingResult():
+    '''
+    The result of a recorded statement.
+    '''
+
+    def __init__(cls: Self, row: tuple) -> None:
+        cls.row = row
+
+
+    def one(cls: Self) -> tuple:
+        return cls.row
+
+
+    def scalar_one(cls: Self):
+        return cls.row[0]
+
+
+class RecordingSession():
+    '''
+    A session recording the statements executed, answering them in order.
+    '''
+
+    def __init__(cls: Self, rows: list) -> None:
+        cls.rows = list(rows)
+        cls.statements = []
+        cls.commits = 0
+
+
+    def execute(cls: Self, statement) -> RecordingResult:
+        cls.statements.append(compile_sql(statement))
+        return RecordingResult(cls.rows.pop(0))
+
+
+    def commit(cls: Self) -> None:
+        cls.commits += 1
+
+
+def test_get_failed_attempts_reduces_count_in_database() -> None:
+    '''
+    This test checks expired attempts reduce the stored count with a relative
+    update, and the loaded user takes the returned count without being changed.
+
+    return (None):
+    '''
+
+    user = User(id=7, failed_login_attempts=5)
+    session = RecordingSession([(5, 2), (1,)])
+
+    assert get_failed_attempts(session, user) == 3
+
+    assert session.statements[1] == ('UPDATE "user" '
+        'SET failed_login_attempts=("user".failed_login_attempts + -2) '
+        'WHERE "user".id = 7 RETURNING "user".failed_login_attempts')
+    assert session.commits == 1
+
+    # The count returned by the database is kept, including changes made by the sweeper
+    assert user.failed_login_attempts == 1
+
+
+def test_get_failed_attempts_without_expired() -> None:
+    '''
+    This test checks the user is not updated when no attempts have expired.
+
+    return (None):
+    '''
+
+    user = User(id=7, failed_login_attempts=2)
+    session = RecordingSession([(2, 0)])
+
+    assert get_failed_attempts(session, user) == 2
+    assert len(session.statements) == 1
+    assert session.commits == 0
+
+
+def test_migrations_match_models() -> None:
+    '''
+    This test checks migrations are numbered in order and every index
+    they build is also declared in models.py, so databases created
+    by create_all match databases brought up to date by the migrations.
+
+    return (None):
+    '''
+
+    declared_indexes = { index.name for table in Base.metadata.tables.values() for index in table.indexes }
+
+    assert [migration.version for migration in MIGRATIONS] == list(range(1, len(MIGRATIONS) + 1))
+
+    for migration in MIGRATIONS:
+        if migration.index_name is not None:
+            assert migration.index_name in declared_indexes
+            assert any(migration.index_name in statement for statement in migration.statements)
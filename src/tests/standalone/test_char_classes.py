@@ -0,0 +1,140 @@
+'''
+This file contains all the tests for the single pass character class scanner
+'''
+
+import random
+import string
+import pytest
+
+from src.backend_services.common.utils.data_verification import (
+    DataVerification,
+    classify_characters,
+    CHAR_LOWER_CASE,
+    CHAR_UPPER_CASE,
+    CHAR_NUMBER,
+    CHAR_SYMBOL
+)
+
+
+MAX_LENGTH = 96
+
+UNICODE_CHARS = 'éÉßÆæ٣①ǅ€ 🙂'
+
+RESTRICTIONS = {
+    'min_len': 1,
+    'max_len': MAX_LENGTH,
+    'lower_case': 'MUST',
+    'upper_case': 'MUST',
+    'numbers': 'MUST',
+    'symbols': 'NONE'
+}
+
+
+def reference_classes(data: str) -> int:
+    '''
+    Finds the character classes of the string with a separate scan per class.
+
+    data (str): the string to classify
+
+    return (int): the CHAR_* flags found within the string
+    '''
+
+    char_classes = 0
+
+    if any(char.islower() for char in data):
+        char_classes |= CHAR_LOWER_CASE
+
+    if any(char.isupper() for char in data):
+        char_classes |= CHAR_UPPER_CASE
+
+    if any(char.isdigit() for char in data):
+        char_classes |= CHAR_NUMBER
+
+    if any(not char.isalnum() for char in data):
+        char_classes |= CHAR_SYMBOL
+
+    return char_classes
+
+
+def random_strings(alphabet: str, amount: int) -> list:
+    '''
+    Creates random strings of up to the maximum length.
+
+    alphabet (str): the characters to pick from
+    amount (int): the amount of strings to create
+
+    return (list): the created strings
+    '''
+
+    generator = random.Random(amount)
+
+    return [
+        ''.join(generator.choices(alphabet, k=generator.randint(0, MAX_LENGTH)))
+        for _ in range(amount)
+    ]
+
+
+@pytest.mark.parametrize("alphabet", [
+    string.printable,
+    string.ascii_lowercase,
+    string.printable + UNICODE_CHARS,
+    UNICODE_CHARS
+])
+def test_classify_characters_matches_reference(alphabet: str) -> None:
+    '''
+    This test checks the single pass scanner finds the same
+    classes as scanning the string once per class.
+
+    alphabet (str): the characters the tested strings are made from
+
+    return (None):
+    '''
+
+    for data in random_strings(alphabet, 500):
+        assert classify_characters(data) == reference_classes(data), data
+
+
+@pytest.mark.parametrize("data", [
+    'Password1',
+    'password1',
+    'PASSWORD!',
+    'Pass word1',
+    'Pässwörd1',
+    '12345',
+])
+def test_check_string_data_matches_per_class_scan(data: str) -> None:
+    '''
+    This test checks the string errors are unchanged from
+    validating each character requirement separately.
+
+    data (str): the string to validate
+
+    return (None):
+    '''
+
+    verifier = DataVerification()
+    _, _, parsed = verifier.parse_string_restrictions('password', RESTRICTIONS)
+
+    expected_errors = verifier.validate_char_requirement(data, str.islower, parsed.lower_case, 'password', 'lower_case', [])
+    expected_errors = verifier.validate_char_requirement(data, str.isupper, parsed.upper_case, 'password', 'upper_case', expected_errors)
+    expected_errors = verifier.validate_char_requirement(data, str.isdigit, parsed.numbers, 'password', 'number', expected_errors)
+    expected_errors = verifier.validate_char_requirement(data, lambda c: not c.isalnum(), parsed.symbols, 'password', 'symbol', expected_errors)
+
+    assert verifier.check_string_data('password', data, parsed=parsed) == (len(expected_errors) == 0, expected_errors)
+
+
+def test_classify_characters_max_length() -> None:
+    '''
+    This test checks the single pass scanner matches scanning once per class
+    on maximum length strings, including the worst case for the per class scan.
+    Timings of both scanners are in benchmarks/bench_char_classes.py.
+
+    return (None):
+    '''
+
+    worst_case = 'a' * MAX_LENGTH
+    mixed = (string.ascii_letters + string.digits + string.punctuation + '  ')[:MAX_LENGTH]
+
+    for data in (worst_case, mixed):
+        assert len(data) == MAX_LENGTH
+        assert classify_characters(data) == reference_classes(data)
@@ -0,0 +1,147 @@
+'''
+This file contains all the tests for the email domain cache
+'''
+
+import asyncio
+import pytest
+
+from src.backend_services.common.utils import domain_cache, ttl_cache
+from src.backend_services.common.utils.data_verification import DataVerification
+from src.backend_services.common.utils.domain_cache import DomainCache, DomainStatus
+
+
+VERIFY_CLASS = DataVerification()
+
+
+@pytest.fixture
+def lookups(monkeypatch: pytest.MonkeyPatch) -> dict:
+    '''
+    Replaces the resolver with a fixed set of domains and
+    records how many times each domain is looked up.
+
+    monkeypatch (MonkeyPatch): the pytest monkeypatch fixture
+
+    return (dict): the amount of lookups made per domain
+    '''
+
+    results = {
+        'example.com': (DomainStatus.VALID, 300),
+        'missing.invalid': (DomainStatus.NXDOMAIN, 300),
+        'nomx.example': (DomainStatus.NO_ANSWER, 300),
+        'slow.example': (DomainStatus.UNKNOWN, 0)
+    }
+    counts = {}
+
+    def resolve(domain: str):
+        counts[domain] = counts.get(domain, 0) + 1
+        return results[domain]
+
+    async def async_resolve(domain: str):
+        return resolve(domain)
+
+    monkeypatch.setattr(domain_cache, 'domain_cache', DomainCache(max_size=10))
+    monkeypatch.setattr(domain_cache, 'resolve_mx', resolve)
+    monkeypatch.setattr(domain_cache, 'async_resolve_mx', async_resolve)
+
+    return counts
+
+
+@pytest.mark.parametrize("email, expected_result", [
+    ('user@example.com', (True, [])),
+    ('user@EXAMPLE.com.', (True, [])),
+    ('user@missing.invalid', (False, ['Testing has an invalid domain'])),
+    ('user@nomx.example', (False, ['Testing was unable to be verified'])),
+    ('user@slow.example', (False, ['Testing was unable to be verified'])),
+    ('user.example.com', (False, ['Testing is invalid. Email must only contain one @']))
+])
+def test_verify_email_data(lookups: dict, email: str, expected_result: tuple) -> None:
+    '''
+    This test checks each domain status is converted to the expected errors,
+    using both the blocking and asyncio lookups.
+
+    lookups (dict): the amount of lookups made per domain
+    email (str): the email to verify
+    expected_result (tuple): the expected output from the function
+
+    return (None):
+    '''
+
+    assert VERIFY_CLASS.verify_email_data('Testing', email) == expected_result
+    assert asyncio.run(VERIFY_CLASS.async_verify_email_data('Testing', email)) == expected_result
+
+
+def test_lookups_are_cached(lookups: dict) -> None:
+    '''
+    This test checks valid and invalid domains are only looked up once,
+    while failed lookups are retried.
+
+    lookups (dict): the amount of lookups made per domain
+
+    return (None):
+    '''
+
+    for _ in range(3):
+        for domain in ['example.com', 'Example.COM', 'missing.invalid', 'nomx.example', 'slow.example']:
+            domain_cache.check_email_domain(domain)
+
+    assert lookups == { 'example.com': 1, 'missing.invalid': 1, 'nomx.example': 1, 'slow.example': 3 }
+
+
+def test_cache_expiry_and_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    '''
+    This test checks entries expire after their time to live
+    and the least recently used entry is removed when full.
+
+    monkeypatch (MonkeyPatch): the pytest monkeypatch fixture
+
+    return (None):
+    '''
+
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, 'monotonic', lambda: now[0])
+
+    cache = DomainCache(max_size=2)
+    cache.set('a.com', DomainStatus.VALID, 10)
+    cache.set('b.com', DomainStatus.VALID, 100)
+
+    assert cache.get('a.com') == DomainStatus.VALID
+
+    cache.set('c.com', DomainStatus.NXDOMAIN, 100)
+
+    assert cache.get('b.com') is None
+    assert cache.get('c.com') == DomainStatus.NXDOMAIN
+
+    now[0] += 11
+
+    assert cache.get('a.com') is None
+    assert cache.stats()['size'] == 1
+
+
+def test_ttl_is_clamped() -> None:
+    '''
+    This test checks the record time to live is kept within the configured bounds.
+
+    return (None):
+    '''
+
+    assert domain_cache.clamp_ttl(0) == domain_cache.DNS_CACHE_MIN_TTL
+    assert domain_cache.clamp_ttl(10 ** 9) == domain_cache.DNS_CACHE_MAX_TTL
+
+
+def test_preload_domains(lookups: dict) -> None:
+    '''
+    This test checks preloaded domains are served from the cache afterwards.
+
+    lookups (dict): the amount of lookups made per domain
+
+    return (None):
+    '''
+
+    assert domain_cache.preload_domains(['example.com', 'missing.invalid']) == {
+        'example.com': DomainStatus.VALID,
+        'missing.invalid': DomainStatus.NXDOMAIN
+    }
+
+    domain_cache.check_email_domain('example.com')
+
+    assert lookups == { 'example.com': 1, 'missing.invalid': 1 }
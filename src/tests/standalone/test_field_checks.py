@@ -0,0 +1,225 @@
+'''
+This file contains all the tests for running the field checks of a request concurrently
+'''
+
+import asyncio
+import pytest
+import threading
+
+from src.backend_services.common.utils import domain_cache
+from src.backend_services.common.utils.domain_cache import DomainCache, DomainStatus
+from src.backend_services.common.utils.field_checks import async_run_checks, run_checks
+from src.backend_services.common.utils.schema_compiler import compile_schema
+
+
+def meeting_check(barrier: threading.Barrier, result: tuple=(True, [])):
+    '''
+    Creates a check that only returns once every check sharing
+    the barrier is running at the same time.
+
+    barrier (Barrier): the barrier shared by the concurrent checks
+    result (tuple): the result of the check [default - (True, [])]
+
+    return (Callable): the check
+    '''
+
+    def check() -> tuple:
+        barrier.wait()
+        return result
+
+    return check
+
+
+def test_io_bound_checks_run_concurrently() -> None:
+    '''
+    This test checks io bound checks are ran at the same time
+    and the results are returned in the order of the checks.
+    The checks wait on each other, so they would time out if ran one by one.
+
+    return (None):
+    '''
+
+    barrier = threading.Barrier(3, timeout=5)
+
+    checks = [
+        ('first', True, meeting_check(barrier, (True, []))),
+        ('second', False, lambda: (False, ['second is invalid'])),
+        ('third', True, meeting_check(barrier, (False, ['third is invalid']))),
+        ('fourth', True, meeting_check(barrier, (True, [])))
+    ]
+
+    results = run_checks(checks, deadline=10)
+
+    assert results == [(True, []), (False, ['second is invalid']), (False, ['third is invalid']), (True, [])]
+
+
+def test_single_io_bound_check_past_deadline_fails() -> None:
+    '''
+    This test checks a lone io bound check is bound by the deadline too.
+
+    return (None):
+    '''
+
+    release = threading.Event()
+
+    def slow_check() -> tuple:
+        release.wait(timeout=5)
+        return True, []
+
+    try:
+        results = run_checks([
+            ('slow', True, slow_check),
+            ('other', False, lambda: (True, []))
+        ], deadline=0.1)
+
+    finally:
+        release.set()
+
+    assert results == [(False, ['slow was unable to be verified in time']), (True, [])]
+
+
+def test_failing_check_is_reported() -> None:
+    '''
+    This test checks an io bound check raising an error is
+    reported as failed without failing the other checks.
+
+    return (None):
+    '''
+
+    def failing_check() -> tuple:
+        raise OSError('lookup failed')
+
+    results = run_checks([
+        ('failing', True, failing_check),
+        ('other', True, lambda: (True, []))
+    ], deadline=5)
+
+    assert results == [(False, ['failing was unable to be verified']), (True, [])]
+
+
+def test_checks_past_deadline_fail() -> None:
+    '''
+    This test checks io bound checks still running at the
+    deadline are reported as errors without being waited on.
+    The slow check is only released once the results are returned,
+    had it been waited on it would have passed once its wait ran out.
+
+    return (None):
+    '''
+
+    release = threading.Event()
+
+    def slow_check() -> tuple:
+        release.wait(timeout=5)
+        return True, []
+
+    try:
+        results = run_checks([
+            ('fast', True, lambda: (True, [])),
+            ('slow', True, slow_check)
+        ], deadline=0.1)
+
+    finally:
+        release.set()
+
+    assert results == [(True, []), (False, ['slow was unable to be verified in time'])]
+
+
+def test_async_checks_past_deadline_fail() -> None:
+    '''
+    This test checks async checks run concurrently and those
+    still running at the deadline are cancelled and reported.
+
+    return (None):
+    '''
+
+    async def run() -> tuple:
+        started = []
+        release = asyncio.Event()
+
+        def waiting_check(name: str, result: tuple):
+            async def check() -> tuple:
+                started.append(name)
+                await release.wait()
+                return result
+
+            return check
+
+        async def releasing_check() -> tuple:
+            # Every check has started before any completes, so they are running at the same time
+            while len(started) < 2:
+                await asyncio.sleep(0)
+
+            release.set()
+            return True, []
+
+        async def slow_check() -> tuple:
+            await asyncio.Event().wait()
+
+        results = await async_run_checks([
+            ('first', waiting_check('first', (True, []))),
+            ('second', waiting_check('second', (False, ['second is invalid']))),
+            ('release', releasing_check),
+            ('slow', slow_check)
+        ], deadline=0.2)
+
+        return started, results
+
+    started, results = asyncio.run(run())
+
+    assert started == ['first', 'second']
+    assert results == [
+        (True, []),
+        (False, ['second is invalid']),
+        (True, []),
+        (False, ['slow was unable to be verified in time'])
+    ]
+
+
+def test_failing_async_check_is_reported() -> None:
+    '''
+    This test checks an async check raising an error is
+    reported as failed without failing the other checks.
+
+    return (None):
+    '''
+
+    async def failing_check() -> tuple:
+        raise OSError('lookup failed')
+
+    async def passing_check() -> tuple:
+        return True, []
+
+    results = asyncio.run(async_run_checks([
+        ('failing', failing_check),
+        ('other', passing_check)
+    ], deadline=5))
+
+    assert results == [(False, ['failing was unable to be verified']), (True, [])]
+
+
+def test_email_lookups_run_concurrently(monkeypatch: pytest.MonkeyPatch) -> None:
+    '''
+    This test checks the domains of two emails within
+    one request are looked up at the same time.
+    The lookups wait on each other, so they would time out if made one by one.
+
+    monkeypatch (MonkeyPatch): the pytest monkeypatch fixture
+
+    return (None):
+    '''
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    def resolve(domain: str):
+        barrier.wait()
+        return DomainStatus.VALID, 300
+
+    monkeypatch.setattr(domain_cache, 'domain_cache', DomainCache(max_size=10))
+    monkeypatch.setattr(domain_cache, 'resolve_mx', resolve)
+
+    compiled = compile_schema({ 'current_email': { 'type': 'email' }, 'new_email': { 'type': 'email' } })
+
+    result = compiled.validate({ 'current_email': 'user@first.example', 'new_email': 'user@second.example' })
+
+    assert result == (True, [])
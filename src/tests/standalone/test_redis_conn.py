@@ -0,0 +1,185 @@
+'''
+This file contains the tests for handing out the shared redis connection
+'''
+
+import asyncio
+import pytest
+import redis
+import redis.asyncio as async_redis
+import socket
+
+from src.backend_services.common.redis import async_redis as async_redis_conn, redis as redis_conn
+
+
+def unused_port() -> int:
+    '''
+    Finds a local port with nothing listening on it.
+
+    return (int): the port number
+    '''
+
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def unreachable_pool(monkeypatch: pytest.MonkeyPatch):
+    '''
+    Points the shared pool at a local port with no redis server.
+
+    monkeypatch (MonkeyPatch): the pytest monkeypatch fixture
+
+    yield (None):
+    '''
+
+    port = unused_port()
+
+    monkeypatch.setattr(redis_conn, 'create_redis_pool', lambda: redis.BlockingConnectionPool(
+        host='127.0.0.1',
+        port=port,
+        timeout=0.1,
+        socket_timeout=0.1,
+        socket_connect_timeout=0.1
+    ))
+
+    redis_conn.close_redis_pool()
+
+    yield
+
+    redis_conn.close_redis_pool()
+
+
+def test_unreachable_server_fails(unreachable_pool) -> None:
+    '''
+    This test checks an unreachable server returns a failed success flag.
+
+    unreachable_pool (None): the fixture pointing the pool at no server
+
+    return (None):
+    '''
+
+    assert redis_conn.get_redis_conn() == (False, 'Unable To Connect To Redis Server', None)
+
+
+def test_failed_command_rechecks_server(unreachable_pool, monkeypatch: pytest.MonkeyPatch) -> None:
+    '''
+    This test checks the client is handed out without pinging while healthy,
+    and once a command fails to reach the server the next caller is told.
+
+    unreachable_pool (None): the fixture pointing the pool at no server
+    monkeypatch (MonkeyPatch): the pytest monkeypatch fixture
+
+    return (None):
+    '''
+
+    pings = []
+    ping = redis_conn.SharedRedis.ping
+
+    monkeypatch.setattr(redis_conn.SharedRedis, 'ping', lambda cls: pings.append(True) or True)
+
+    success, _, redis_client = redis_conn.get_redis_conn()
+    assert success
+    assert redis_conn.get_redis_conn() == (True, 'Connected Successfully', redis_client)
+    assert len(pings) == 1
+
+    monkeypatch.setattr(redis_conn.SharedRedis, 'ping', ping)
+
+    with pytest.raises(redis.exceptions.ConnectionError):
+        redis_client.get('key')
+
+    assert redis_conn.get_redis_conn() == (False, 'Unable To Connect To Redis Server', None)
+
+
+class IdleConnection(redis.Connection):
+    '''
+    A connection that is never opened, only borrowed from and returned to the pool.
+    '''
+
+    def connect(cls) -> None:
+        pass
+
+
+    def can_read(cls, timeout: float=0) -> bool:
+        return False
+
+
+def test_pool_stats_count_connections(monkeypatch: pytest.MonkeyPatch) -> None:
+    '''
+    This test checks the pool stats report the connections
+    created, in use and available as they are borrowed and released.
+
+    monkeypatch (MonkeyPatch): the pytest monkeypatch fixture
+
+    return (None):
+    '''
+
+    monkeypatch.setattr(redis_conn, '_pool', None)
+    assert redis_conn.get_redis_pool_stats()['initialised'] is False
+
+    pool = redis.BlockingConnectionPool(connection_class=IdleConnection, max_connections=4, timeout=0.1)
+    monkeypatch.setattr(redis_conn, '_pool', pool)
+
+    first = pool.get_connection()
+    second = pool.get_connection()
+
+    stats = redis_conn.get_redis_pool_stats()
+    assert stats['created_connections'] == 2
+    assert stats['in_use_connections'] == 2
+    assert stats['available_connections'] == 0
+
+    pool.release(first)
+
+    stats = redis_conn.get_redis_pool_stats()
+    assert stats['in_use_connections'] == 1
+    assert stats['available_connections'] == 1
+
+
+class IdleAsyncConnection(async_redis.Connection):
+    '''
+    An asyncio connection that is never opened, only borrowed from and returned to the pool.
+    '''
+
+    async def connect(cls) -> None:
+        pass
+
+
+    def is_connected(cls) -> bool:
+        return True
+
+
+    async def can_read_destructive(cls) -> bool:
+        return False
+
+
+def test_async_pool_stats_count_connections(monkeypatch: pytest.MonkeyPatch) -> None:
+    '''
+    This test checks the asyncio pool stats report the connections
+    created, in use and available as they are borrowed and released.
+
+    monkeypatch (MonkeyPatch): the pytest monkeypatch fixture
+
+    return (None):
+    '''
+
+    pool = async_redis.BlockingConnectionPool(connection_class=IdleAsyncConnection, max_connections=4, timeout=0.1)
+    monkeypatch.setattr(async_redis_conn, '_pool', pool)
+
+    async def borrow() -> list:
+        first = await pool.get_connection()
+        await pool.get_connection()
+
+        in_use = async_redis_conn.get_async_redis_pool_stats()
+
+        await pool.release(first)
+
+        return [in_use, async_redis_conn.get_async_redis_pool_stats()]
+
+    in_use, released = asyncio.run(borrow())
+
+    assert in_use['created_connections'] == 2
+    assert in_use['in_use_connections'] == 2
+    assert in_use['available_connections'] == 0
+
+    assert released['in_use_connections'] == 1
+    assert released['available_connections'] == 1
@@ -0,0 +1,140 @@
+'''
+This file contains all the tests for datetime restrictions relative to today
+'''
+
+import pytest
+
+from datetime import date
+
+from src.backend_services.common.utils import data_verification
+from src.backend_services.common.utils.data_verification import AdaptiveDatetimeRestrictions, DataVerification, \
+    is_relative_date, resolve_relative_date
+from src.backend_services.common.utils.schema_compiler import compile_schema
+
+
+VERIFY_CLASS = DataVerification()
+
+RESTRICTIONS = {
+    'date': {
+        'min': '-110y',
+        'max': '-9y'
+    }
+}
+
+
+@pytest.mark.parametrize("value, today, expected_result", [
+    ('-9y', date(2025, 6, 15), '2016-06-15'),
+    ('-110y', date(2025, 6, 15), '1915-06-15'),
+    ('+1y', date(2024, 2, 29), '2025-02-28'),
+    ('-1m', date(2025, 3, 31), '2025-02-28'),
+    ('-13m', date(2025, 1, 15), '2023-12-15'),
+    ('+2w', date(2025, 12, 25), '2026-01-08'),
+    ('-1d', date(2025, 1, 1), '2024-12-31'),
+    ('30d', date(2025, 1, 1), '2025-01-31')
+])
+def test_resolve_relative_date(value: str, today: date, expected_result: str) -> None:
+    '''
+    This test checks relative dates are converted to the expected date.
+
+    value (str): the relative date
+    today (date): the date the value is relative to
+    expected_result (str): the expected output from the function
+
+    return (None):
+    '''
+
+    assert is_relative_date(value)
+    assert resolve_relative_date(value, today) == expected_result
+
+
+@pytest.mark.parametrize("value", ['2025-01-01', 'ADAPTIVE', '-9', '-9Y', 'y', None, 9])
+def test_is_not_relative_date(value: str) -> None:
+    '''
+    This test checks fixed dates and other values are not relative dates.
+
+    value (str): the date restriction value
+
+    return (None):
+    '''
+
+    assert not is_relative_date(value)
+
+
+@pytest.mark.parametrize("dob, expected_result", [
+    ('2000-01-01', (True, [])),
+    ('2016-06-15', (True, [])),
+    ('2016-06-16', (False, ['date_of_birth datetime out of range'])),
+    ('1915-06-14', (False, ['date_of_birth datetime out of range'])),
+    ('2024-01-01', (False, ['date_of_birth datetime out of range']))
+])
+def test_relative_date_range(dob: str, expected_result: tuple) -> None:
+    '''
+    This test checks dates outside of either relative limit are rejected.
+
+    dob (str): the date of birth to verify
+    expected_result (tuple): the expected output from the function
+
+    return (None):
+    '''
+
+    parsed = VERIFY_CLASS.parse_datetime_restrictions(RESTRICTIONS, date(2025, 6, 15))
+
+    assert VERIFY_CLASS.check_datetime_string('date_of_birth', dob, parsed) == expected_result
+
+
+def test_adaptive_restrictions_refresh_daily(monkeypatch: pytest.MonkeyPatch) -> None:
+    '''
+    This test checks the relative limits are parsed once per day
+    and parsed again once the day changes.
+
+    monkeypatch (MonkeyPatch): the pytest monkeypatch fixture
+
+    return (None):
+    '''
+
+    today = date(2025, 6, 15)
+    parses = []
+
+    class FixedDate(date):
+        @classmethod
+        def today(cls) -> date:
+            return today
+
+    parse = VERIFY_CLASS.parse_datetime_restrictions
+
+    def counted_parse(restrictions: dict, day: date):
+        parses.append(day)
+        return parse(restrictions, day)
+
+    monkeypatch.setattr(data_verification, 'date', FixedDate)
+    monkeypatch.setattr(VERIFY_CLASS, 'parse_datetime_restrictions', counted_parse)
+
+    adaptive = AdaptiveDatetimeRestrictions(VERIFY_CLASS, RESTRICTIONS)
+
+    for _ in range(100):
+        assert VERIFY_CLASS.check_adaptive_datetime_string('dob', '2016-06-15', adaptive) == (True, [])
+
+    assert parses == [today]
+
+    today = date(2025, 6, 16)
+
+    assert VERIFY_CLASS.check_adaptive_datetime_string('dob', '2016-06-15', adaptive) == (True, [])
+    assert VERIFY_CLASS.check_adaptive_datetime_string('dob', '2016-06-17', adaptive) == (False, ['dob datetime out of range'])
+    assert parses == [date(2025, 6, 15), date(2025, 6, 16)]
+
+
+def test_compiled_schema_uses_relative_dates() -> None:
+    '''
+    This test checks a schema with relative dates compiles
+    and matches validating through verify_datetime_string.
+
+    return (None):
+    '''
+
+    compiled = compile_schema({ 'dob': { 'type': 'datetime', 'restrictions': RESTRICTIONS } })
+
+    for dob in ['2000-01-01', '1800-01-01', date.today().strftime("%Y-%m-%d")]:
+        assert compiled.validate({ 'dob': dob }) == VERIFY_CLASS.verify_datetime_string('dob', dob, RESTRICTIONS)
+
+    with pytest.raises(ValueError):
+        compile_schema({ 'dob': { 'type': 'datetime', 'restrictions': { 'date': { 'min': '-9 years' } } } })
@@ -0,0 +1,83 @@
+'''
+This file contains all the tests for validating requests against shared schemas
+'''
+
+import copy
+
+from concurrent.futures import ThreadPoolExecutor
+
+from src.backend_services.common.utils.data_verification import DataVerification
+from src.backend_services.common.utils.schema import get_verification_schema
+from src.backend_services.common.utils.schema_compiler import compile_schema
+
+
+CONFIG = {
+    'name': {
+        'type': 'str',
+        'restrictions': {
+            'min_len': 2,
+            'max_len': 8,
+            'numbers': 'NONE'
+        }
+    },
+    'age': {
+        'type': 'int',
+        'restrictions': {
+            'min_num': 18,
+            'max_num': 130
+        }
+    }
+}
+
+REQUESTS = [
+    ({ 'name': 'Alice', 'age': 30 }, (True, [])),
+    ({ 'name': 'B0b', 'age': 12 }, (False, [
+        'name must not contain number',
+        'age integer 12 is too small. Minimum expected number is 18'
+    ])),
+    ({ 'name': 'Carol' }, (True, [])),
+    ({ 'age': 200 }, (False, ['age integer 200 is too large. Maximum expected number is 130']))
+]
+
+
+def test_get_verification_schema_leaves_config_unchanged() -> None:
+    '''
+    This test checks the shared config is not modified
+    when validating a request through verify_data.
+
+    return (None):
+    '''
+
+    config = copy.deepcopy(CONFIG)
+
+    for data, expected_result in REQUESTS:
+        success, _, schema = get_verification_schema(config, data)
+
+        assert success
+        assert DataVerification().verify_data(schema) == expected_result
+
+    assert config == CONFIG
+
+
+def test_concurrent_validation_of_shared_schema() -> None:
+    '''
+    This test checks requests validated at the same time against
+    the same config and compiled schema receive their own results.
+
+    return (None):
+    '''
+
+    config = copy.deepcopy(CONFIG)
+    compiled = compile_schema(config)
+
+    def validate(index: int) -> bool:
+        data, expected_result = REQUESTS[index % len(REQUESTS)]
+        _, _, schema = get_verification_schema(config, data)
+
+        return DataVerification().verify_data(schema) == compiled.validate(data) == expected_result
+
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(validate, range(2000)))
+
+    assert all(results)
+    assert config == CONFIG
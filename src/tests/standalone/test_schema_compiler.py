@@ -0,0 +1,203 @@
+'''
+This file contains all the tests for the compiled verification schemas
+'''
+
+import copy
+import pytest
+
+from src.backend_services.common.utils import domain_cache
+from src.backend_services.common.utils.data_verification import DataVerification
+from src.backend_services.common.utils.domain_cache import DomainCache, DomainStatus
+from src.backend_services.common.utils.schema import get_verification_schema
+from src.backend_services.common.utils.schema_compiler import compile_schema, verify_many
+
+
+CONFIG = {
+    'uuid': {
+        'type': 'str_uuid'
+    },
+    'name': {
+        'type': 'str',
+        'skip_empty': True,
+        'restrictions': {
+            'min_len': 2,
+            'max_len': 8,
+            'upper_case': 'MUST',
+            'numbers': 'NONE'
+        }
+    },
+    'code': {
+        'type': 'str',
+        'optional': True,
+        'restrictions': {
+            'min_len': 6,
+            'max_len': 6,
+            'numbers': 'MUST'
+        }
+    },
+    'amount': {
+        'type': 'float',
+        'restrictions': {
+            'min_num': 1,
+            'max_num': 10
+        }
+    },
+    'date': {
+        'type': 'datetime',
+        'restrictions': {
+            'date': {
+                'min': '2000-01-01',
+                'max': '2020-01-01'
+            }
+        }
+    }
+}
+
+
+@pytest.mark.parametrize("data", [
+    { 'uuid': 'b5a0e6a2-4c1b-4f5e-9a3d-2f1e0c9b8a7d', 'name': 'Abc', 'code': '123456', 'amount': 5, 'date': '2010-05-05' },
+    { 'uuid': 'not-a-uuid', 'name': 'abc1', 'code': 'abc', 'amount': 50, 'date': '05/05/2010' },
+    { 'uuid': 'b5a0e6a2-4c1b-4f5e-9a3d-2f1e0c9b8a7d', 'name': '', 'code': 'abcdef' },
+    { 'name': 'Abcdefghijk', 'amount': 'many' },
+    {}
+])
+def test_compiled_schema_matches_verify_data(data: dict) -> None:
+    '''
+    This test checks the compiled schema returns the same
+    result as the verify_data path for the same request.
+
+    data (dict): the request data to validate
+
+    return (None):
+    '''
+
+    _, _, schema = get_verification_schema(copy.deepcopy(CONFIG), data)
+
+    assert compile_schema(CONFIG).validate(data) == DataVerification().verify_data(schema)
+
+
+def test_compiled_schema_is_immutable() -> None:
+    '''
+    This test checks the compiled schema can not be modified.
+
+    return (None):
+    '''
+
+    compiled = compile_schema(CONFIG)
+
+    with pytest.raises(AttributeError):
+        compiled.fields = ()
+
+    with pytest.raises(AttributeError):
+        compiled.fields[0].name = 'changed'
+
+
+def test_invalid_restrictions_fail_to_compile() -> None:
+    '''
+    This test checks incorrectly formatted restrictions
+    are found when compiling rather than per request.
+
+    return (None):
+    '''
+
+    with pytest.raises(ValueError):
+        compile_schema({ 'name': { 'type': 'str', 'restrictions': { 'min_len': 8, 'max_len': 2 } } })
+
+    with pytest.raises(ValueError):
+        compile_schema({ 'name': { 'type': 'str', 'restrictions': { 'symbols': 'SOMETIMES' } } })
+
+    with pytest.raises(ValueError):
+        compile_schema(None)
+
+
+EMAIL_CONFIG = {
+    'email': {
+        'type': 'email'
+    },
+    'name': {
+        'type': 'str',
+        'restrictions': {
+            'min_len': 2,
+            'max_len': 8
+        }
+    }
+}
+
+
+@pytest.fixture
+def lookups(monkeypatch: pytest.MonkeyPatch) -> dict:
+    '''
+    Replaces the resolver with a fixed set of domains and
+    records how many times each domain is looked up.
+
+    monkeypatch (MonkeyPatch): the pytest monkeypatch fixture
+
+    return (dict): the amount of lookups made per domain
+    '''
+
+    results = {
+        'example.com': (DomainStatus.VALID, 300),
+        'missing.invalid': (DomainStatus.NXDOMAIN, 300),
+        'slow.example': (DomainStatus.UNKNOWN, 0)
+    }
+    counts = {}
+
+    def resolve(domain: str):
+        counts[domain] = counts.get(domain, 0) + 1
+        return results[domain]
+
+    monkeypatch.setattr(domain_cache, 'domain_cache', DomainCache(max_size=10))
+    monkeypatch.setattr(domain_cache, 'resolve_mx', resolve)
+
+    return counts
+
+
+def test_verify_many_matches_validate(lookups: dict) -> None:
+    '''
+    This test checks each record of a batch receives the same
+    result as validating the record on its own, and that every
+    domain is looked up once, including lookups that are not cached.
+
+    lookups (dict): the amount of lookups made per domain
+
+    return (None):
+    '''
+
+    payloads = [
+        { 'email': f'user{index}@{domain}', 'name': name }
+        for index, (domain, name) in enumerate([
+            ('example.com', 'Alice'),
+            ('EXAMPLE.com', 'B'),
+            ('missing.invalid', 'Carol'),
+            ('slow.example', 'Dan'),
+            ('slow.example', 'Erin')
+        ] * 20)
+    ]
+    payloads.append({ 'email': 'not-an-email', 'name': 'Frank' })
+    payloads.append({ 'name': 'Grace' })
+
+    success, results = verify_many(EMAIL_CONFIG, payloads)
+
+    assert lookups == { 'example.com': 1, 'missing.invalid': 1, 'slow.example': 1 }
+
+    compiled = compile_schema(EMAIL_CONFIG)
+
+    assert not success
+    assert results == [compiled.validate(data) for data in payloads]
+    assert results[0] == (True, [])
+    assert results[-1] == (True, [])
+
+
+def test_verify_many_accepts_compiled_schema(lookups: dict) -> None:
+    '''
+    This test checks a compiled schema can be reused between batches.
+
+    lookups (dict): the amount of lookups made per domain
+
+    return (None):
+    '''
+
+    compiled = compile_schema(EMAIL_CONFIG)
+
+    assert verify_many(compiled, [{ 'email': 'a@example.com', 'name': 'Alice' }] * 3) == (True, [(True, [])] * 3)
+    assert verify_many(compiled, []) == (True, [])
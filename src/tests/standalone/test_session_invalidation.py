@@ -0,0 +1,118 @@
+'''
+This file contains the tests for the gateways session invalidation listener
+'''
+
+import asyncio
+import pytest
+
+from typing import Self
+
+from src.backend_services.user_api_gateway.v1.utils import session_cache
+from src.backend_services.user_api_gateway.v1.utils.session_cache import SessionCache
+
+
+class CountingSessionCache(SessionCache):
+    '''
+    A session cache recording how often it was cleared.
+    '''
+
+    def __init__(cls: Self) -> None:
+        super().__init__(max_size=10, ttl=60)
+        cls.clears = 0
+
+
+    def clear(cls: Self) -> None:
+        cls.clears += 1
+        super().clear()
+
+
+class QuietPubSub():
+    '''
+    A subscription that delivers the given messages then stays quiet,
+    as a channel without invalidations does.
+    '''
+
+    def __init__(cls: Self, messages: list) -> None:
+        cls.messages = list(messages)
+        cls.polls = 0
+
+
+    async def __aenter__(cls: Self) -> Self:
+        return cls
+
+
+    async def __aexit__(cls: Self, *args) -> None:
+        pass
+
+
+    async def subscribe(cls: Self, channel: str) -> None:
+        pass
+
+
+    async def get_message(cls: Self, ignore_subscribe_messages: bool=False, timeout: float=0.0):
+        cls.polls += 1
+
+        if len(cls.messages) != 0:
+            return cls.messages.pop(0)
+
+        await asyncio.sleep(timeout)
+        return None
+
+
+class QuietRedis():
+    '''
+    A redis client handing out the quiet subscription.
+    '''
+
+    def __init__(cls: Self, pubsub: QuietPubSub) -> None:
+        cls.subscription = pubsub
+
+
+    def pubsub(cls: Self, ignore_subscribe_messages: bool=False) -> QuietPubSub:
+        return cls.subscription
+
+
+def test_quiet_channel_keeps_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    '''
+    This test checks polling a channel without invalidations neither
+    clears the cache nor resubscribes, while invalidations still
+    remove only the named session.
+
+    monkeypatch (MonkeyPatch): the pytest monkeypatch fixture
+
+    return (None):
+    '''
+
+    cache = CountingSessionCache()
+    pubsub = QuietPubSub([{ 'type': 'message', 'data': b'session-1:user-1' }])
+    redis_client = QuietRedis(pubsub)
+
+    async def get_async_redis_conn():
+        return True, 'Connected Successfully', redis_client
+
+    monkeypatch.setattr(session_cache, 'session_cache', cache)
+    monkeypatch.setattr(session_cache, 'get_async_redis_conn', get_async_redis_conn)
+    monkeypatch.setattr(session_cache, 'INVALIDATION_POLL_SECONDS', 0.01)
+
+    async def listen() -> None:
+        listener = asyncio.create_task(session_cache.listen_for_invalidations())
+
+        while pubsub.polls < 2:
+            await asyncio.sleep(0)
+
+        cache.set(('session-2', 'user-2'), ({}, True))
+
+        while pubsub.polls < 10:
+            await asyncio.sleep(0.01)
+
+        listener.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await listener
+
+    cache.set(('session-1', 'user-1'), ({}, True))
+    asyncio.run(listen())
+
+    assert cache.clears == 1
+    assert cache.get(('session-1', 'user-1')) is None
+    assert cache.get(('session-2', 'user-2')) == ({}, True)
@@ -0,0 +1,91 @@
+'''
+This file contains all the tests for the shared ttl cache
+'''
+
+import pytest
+
+from src.backend_services.common.utils import ttl_cache
+from src.backend_services.common.utils.ttl_cache import TTLCache
+from src.backend_services.user_api_gateway.v1.utils.session_cache import SessionCache
+
+
+@pytest.fixture
+def now(monkeypatch: pytest.MonkeyPatch) -> list:
+    '''
+    Replaces the clock of the cache with a clock moved by the test.
+
+    monkeypatch (MonkeyPatch): the pytest monkeypatch fixture
+
+    return (list): the current time, changed to move the clock
+    '''
+
+    now = [1000.0]
+    monkeypatch.setattr(ttl_cache.time, 'monotonic', lambda: now[0])
+
+    return now
+
+
+def test_default_and_entry_ttl(now: list) -> None:
+    '''
+    This test checks entries use the ttl of the cache unless given their own,
+    and entries with a ttl of 0 are not cached.
+
+    now (list): the current time of the cache
+
+    return (None):
+    '''
+
+    cache = TTLCache(max_size=10, ttl=5)
+    cache.set('default', 1)
+    cache.set('long', 2, ttl=50)
+    cache.set('never', 3, ttl=0)
+
+    assert cache.get('never') is None
+
+    now[0] += 6
+
+    assert cache.get('default') is None
+    assert cache.get('long') == 2
+    assert cache.stats() == { 'size': 1, 'max_size': 10, 'hits': 1, 'misses': 2 }
+
+
+def test_invalidate_and_clear(now: list) -> None:
+    '''
+    This test checks single entries and the whole cache can be removed.
+
+    now (list): the current time of the cache
+
+    return (None):
+    '''
+
+    cache = TTLCache(max_size=10, ttl=5)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.invalidate('a')
+    cache.invalidate('missing')
+
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+
+    cache.clear()
+
+    assert cache.stats()['size'] == 0
+
+
+def test_session_cache_stats(now: list) -> None:
+    '''
+    This test checks the session cache reports its ttl alongside the shared stats.
+
+    now (list): the current time of the cache
+
+    return (None):
+    '''
+
+    cache = SessionCache(max_size=2, ttl=5)
+    cache.set(('session-1', 'user-1'), ({}, True))
+    cache.set(('session-2', 'user-2'), ({}, False))
+    cache.set(('session-3', 'user-3'), ({}, False))
+
+    assert cache.get(('session-1', 'user-1')) is None
+    assert cache.get(('session-3', 'user-3')) == ({}, False)
+    assert cache.stats() == { 'size': 2, 'max_size': 2, 'hits': 1, 'misses': 1, 'ttl': 5 }
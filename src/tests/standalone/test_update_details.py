@@ -0,0 +1,56 @@
+'''
+This file contains the tests for validating user detail updates
+'''
+
+import pytest
+
+from src.backend_services.account.authentication.settings import UPDATE_DATA_SCHEMA, UserAction_Service
+from src.backend_services.common.proto import user_actions_pb2
+
+
+USER_UUID = 'b5a0e6a2-4c1b-4f5e-9a3d-2f1e0c9b8a7d'
+
+
+@pytest.mark.parametrize("data, expected_result", [
+    ({ 'user_uuid': USER_UUID, 'first_name': 'Alice', 'last_name': '', 'gender': '', 'date_of_birth': '1990-05-05' }, True),
+    ({ 'user_uuid': USER_UUID, 'first_name': '', 'last_name': '', 'gender': '', 'date_of_birth': '' }, True),
+    ({ 'user_uuid': USER_UUID, 'first_name': '', 'last_name': '', 'gender': '', 'date_of_birth': '1800-01-01' }, False),
+    ({ 'user_uuid': USER_UUID, 'first_name': 'alice1', 'last_name': '', 'gender': '', 'date_of_birth': '' }, False),
+    ({ 'user_uuid': 'not-a-uuid', 'first_name': '', 'last_name': '', 'gender': '', 'date_of_birth': '' }, False)
+])
+def test_update_data_schema(data: dict, expected_result: bool) -> None:
+    '''
+    This test checks the details a user can update are validated
+    against the update_data schema.
+
+    data (dict): the request data to validate
+    expected_result (bool): whether the data is valid
+
+    return (None):
+    '''
+
+    success, _ = UPDATE_DATA_SCHEMA.validate(data)
+
+    assert success == expected_result
+
+
+def test_update_details_rejects_date_of_birth() -> None:
+    '''
+    This test checks UpdateUserDetails refuses a date of birth
+    outside of the allowed range before the database is used.
+
+    return (None):
+    '''
+
+    request = user_actions_pb2.UpdateUserDetailsRequest(
+        user_uuid=USER_UUID,
+        first_name='',
+        last_name='',
+        gender='',
+        date_of_birth='1800-01-01'
+    )
+
+    response = UserAction_Service().UpdateUserDetails(request, None)
+
+    assert not response.success
+    assert response.http_status == 400
@@ -0,0 +1,232 @@
+'''
+This file contains all the tests for the registered type validators
+'''
+
+import asyncio
+import copy
+import pytest
+import re
+
+from typing import Any, Tuple
+
+from src.backend_services.common.utils import data_verification
+from src.backend_services.common.utils.data_verification import DataVerification, register_validator
+from src.backend_services.common.utils.schema import get_verification_schema
+from src.backend_services.common.utils.schema_compiler import compile_schema
+
+
+VERIFY_CLASS = DataVerification()
+
+POSTCODE_PATTERN = re.compile(r'^[A-Z]{1,2}[0-9][A-Z0-9]? ?[0-9][A-Z]{2}$')
+
+
+def verify_postcode(verifier: DataVerification, name: str, data: Any, restrictions: dict) -> Tuple[bool, list]:
+    '''
+    Validates a UK postcode.
+
+    verifier (DataVerification): the verification class
+    name (str): the name of the data
+    data (Any): the data to be verified
+    restrictions (dict): the restrictions of the field
+
+    return (bool, list): returns a success flag and a list of errors detected
+    '''
+
+    if type(data) != str or POSTCODE_PATTERN.match(data) is None:
+        return False, [f'{name} is not a valid postcode']
+
+    return True, []
+
+
+async def async_verify_slow(verifier: DataVerification, name: str, data: Any, restrictions: dict) -> Tuple[bool, list]:
+    '''
+    An async validator waiting on io before accepting the data.
+
+    verifier (DataVerification): the verification class
+    name (str): the name of the data
+    data (Any): the data to be verified
+    restrictions (dict): the restrictions of the field
+
+    return (bool, list): returns a success flag and a list of errors detected
+    '''
+
+    await asyncio.sleep(restrictions.get('delay', 0))
+
+    if data != 'ok':
+        return False, [f'{name} is not ok']
+
+    return True, []
+
+
+def verify_slow(verifier: DataVerification, name: str, data: Any, restrictions: dict) -> Tuple[bool, list]:
+    '''
+    The blocking counterpart of async_verify_slow.
+
+    verifier (DataVerification): the verification class
+    name (str): the name of the data
+    data (Any): the data to be verified
+    restrictions (dict): the restrictions of the field
+
+    return (bool, list): returns a success flag and a list of errors detected
+    '''
+
+    return asyncio.run(async_verify_slow(verifier, name, data, restrictions))
+
+
+@pytest.fixture
+def validators(monkeypatch: pytest.MonkeyPatch) -> None:
+    '''
+    Registers the test validators, removing them once the test is complete.
+
+    monkeypatch (MonkeyPatch): the pytest monkeypatch fixture
+
+    return (None):
+    '''
+
+    monkeypatch.setattr(data_verification, 'TYPE_VALIDATORS', dict(data_verification.TYPE_VALIDATORS))
+
+    register_validator('postcode', verify_postcode)
+    register_validator('slow', verify_slow, async_verify=async_verify_slow)
+
+
+CONFIG = {
+    'name': {
+        'type': 'str',
+        'restrictions': {
+            'min_len': 2,
+            'max_len': 8
+        }
+    },
+    'postcode': {
+        'type': 'postcode'
+    },
+    'first_check': {
+        'type': 'slow',
+        'restrictions': {
+            'delay': 0.1
+        }
+    },
+    'second_check': {
+        'type': 'slow',
+        'restrictions': {
+            'delay': 0.1
+        }
+    },
+    'third_check': {
+        'type': 'slow',
+        'optional': True,
+        'restrictions': {
+            'delay': 0.1
+        }
+    }
+}
+
+
+@pytest.mark.parametrize("data, expected_result", [
+    ({ 'name': 'Alice', 'postcode': 'SW1A 1AA', 'first_check': 'ok', 'second_check': 'ok' }, (True, [])),
+    ({ 'name': 'A', 'postcode': 'nowhere', 'first_check': 'ok', 'second_check': 'bad', 'third_check': 'bad' }, (False, [
+        'name string length of 1 is too short. Minimum expected length is 2 characters',
+        'postcode is not a valid postcode',
+        'second_check is not ok',
+        'third_check is not ok'
+    ])),
+    ({ 'name': 'Alice', 'third_check': 'bad' }, (True, ['third_check is not ok']))
+])
+def test_registered_validators(validators: None, data: dict, expected_result: tuple) -> None:
+    '''
+    This test checks registered validators are used by verify_data and
+    compiled schemas, with both the blocking and asyncio paths.
+
+    validators (None): registers the test validators
+    data (dict): the request data to validate
+    expected_result (tuple): the expected output from the function
+
+    return (None):
+    '''
+
+    _, _, schema = get_verification_schema(copy.deepcopy(CONFIG), data)
+    compiled = compile_schema(CONFIG)
+
+    assert VERIFY_CLASS.verify_data(schema) == expected_result
+    assert asyncio.run(VERIFY_CLASS.async_verify_data(schema)) == expected_result
+    assert compiled.validate(data) == expected_result
+    assert asyncio.run(compiled.async_validate(data)) == expected_result
+
+
+def test_async_validators_run_concurrently(validators: None) -> None:
+    '''
+    This test checks the async validators of a request are ran at the same time.
+    Each validator waits until every validator has started, so validators
+    ran one by one would time out and fail.
+
+    validators (None): registers the test validators
+
+    return (None):
+    '''
+
+    config = { name: { 'type': 'meeting' } for name in ('first_check', 'second_check', 'third_check') }
+
+    async def run() -> tuple:
+        started = []
+        all_started = asyncio.Event()
+
+        async def async_verify_meeting(verifier: DataVerification, name: str, data: Any, restrictions: dict) -> Tuple[bool, list]:
+            started.append(name)
+
+            if len(started) == len(config):
+                all_started.set()
+
+            try:
+                await asyncio.wait_for(all_started.wait(), timeout=5)
+
+            except asyncio.TimeoutError:
+                return False, [f'{name} was ran alone']
+
+            return True, []
+
+        register_validator('meeting', verify_slow, async_verify=async_verify_meeting)
+
+        return await compile_schema(config).async_validate({ 'first_check': 'ok', 'second_check': 'ok', 'third_check': 'ok' })
+
+    assert asyncio.run(run()) == (True, [])
+
+
+def test_unknown_types_are_rejected() -> None:
+    '''
+    This test checks types without a registered validator fail
+    instead of being silently accepted.
+
+    return (None):
+    '''
+
+    config = { 'phone': { 'type': 'phone' } }
+    _, _, schema = get_verification_schema(copy.deepcopy(config), { 'phone': '07123456789' })
+
+    assert VERIFY_CLASS.verify_data(schema) == (False, ['phone type phone is not supported'])
+
+    with pytest.raises(ValueError):
+        compile_schema(config)
+
+
+@pytest.mark.parametrize("data_type, data, expected_result", [
+    ('bool', True, (True, [])),
+    ('bool', 'True', (False, ['value type is invalid. Expected bool but received str'])),
+    ('list', [1, 2], (True, [])),
+    ('dict', [], (False, ['value type is invalid. Expected dict but received list']))
+])
+def test_plain_types(data_type: str, data: Any, expected_result: tuple) -> None:
+    '''
+    This test checks types without restrictions only check the type of the data.
+
+    data_type (str): the type given in the schema
+    data (Any): the data to validate
+    expected_result (tuple): the expected output from the function
+
+    return (None):
+    '''
+
+    config = { 'value': { 'type': data_type } }
+    _, _, schema = get_verification_schema(copy.deepcopy(config), { 'value': data })
+
+    assert VERIFY_CLASS.verify_data(schema) == expected_result
+    assert compile_schema(config).validate({ 'value': data }) == expected_result